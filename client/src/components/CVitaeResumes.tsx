@@ -1,7 +1,6 @@
 interface Resume {
   id: number;
   title: string;
-  content: string;
   created_at: string;
 }
 
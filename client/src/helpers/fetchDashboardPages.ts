@@ -0,0 +1,36 @@
+import {API_BASE} from "../utils/api.ts";
+
+export type DashboardSection = "resumes" | "favorites" | "search-terms";
+
+// /dashboard returns the first page of each section and its cursor in nextCursors;
+// this follows the cursor through /dashboard/<section> and returns the rest
+export async function fetchRemainingPages<T>(
+  section: DashboardSection,
+  cursor: string | null | undefined,
+  token: string | null
+): Promise<T[]> {
+  const items: T[] = [];
+  if (!token) {
+    return items;
+  }
+
+  try {
+    while (cursor) {
+      const res = await fetch(`${API_BASE}/dashboard/${section}?cursor=${encodeURIComponent(cursor)}`, {
+        headers: { Authorization: `Bearer ${token}` },
+      });
+
+      if (!res.ok) {
+        console.error(`${section} page fetch failed:`, res.status, res.statusText);
+        break;
+      }
+
+      const page = await res.json();
+      items.push(...(Array.isArray(page.items) ? page.items : []));
+      cursor = page.nextCursor;
+    }
+  } catch (err) {
+    console.error(`Error fetching ${section} pages:`, err);
+  }
+  return items;
+}
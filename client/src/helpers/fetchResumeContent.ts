@@ -0,0 +1,24 @@
+import {API_BASE} from "../utils/api.ts";
+
+export async function fetchResumeContent(id: number | string, token: string | null): Promise<string> {
+  if (!token) {
+    return "";
+  }
+
+  try {
+    const res = await fetch(`${API_BASE}/resumes/${id}`, {
+      headers: { Authorization: `Bearer ${token}` },
+    });
+
+    if (!res.ok) {
+      console.error("resume fetch failed:", res.status, res.statusText);
+      return "";
+    }
+
+    const json = await res.json();
+    return typeof json.content === "string" ? json.content : "";
+  } catch (err) {
+    console.error("Error fetching resume:", err);
+    return "";
+  }
+}
@@ -1,5 +1,7 @@
 import React, { useEffect, useState } from "react";
 import { API_BASE } from "../utils/api";
+import { fetchResumeContent } from "../helpers/fetchResumeContent";
+import { fetchRemainingPages } from "../helpers/fetchDashboardPages";
 
 interface CareerSuggestion {
   role: string;
@@ -14,7 +16,6 @@ interface CareerData {
 interface Resume {
   id: number;
   title: string;
-  content: string;
   created_at: string;
 }
 
@@ -71,6 +72,12 @@ const CareerPath = () => {
 
         setResumes(fetchedResumes);
         setSelectedResumeId(String(fetchedResumes[0].id));
+
+        // Older resumes for the selector, a page at a time
+        const olderResumes = await fetchRemainingPages<Resume>("resumes", dashboardData.nextCursors?.resumes, token);
+        if (olderResumes.length) {
+          setResumes((prev) => [...prev, ...olderResumes]);
+        }
       } catch (err) {
         console.error("Error loading resumes:", err);
       }
@@ -80,13 +87,17 @@ const CareerPath = () => {
   }, []);
 
   useEffect(() => {
+    // Set when the selection changes again, so a slower earlier response is dropped
+    let stale = false;
+
     const fetchCareerData = async () => {
       const userId = localStorage.getItem("userId");
-      const selectedResume = resumes.find((r) => String(r.id) === selectedResumeId);
 
-      if (userId && selectedResume) {
+      if (userId) {
         setLoading(true);
-        const suggestions = await fetchSuggestions(selectedResume.content, userId);
+        const content = await fetchResumeContent(selectedResumeId, localStorage.getItem("token"));
+        const suggestions = content ? await fetchSuggestions(content, userId) : null;
+        if (stale) return;
         setData(suggestions);
         setLoading(false);
       }
@@ -95,7 +106,10 @@ const CareerPath = () => {
     if (selectedResumeId) {
       void fetchCareerData();
     }
-  }, [selectedResumeId, resumes]);
+    return () => {
+      stale = true;
+    };
+  }, [selectedResumeId]);
 
   const handleResumeChange = (e: React.ChangeEvent<HTMLSelectElement>) => {
     setSelectedResumeId(e.target.value);
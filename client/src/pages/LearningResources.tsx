@@ -1,10 +1,11 @@
 import React, { useEffect, useRef, useState } from "react";
 import { API_BASE } from "../utils/api";
+import { fetchResumeContent } from "../helpers/fetchResumeContent";
+import { fetchRemainingPages } from "../helpers/fetchDashboardPages";
 
 interface Resume {
   id: number;
   title: string;
-  content: string;
   created_at: string;
 }
 
@@ -33,6 +34,28 @@ export const LearningResources = () => {
   const loading = dashboardLoading || coursesLoading;
 
   const hasFetched = useRef(false);
+  // Id of the resume the page currently shows; responses for any other id are stale
+  const selectedRef = useRef<string>("");
+
+  const selectResume = async (id: string) => {
+    selectedRef.current = id;
+    setSelectedResumeId(id);
+    setSelectedResumeContent("");
+    setCourses([]);
+    setSkills([]);
+    setError(null);
+    setCoursesLoading(true);
+    hasFetched.current = false;
+
+    const content = await fetchResumeContent(id, localStorage.getItem("token"));
+    if (selectedRef.current !== id) return;
+    if (!content) {
+      setError("We couldn't load this resume. Please try again later.");
+      setCoursesLoading(false);
+      return;
+    }
+    setSelectedResumeContent(content);
+  };
 
   useEffect(() => {
     const fetchDashboard = async () => {
@@ -46,20 +69,32 @@ export const LearningResources = () => {
         if (!res.ok) {
           setError("We couldn't load your resumes. Please try again later.");
           setResumes([]);
+          setCoursesLoading(false);
           return;
         }
 
         const data = await res.json();
-        setResumes(data.resumes);
+        setResumes(data.resumes ?? []);
+        setDashboardLoading(false);
         const mostRecent = data.resumes?.[0];
         if (mostRecent) {
-          setSelectedResumeId(String(mostRecent.id));
-          setSelectedResumeContent(mostRecent.content);
+          void selectResume(String(mostRecent.id));
+        } else {
+          setCoursesLoading(false);
+        }
+
+        // Older resumes for the selector, a page at a time
+        const olderResumes = await fetchRemainingPages<Resume>(
+          "resumes", data.nextCursors?.resumes, localStorage.getItem("token")
+        );
+        if (olderResumes.length) {
+          setResumes((prev) => [...prev, ...olderResumes]);
         }
       } catch (err) {
         console.error("Error fetching dashboard resumes:", err);
         setError("Something went wrong while loading your dashboard.");
         setResumes([]);
+        setCoursesLoading(false);
       } finally {
         setDashboardLoading(false);
       }
@@ -68,7 +103,8 @@ export const LearningResources = () => {
     void fetchDashboard();
   }, []);
 
-  const fetchCourses = async (resumeText: string) => {
+  const fetchCourses = async (resumeText: string, resumeId: string) => {
+    const isStale = () => selectedRef.current !== resumeId;
     setCoursesLoading(true);
     setError(null);
 
@@ -82,6 +118,7 @@ export const LearningResources = () => {
         body: JSON.stringify({ resume: resumeText }),
       });
 
+      if (isStale()) return;
       if (!res.ok) {
         setError("Failed to fetch learning resources. Please try again later.");
         setCourses([]);
@@ -90,20 +127,21 @@ export const LearningResources = () => {
       }
 
       const data: LearningResponse = await res.json();
+      if (isStale()) return;
       setCourses(data.courses ?? []);
       setSkills(data.skillsExtracted ?? []);
     } catch (err) {
       console.error("Error fetching learning resources:", err);
-      setError("Unable to load learning resources. Please try again.");
+      if (!isStale()) setError("Unable to load learning resources. Please try again.");
     } finally {
-      setCoursesLoading(false);
+      if (!isStale()) setCoursesLoading(false);
     }
   };
 
   useEffect(() => {
     if (!selectedResumeContent || hasFetched.current) return;
     hasFetched.current = true;
-    void fetchCourses(selectedResumeContent);
+    void fetchCourses(selectedResumeContent, selectedRef.current);
   }, [selectedResumeContent]);
 
   const handleResumeChange = (e: React.ChangeEvent<HTMLSelectElement>) => {
@@ -111,20 +149,14 @@ export const LearningResources = () => {
     const selected = resumes.find((r) => String(r.id) === chosenId);
 
     if (selected) {
-      setSelectedResumeId(chosenId);
-      setSelectedResumeContent(selected.content);
-      setCourses([]);
-      setSkills([]);
-      setError(null);
-      setCoursesLoading(true);
-      hasFetched.current = false;
+      void selectResume(chosenId);
     }
   };
 
   const handleRefresh = () => {
     if (!selectedResumeContent) return;
     hasFetched.current = true;
-    void fetchCourses(selectedResumeContent);
+    void fetchCourses(selectedResumeContent, selectedRef.current);
   };
 
   return (
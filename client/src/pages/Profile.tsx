@@ -1,4 +1,4 @@
-import React, { useEffect, useState } from "react";
+import React, { useEffect, useRef, useState } from "react";
 import { API_BASE } from "../utils/api";
 import { CareerSuggestionsCard } from "../components/CareerSuggestionsCard.tsx";
 import { CVitaeResumes } from "../components/CVitaeResumes";
@@ -7,11 +7,12 @@ import { CareerGistSearches } from "../components/CareerGistSearches";
 import { AppliedJobs } from "../components/AppliedJobs";
 import { FavoriteKeywords } from "../components/FavoriteKeywords";
 import { FavoriteJobs } from "../components/FavoriteJobs";
+import { fetchResumeContent } from "../helpers/fetchResumeContent";
+import { fetchRemainingPages } from "../helpers/fetchDashboardPages";
 
 interface Resume {
   id: number;
   title: string;
-  content: string;
   created_at: string;
 }
 
@@ -29,6 +30,19 @@ export const Profile = () => {
   const [selectedResumeContent, setSelectedResumeContent] = useState<string>("");
   const [loadingWidget, setLoadingWidget] = useState<boolean>(false);
   const [error, setError] = useState<string | null>(null);
+  // Id of the resume being analyzed; content fetched for any other id is stale
+  const selectedRef = useRef<string>("");
+
+  const selectResume = async (id: string) => {
+    selectedRef.current = id;
+    setSelectedResumeId(id);
+    setLoadingWidget(true);
+    setSelectedResumeContent("");
+    const content = await fetchResumeContent(id, token);
+    if (selectedRef.current !== id) return;
+    setSelectedResumeContent(content);
+    setLoadingWidget(false);
+  };
 
   useEffect(() => {
     const fetchDashboard = async () => {
@@ -51,8 +65,13 @@ export const Profile = () => {
         });
 
         if (dashboard.resumes?.length) {
-          setSelectedResumeId(String(dashboard.resumes[0].id));
-          setSelectedResumeContent(dashboard.resumes[0].content);
+          void selectResume(String(dashboard.resumes[0].id));
+        }
+
+        // Older resumes for the selector, a page at a time
+        const olderResumes = await fetchRemainingPages<Resume>("resumes", dashboard.nextCursors?.resumes, token);
+        if (olderResumes.length) {
+          setData((prev) => prev && { ...prev, resumes: [...prev.resumes, ...olderResumes] });
         }
       } catch (err: unknown) {
         console.error("🚨 Dashboard error:", err instanceof Error ? err.message : err);
@@ -67,13 +86,7 @@ export const Profile = () => {
     const chosenId = e.target.value;
     const selected = data?.resumes.find((r) => String(r.id) === chosenId);
     if (selected) {
-      setSelectedResumeId(chosenId);
-      setLoadingWidget(true);
-      setSelectedResumeContent("");
-      setTimeout(() => {
-        setSelectedResumeContent(selected.content);
-        setLoadingWidget(false);
-      }, 50);
+      void selectResume(chosenId);
     }
   };
 
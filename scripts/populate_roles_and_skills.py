@@ -1,47 +1,284 @@
 # server/scripts/populate_roles_and_skills.py
+# Run from the project root: PYTHONPATH=. python scripts/populate_roles_and_skills.py [--full]
+#
+# Default: process only jobs after the stored watermark ("createdAt", "id") and
+# fold them into the per-role skill counts. --full clears the counts and
+# reprocesses every job. Each chunk commits its counts and the watermark
+# together, so an interrupted run, --full included, resumes where it stopped.
+# Every completed run drops roles no counted job has any more and re-weights
+# all role profiles from the counts (TF-IDF, see reweight_roles).
+#
+# Limitations: jobs without a "createdAt" are never counted, and a job inserted
+# with a "createdAt" at or before the watermark (backfills, source post dates)
+# is skipped by incremental runs; run --full after such imports.
+# Schema: server/migrations/007_rolesandskills_incremental.sql, 008_role_skill_weights.sql
 
+import argparse
+import io
 import os
-import spacy
+import time
+from collections import Counter, defaultdict
+from typing import Optional
+
+import numpy as np
 import psycopg2
-import uuid
-from collections import defaultdict
+from psycopg2.extras import execute_values
 from dotenv import load_dotenv
 
+from server.services.nlp import parse_many
+
 load_dotenv()
 DB_URL = os.getenv("DATABASE_URL")
 
-nlp = spacy.load("en_core_web_sm")
+WATERMARK = "jobs"
+MAX_SKILLS = 30
+# Jobs per commit, rows per round trip from the server-side cursor, and spaCy settings
+CHUNK_SIZE = int(os.getenv("ROLES_CHUNK_SIZE", "5000"))
+FETCH_SIZE = int(os.getenv("ROLES_FETCH_SIZE", "2000"))
+NLP_BATCH_SIZE = int(os.getenv("ROLES_NLP_BATCH_SIZE", "128"))
+NLP_PROCESSES = int(os.getenv("ROLES_NLP_PROCESSES", str(max((os.cpu_count() or 2) - 1, 1))))
 
-def extract_skills(text: str):
-    doc = nlp(text)
+def extract_skills(doc):
     return {
         token.text.lower()
         for token in doc
         if token.pos_ in {"NOUN", "PROPN"} and not token.is_stop
     }
 
-def main():
-    conn = psycopg2.connect(DB_URL)
-    cur = conn.cursor()
+def load_watermark(cur) -> Optional[tuple]:
+    cur.execute(
+        'SELECT "created_at", "job_id" FROM "rolesandskills_watermark" WHERE "name" = %s',
+        (WATERMARK,)
+    )
+    return cur.fetchone()
 
-    cur.execute("SELECT title, description FROM jobs WHERE description IS NOT NULL;")
-    rows = cur.fetchall()
-
-    role_map = defaultdict(set)
-    for title, desc in rows:
-        skills = extract_skills(desc)
-        role_map[title].update(skills)
+def stream_jobs(conn, watermark: Optional[tuple]):
+    """(description, (title, createdAt, id)) pairs after the watermark, via a named (server-side) cursor."""
+    cur = conn.cursor(name="populate_roles_jobs")
+    cur.itersize = FETCH_SIZE
+    # Compared and ordered on the native id type so jobs_created_at_id_idx serves the scan;
+    # the stored id is an untyped literal that Postgres resolves to that type
+    if watermark:
+        cur.execute("""
+            SELECT title, description, "createdAt", "id"::text FROM jobs
+            WHERE description IS NOT NULL AND "createdAt" IS NOT NULL AND ("createdAt", "id") > (%s, %s)
+            ORDER BY "createdAt", "id"
+        """, watermark)
+    else:
+        cur.execute("""
+            SELECT title, description, "createdAt", "id"::text FROM jobs
+            WHERE description IS NOT NULL AND "createdAt" IS NOT NULL
+            ORDER BY "createdAt", "id"
+        """)
+    for title, description, created_at, job_id in cur:
+        yield description, (title, created_at, job_id)
+    cur.close()
 
-    for title, skills in role_map.items():
+def save_chunk(conn, role_counts: dict[str, Counter], role_jobs: Counter, last_job: tuple) -> None:
+    """Add the chunk's counts and move the watermark, in one transaction."""
+    with conn.cursor() as cur:
+        execute_values(
+            cur,
+            """
+            INSERT INTO "role_skill_counts" ("roletitle", "skill", "jobs") VALUES %s
+            ON CONFLICT ("roletitle", "skill") DO UPDATE
+            SET "jobs" = "role_skill_counts"."jobs" + EXCLUDED."jobs"
+            """,
+            [(title, skill, n) for title, skills in role_counts.items() for skill, n in skills.items()],
+            page_size=1000,
+        )
+        execute_values(
+            cur,
+            """
+            INSERT INTO "role_job_counts" ("roletitle", "jobs") VALUES %s
+            ON CONFLICT ("roletitle") DO UPDATE
+            SET "jobs" = "role_job_counts"."jobs" + EXCLUDED."jobs"
+            """,
+            list(role_jobs.items()),
+            page_size=1000,
+        )
         cur.execute(
-            "INSERT INTO rolesandskills (id, roletitle, requiredskills) VALUES (%s, %s, %s)",
-            (str(uuid.uuid4()), title, list(skills)[:30])
+            """
+            INSERT INTO "rolesandskills_watermark" ("name", "created_at", "job_id", "updated_at")
+            VALUES (%s, %s, %s, now())
+            ON CONFLICT ("name") DO UPDATE
+            SET "created_at" = EXCLUDED."created_at", "job_id" = EXCLUDED."job_id", "updated_at" = now()
+            """,
+            (WATERMARK, *last_job)
         )
+    conn.commit()
+
+def tfidf_profiles(role_jobs: np.ndarray, role_idx: np.ndarray, skill_idx: np.ndarray, counts: np.ndarray,
+                   max_skills: int = MAX_SKILLS) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Role profiles from (role, skill, jobs) count triples:
+    weight = (share of the role's jobs mentioning the skill)
+           * (1 + log((1 + all jobs) / (1 + jobs mentioning the skill anywhere))),
+    keeping the max_skills heaviest skills per role, L2-normalized.
+    Returns (skill indices, weights, bounds): role r's profile is
+    [bounds[r]:bounds[r + 1]] of the first two, heaviest first.
+    """
+    counts = counts.astype(np.float64)
+    n_skills = int(skill_idx.max()) + 1 if len(skill_idx) else 0
+    df = np.bincount(skill_idx, weights=counts, minlength=n_skills)
+    idf = 1.0 + np.log((1.0 + role_jobs.sum()) / (1.0 + df))
+    weights = counts / np.maximum(role_jobs[role_idx], 1.0) * idf[skill_idx]
 
+    # Heaviest skills first within each role; ties by skill index
+    order = np.lexsort((skill_idx, -weights, role_idx))
+    role_sorted = role_idx[order]
+    first = np.searchsorted(role_sorted, role_sorted, side="left")
+    kept = order[np.arange(len(order)) - first < max_skills]
+
+    kept_roles, kept_weights = role_idx[kept], weights[kept]
+    norms = np.sqrt(np.bincount(kept_roles, weights=kept_weights ** 2, minlength=len(role_jobs)))
+    kept_weights = kept_weights / norms[kept_roles]
+
+    bounds = np.searchsorted(kept_roles, np.arange(len(role_jobs) + 1))
+    return skill_idx[kept], kept_weights, bounds
+
+def load_counts(conn) -> tuple[list[str], np.ndarray, list[str], np.ndarray]:
+    """
+    Roles with their job counts, skills, and the (role, skill, jobs) triples as
+    one int64 array of index columns, copied out in text form and parsed by NumPy.
+    Indices follow the name order of the two lists.
+    """
+    with conn.cursor() as cur:
+        cur.execute("SET TRANSACTION ISOLATION LEVEL REPEATABLE READ")
+        cur.execute('SELECT "roletitle", "jobs" FROM "role_job_counts" ORDER BY "roletitle"')
+        job_rows = cur.fetchall()
+        cur.execute('SELECT DISTINCT "skill" FROM "role_skill_counts" ORDER BY "skill"')
+        skills = [skill for (skill,) in cur.fetchall()]
+
+        buf = io.StringIO()
+        cur.copy_expert("""
+            COPY (
+                SELECT r.i, s.i, c."jobs"
+                FROM "role_skill_counts" c
+                JOIN (SELECT "roletitle", row_number() OVER (ORDER BY "roletitle") - 1 AS i
+                      FROM "role_job_counts") r USING ("roletitle")
+                JOIN (SELECT "skill", row_number() OVER (ORDER BY "skill") - 1 AS i
+                      FROM (SELECT DISTINCT "skill" FROM "role_skill_counts") d) s USING ("skill")
+            ) TO STDOUT
+        """, buf)
     conn.commit()
-    cur.close()
-    conn.close()
-    print("✅ rolesandskills table populated successfully.")
+
+    text = buf.getvalue()
+    triples = np.fromstring(text, dtype=np.int64, sep=" ") if text else np.empty(0, dtype=np.int64)
+    roles = [title for title, _ in job_rows]
+    role_jobs = np.array([n for _, n in job_rows], dtype=np.float64)
+    return roles, role_jobs, skills, triples.reshape(-1, 3)
+
+def reweight_roles(conn) -> int:
+    """
+    Rebuild every role's profile from the counts in one vectorized pass (see
+    tfidf_profiles). Only rows whose skills or weights changed are written, so
+    an unchanged role neither bloats the table nor alters the checksum that
+    workers' role indexes watch. Returns the number of roles rewritten.
+    """
+    roles, role_jobs, skills, triples = load_counts(conn)
+    if not roles:
+        return 0
+
+    skill_names = np.array(skills, dtype=object)
+    kept_skills, kept_weights, bounds = tfidf_profiles(role_jobs, triples[:, 0], triples[:, 1], triples[:, 2])
+    profiles = [
+        (roles[r], list(skill_names[kept_skills[bounds[r]:bounds[r + 1]]]),
+         [round(float(w), 6) for w in kept_weights[bounds[r]:bounds[r + 1]]])
+        for r in range(len(roles)) if bounds[r + 1] > bounds[r]
+    ]
+
+    with conn.cursor() as cur:
+        written = execute_values(
+            cur,
+            """
+            INSERT INTO rolesandskills (id, roletitle, requiredskills, skillweights) VALUES %s
+            ON CONFLICT (roletitle) DO UPDATE
+            SET requiredskills = EXCLUDED.requiredskills, skillweights = EXCLUDED.skillweights
+            WHERE rolesandskills.requiredskills IS DISTINCT FROM EXCLUDED.requiredskills
+               OR rolesandskills.skillweights IS DISTINCT FROM EXCLUDED.skillweights
+            RETURNING 1
+            """,
+            profiles,
+            template="(gen_random_uuid(), %s, %s::text[], %s::real[])",
+            page_size=500,
+            fetch=True,
+        )
+    conn.commit()
+    return len(written)
+
+def reset(conn) -> None:
+    with conn.cursor() as cur:
+        cur.execute('TRUNCATE "role_skill_counts", "role_job_counts"')
+        cur.execute('DELETE FROM "rolesandskills_watermark" WHERE "name" = %s', (WATERMARK,))
+    conn.commit()
+
+def drop_unseen_roles(conn) -> int:
+    with conn.cursor() as cur:
+        cur.execute("""
+            DELETE FROM rolesandskills r
+            WHERE NOT EXISTS (SELECT 1 FROM "role_job_counts" c WHERE c."roletitle" = r.roletitle)
+        """)
+        removed = cur.rowcount
+    conn.commit()
+    return removed
+
+def main():
+    parser = argparse.ArgumentParser(description="Build rolesandskills from job descriptions.")
+    parser.add_argument("--full", action="store_true", help="clear the counts and reprocess every job")
+    args = parser.parse_args()
+
+    read_conn = psycopg2.connect(DB_URL)
+    write_conn = psycopg2.connect(DB_URL)
+    started = time.monotonic()
+
+    if args.full:
+        reset(write_conn)
+    with write_conn.cursor() as cur:
+        watermark = load_watermark(cur)
+
+    role_counts: dict[str, Counter] = defaultdict(Counter)
+    role_jobs: Counter = Counter()
+    processed = in_chunk = 0
+    last_job = None
+
+    docs = parse_many(
+        stream_jobs(read_conn, watermark),
+        task="pos",
+        batch_size=NLP_BATCH_SIZE,
+        n_process=NLP_PROCESSES,
+        as_tuples=True,
+    )
+    for doc, (title, created_at, job_id) in docs:
+        if title:
+            role_counts[title].update(extract_skills(doc))
+            role_jobs[title] += 1
+        last_job = (created_at, job_id)
+        processed += 1
+        in_chunk += 1
+        if in_chunk >= CHUNK_SIZE:
+            save_chunk(write_conn, role_counts, role_jobs, last_job)
+            print(f"… {processed} jobs processed")
+            role_counts.clear()
+            role_jobs.clear()
+            in_chunk = 0
+
+    if in_chunk:
+        save_chunk(write_conn, role_counts, role_jobs, last_job)
+
+    # The counts now cover every job since they were last cleared, whether by this
+    # run's --full or by an earlier, interrupted one, so unseen roles are stale
+    removed = drop_unseen_roles(write_conn)
+    # Every new job shifts the IDF terms, so all roles are re-weighted, not just the touched ones
+    weighted = reweight_roles(write_conn)
+
+    read_conn.close()
+    write_conn.close()
+    print(
+        f"✅ rolesandskills updated: {processed} new jobs, {weighted} role profiles changed"
+        f"{f', {removed} stale roles removed' if removed else ''}"
+        f" in {time.monotonic() - started:.0f}s."
+    )
 
 if __name__ == "__main__":
     main()
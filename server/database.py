@@ -1,4 +1,6 @@
 from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 import os
@@ -7,10 +9,63 @@ from dotenv import load_dotenv
 load_dotenv()
 
 DATABASE_URL = os.getenv("DATABASE_URL")
+# Optional replica for read-only routes; reads use the primary when unset
+DATABASE_READ_URL = os.getenv("DATABASE_READ_URL")
 
-engine = create_engine(DATABASE_URL)
+# Connections per engine per worker process: DB_POOL_SIZE kept open, up to
+# DB_MAX_OVERFLOW more under load, recycled after DB_POOL_RECYCLE seconds
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+# The async engines are pooled separately and sized for the routes that moved to
+# them; a worker can hold up to DB_POOL_SIZE + DB_MAX_OVERFLOW sync plus
+# DB_ASYNC_POOL_SIZE + DB_ASYNC_MAX_OVERFLOW async connections per database
+DB_ASYNC_POOL_SIZE = int(os.getenv("DB_ASYNC_POOL_SIZE", "3"))
+DB_ASYNC_MAX_OVERFLOW = int(os.getenv("DB_ASYNC_MAX_OVERFLOW", "2"))
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "true").lower() in ("1", "true", "yes")
+
+
+def make_engine(url: str) -> Engine:
+    return create_engine(
+        url,
+        pool_size=DB_POOL_SIZE,
+        max_overflow=DB_MAX_OVERFLOW,
+        pool_timeout=DB_POOL_TIMEOUT,
+        pool_recycle=DB_POOL_RECYCLE,
+        pool_pre_ping=DB_POOL_PRE_PING,
+    )
+
+
+def make_async_engine(url: str) -> AsyncEngine:
+    """asyncpg engine for the same database; libpq's sslmode becomes asyncpg's ssl argument."""
+    url = make_url(url)
+    sslmode = url.query.get("sslmode")
+    connect_args = {"ssl": sslmode} if sslmode else {}
+    return create_async_engine(
+        url.set(drivername="postgresql+asyncpg").difference_update_query(["sslmode"]),
+        pool_size=DB_ASYNC_POOL_SIZE,
+        max_overflow=DB_ASYNC_MAX_OVERFLOW,
+        pool_timeout=DB_POOL_TIMEOUT,
+        pool_recycle=DB_POOL_RECYCLE,
+        pool_pre_ping=DB_POOL_PRE_PING,
+        connect_args=connect_args,
+    )
+
+
+engine = make_engine(DATABASE_URL)
+read_engine = make_engine(DATABASE_READ_URL) if DATABASE_READ_URL else engine
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+ReadSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=read_engine)
+
+# Async engines for routes that only wait on Postgres. Routes whose work is
+# mostly NLP or model calls keep the sync sessions inside run_in_threadpool.
+async_engine = make_async_engine(DATABASE_URL)
+async_read_engine = make_async_engine(DATABASE_READ_URL) if DATABASE_READ_URL else async_engine
+
+AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+AsyncReadSessionLocal = async_sessionmaker(async_read_engine, autoflush=False, expire_on_commit=False)
 
 Base = declarative_base()
 
@@ -20,3 +75,49 @@ def get_db():
         yield db
     finally:
         db.close()
+
+def get_read_db():
+    """Session for read-only routes; may lag the primary by replication delay."""
+    db = ReadSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
+
+async def get_async_read_db():
+    """Async session for read-only routes; may lag the primary by replication delay."""
+    async with AsyncReadSessionLocal() as db:
+        yield db
+
+async def dispose_async_engines() -> None:
+    await async_engine.dispose()
+    if async_read_engine is not async_engine:
+        await async_read_engine.dispose()
+
+def pool_stats() -> dict:
+    stats = {"primary": _stats(engine), "primaryAsync": _stats(async_engine.sync_engine)}
+    if read_engine is not engine:
+        stats["replica"] = _stats(read_engine)
+        stats["replicaAsync"] = _stats(async_read_engine.sync_engine)
+    return stats
+
+def pools_saturated() -> bool:
+    """True when any pool has every connection, overflow included, checked out."""
+    engines = [engine, async_engine.sync_engine]
+    if read_engine is not engine:
+        engines += [read_engine, async_read_engine.sync_engine]
+    return any(e.pool.checkedout() >= e.pool.size() + e.pool._max_overflow for e in engines)
+
+def _stats(e: Engine) -> dict:
+    pool = e.pool
+    return {
+        "size": pool.size(),
+        "checkedOut": pool.checkedout(),
+        "checkedIn": pool.checkedin(),
+        "overflow": pool.overflow(),
+        "status": pool.status(),
+    }
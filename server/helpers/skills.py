@@ -1,10 +1,14 @@
 # server/utils/skills.py
 import re
-import spacy
+import threading
 from typing import Set
 
-# load once
-_nlp = spacy.load("en_core_web_sm")
+from spacy.matcher import PhraseMatcher
+from spacy.util import filter_spans
+
+from server.helpers.skills_taxonomy import SKILL_PHRASES, STOP_PHRASES, STOP_PHRASE_MAX_WORDS
+from server.services.nlp import get_nlp, parse
+from server.utils.cache import TTLCache, content_hash
 
 # header-capture regex
 _skills_re = re.compile(
@@ -17,43 +21,60 @@ _skills_re = re.compile(
     re.VERBOSE | re.MULTILINE | re.IGNORECASE,
 )
 
-WEAK_WORDS = {
-        "senior", "junior", "full", "stack", "software", "engineer", "developer",
-        "account", "sector", "public", "solutions", "customer", "manager",
-        "technology", "specialist", "executive", "graduate", "intern", "prompt", "citi",
-        "commodities", "remote", "application", "computer", "(typescript", "houston", "austin",
-        "chicago", "new york", "nyc", "boston", "san francisco", "sf", "la", "los angeles",
-        "dallas", "denver", "seattle", "washington", "atlanta", "miami", "phoenix",
-        "portland", "pittsburgh", "philadelphia", "baltimore", "charlotte", "raleigh",
-        "nashville", "orlando", "san diego", "sacramento", "salt lake city", "st. louis",
-        "minneapolis", "kansas city", "cincinnati", "columbus", "indianapolis",
-        "detroit", "cleveland", "milwaukee", "tampa", "houston", "dallas", "austin",
-        "san jose", "las vegas", "albuquerque", "tucson", "fresno", "long beach",
-        "mesa", "scottsdale", "irvine", "santa clara", "oakland", "bakersfield",
-        "anaheim", "santa ana", "riverside", "stockton", "chula vista", "irvine",
-        "san bernardino", "modesto", "fontana", "moreno valley", "glendale",
-        "huntington beach", "garden grove", "santa rosa", "ontario", "rancho cucamonga",
-        "oxnard", "palmdale", "salinas", "pomona", "escondido", "torrance",
-        "pasadena", "hayward", "fullerton", "orange", "el monte", "thousand oaks",
-        "visalia", "simi valley", "concord", "roseville", "santa clara", "sunnyvale",
-        "santa cruz", "san mateo", "san francisco bay area", "silicon valley"
-    }
-
 _SPLIT_RE = re.compile(r"[/,|•]")
 
+# Extracted keywords keyed by a hash of the input text
+_keywords_cache = TTLCache(maxsize=2048, ttl=6 * 3600)
+
+# Case-insensitive matchers over the taxonomy, compiled once per process
+_matchers: tuple[PhraseMatcher, PhraseMatcher] | None = None
+_matchers_lock = threading.Lock()
+
 def extract_skills_section(markdown: str) -> str:
     m = _skills_re.search(markdown)
     return m.group(1).strip() if m else ""
 
 def extract_technical_keywords(text: str) -> Set[str]:
-    doc = _nlp(text)
+    key = content_hash(text)
+    cached = _keywords_cache.get(key)
+    if cached is not None:
+        return set(cached)
+
+    doc = parse(text, task="keywords")
     raw_phrases: Set[str] = set()
+    skill_matcher, stop_matcher = _get_matchers()
+    stopped = {i for _, start, end in stop_matcher(doc) for i in range(start, end)}
 
+    _extract_taxonomy_skills(doc, skill_matcher, raw_phrases)
     _extract_entities(doc, raw_phrases)
     _extract_noun_chunks(doc, raw_phrases)
-    _extract_strong_tokens(doc, raw_phrases)
+    _extract_strong_tokens(doc, stopped, raw_phrases)
+
+    keywords = _dedupe_and_titlecase(raw_phrases)
+    _keywords_cache.set(key, frozenset(keywords))
+    return keywords
 
-    return _dedupe_and_titlecase(raw_phrases)
+def _get_matchers() -> tuple[PhraseMatcher, PhraseMatcher]:
+    global _matchers
+    if _matchers is None:
+        with _matchers_lock:
+            if _matchers is None:
+                nlp = get_nlp()
+                skill_matcher = PhraseMatcher(nlp.vocab, attr="LOWER")
+                skill_matcher.add("SKILL", list(nlp.tokenizer.pipe(SKILL_PHRASES)))
+                stop_matcher = PhraseMatcher(nlp.vocab, attr="LOWER")
+                # Entries the tokenizer splits differently, like "(typescript", would match
+                # more than intended; _is_valuable still catches them by whitespace words
+                stop_matcher.add("STOP", [
+                    d for d in nlp.tokenizer.pipe(STOP_PHRASES) if len(d) == len(d.text.split())
+                ])
+                _matchers = (skill_matcher, stop_matcher)
+    return _matchers
+
+def _extract_taxonomy_skills(doc, matcher: PhraseMatcher, out: Set[str]):
+    # Longest match wins where entries overlap ("apache spark" over "spark")
+    for span in filter_spans(matcher(doc, as_spans=True)):
+        out.add(span.text)
 
 def _extract_entities(doc, out: Set[str]):
     for ent in doc.ents:
@@ -64,14 +85,14 @@ def _extract_noun_chunks(doc, out: Set[str]):
     for chunk in doc.noun_chunks:
         _clean_and_add(chunk.text, out)
 
-def _extract_strong_tokens(doc, out: Set[str]):
+def _extract_strong_tokens(doc, stopped: Set[int], out: Set[str]):
     for tok in doc:
         w = tok.text.strip()
         if (
             tok.pos_ in {"PROPN","NOUN"}
             and len(w) > 2
             and not tok.is_stop
-            and w.lower() not in WEAK_WORDS
+            and tok.i not in stopped
         ):
             out.add(w)
 
@@ -84,18 +105,21 @@ def _clean_and_add(raw: str, out: Set[str]):
 def _is_valuable(phrase: str) -> bool:
     words = phrase.split()
     if len(words) == 1:
-        return words[0].istitle() and words[0].lower() not in WEAK_WORDS
+        return words[0].istitle() and not _has_stop_phrase(words)
     return (
         1 <= len(words) <= 3
-        and all(w.lower() not in WEAK_WORDS for w in words)
+        and not _has_stop_phrase(words)
     )
 
+def _has_stop_phrase(words: list[str]) -> bool:
+    """Set lookups over the phrase's n-grams, so "san francisco" is caught as a unit."""
+    low = [w.lower() for w in words]
+    for n in range(1, min(STOP_PHRASE_MAX_WORDS, len(low)) + 1):
+        for i in range(len(low) - n + 1):
+            if " ".join(low[i:i + n]) in STOP_PHRASES:
+                return True
+    return False
+
 def _dedupe_and_titlecase(raw_phrases: Set[str]) -> Set[str]:
-    final: Set[str] = set()
-    seen: Set[str] = set()
-    for kw in sorted(raw_phrases, key=len):
-        low = kw.lower()
-        if not any(low in s for s in seen):
-            final.add(kw.title())
-            seen.add(low)
-    return final
+    # Case-insensitive duplicates collapse to one title-cased keyword
+    return {kw.title() for kw in {p.lower(): p for p in raw_phrases}.values()}
@@ -0,0 +1,66 @@
+# server/helpers/skills_taxonomy.py
+# Curated phrase lists for helpers.skills. Entries are matched case-insensitively
+# on token boundaries, so multi-word entries only need to be listed once.
+
+# Technical skills that spaCy's noun chunks and entities tend to split or miss.
+# Each entry is added as a keyword whenever it appears in the text. Common English
+# words that double as tool names (go, express, swift) are left out on purpose.
+SKILL_PHRASES = frozenset({
+    # languages
+    "python", "java", "javascript", "typescript", "golang", "rust", "ruby",
+    "php", "scala", "kotlin", "objective-c", "c++", "c#", "sql",
+    "bash", "shell scripting", "perl", "haskell", "elixir", "dart", "matlab",
+    # web and frameworks
+    "react", "react native", "angular", "vue", "next.js", "node.js", "express.js",
+    "django", "flask", "fastapi", "spring boot", "ruby on rails", "asp.net",
+    ".net", "graphql", "rest api", "rest apis", "html", "css", "tailwind css",
+    "redux", "webpack", "jquery",
+    # data and ml
+    "machine learning", "deep learning", "natural language processing", "nlp",
+    "computer vision", "data science", "data engineering", "data analysis",
+    "data visualization", "big data", "etl", "pandas", "numpy", "scikit-learn",
+    "tensorflow", "pytorch", "keras", "spark", "apache spark", "hadoop", "kafka",
+    "apache kafka", "airflow", "tableau", "power bi", "looker", "dbt",
+    "large language models", "llm", "generative ai",
+    # databases
+    "postgresql", "postgres", "mysql", "sqlite", "mongodb", "redis",
+    "elasticsearch", "dynamodb", "cassandra", "snowflake", "bigquery",
+    "oracle database", "sql server", "nosql",
+    # cloud and ops
+    "aws", "amazon web services", "azure", "microsoft azure", "gcp",
+    "google cloud", "google cloud platform", "docker", "kubernetes", "terraform",
+    "ansible", "jenkins", "github actions", "gitlab ci", "ci/cd", "devops",
+    "linux", "unix", "nginx", "serverless", "microservices", "site reliability engineering",
+    # practices and tooling
+    "git", "agile", "scrum", "kanban", "test driven development", "unit testing",
+    "object oriented programming", "functional programming", "system design",
+    "distributed systems", "cybersecurity", "information security",
+    "penetration testing", "jira", "figma", "ui/ux", "product management",
+    "project management",
+})
+
+# Phrases that never make a keyword on their own: seniority and role words,
+# generic nouns and locations. A candidate phrase containing any of them is dropped.
+STOP_PHRASES = frozenset({
+    "senior", "junior", "full", "stack", "software", "engineer", "developer",
+    "account", "sector", "public", "solutions", "customer", "manager",
+    "technology", "specialist", "executive", "graduate", "intern", "prompt", "citi",
+    "commodities", "remote", "application", "computer", "(typescript", "houston", "austin",
+    "chicago", "new york", "nyc", "boston", "san francisco", "sf", "la", "los angeles",
+    "dallas", "denver", "seattle", "washington", "atlanta", "miami", "phoenix",
+    "portland", "pittsburgh", "philadelphia", "baltimore", "charlotte", "raleigh",
+    "nashville", "orlando", "san diego", "sacramento", "salt lake city", "st. louis",
+    "minneapolis", "kansas city", "cincinnati", "columbus", "indianapolis",
+    "detroit", "cleveland", "milwaukee", "tampa",
+    "san jose", "las vegas", "albuquerque", "tucson", "fresno", "long beach",
+    "mesa", "scottsdale", "irvine", "santa clara", "oakland", "bakersfield",
+    "anaheim", "santa ana", "riverside", "stockton", "chula vista",
+    "san bernardino", "modesto", "fontana", "moreno valley", "glendale",
+    "huntington beach", "garden grove", "santa rosa", "ontario", "rancho cucamonga",
+    "oxnard", "palmdale", "salinas", "pomona", "escondido", "torrance",
+    "pasadena", "hayward", "fullerton", "orange", "el monte", "thousand oaks",
+    "visalia", "simi valley", "concord", "roseville", "sunnyvale",
+    "santa cruz", "san mateo", "san francisco bay area", "silicon valley",
+})
+
+STOP_PHRASE_MAX_WORDS = max(len(p.split()) for p in STOP_PHRASES)
@@ -6,6 +6,10 @@ from dotenv import load_dotenv
 from server.routes import interview, analytics, jobs, auth, dashboard
 from server.routes.suggestions import router as suggestionsRouter
 from server.routes import learning_resources
+from server.services.openai_client import close_clients
+from server.database import pools_saturated, dispose_async_engines
+from server.utils.passwords import shutdown_password_pool
+from server.services.search_log import search_log
 
 load_dotenv()
 
@@ -16,6 +20,10 @@ async def lifespan(application: FastAPI):
         methods = ", ".join(route.methods)
         print(f"{methods:12} {route.path}")
     yield
+    await search_log.close()
+    await close_clients()
+    await dispose_async_engines()
+    shutdown_password_pool()
 
 app = FastAPI(lifespan=lifespan)
 
@@ -39,6 +47,11 @@ app.add_middleware(
 def root():
     return JSONResponse(content={"message": "PyDataPRO API is running!"})
 
+@app.get("/health/db")
+def db_health():
+    # Unauthenticated, so only a summary; pool_stats() has the per-pool numbers
+    return JSONResponse(content={"status": "degraded" if pools_saturated() else "ok"})
+
 app.include_router(suggestionsRouter, prefix="/api", tags=["Career Suggestions"])
 app.include_router(interview.router, prefix="/api", tags=["Interview"])
 app.include_router(analytics.router, prefix="/api/analytics")
@@ -0,0 +1,14 @@
+-- Persistent tier of the course summary cache (server/services/course_summaries.py).
+-- Keyed by Coursera course id plus a SHA-256 of the description that was summarized.
+
+CREATE TABLE IF NOT EXISTS "course_summaries" (
+    "course_id"        TEXT        NOT NULL,
+    "description_hash" CHAR(64)    NOT NULL,
+    "summary"          TEXT        NOT NULL,
+    "created_at"       TIMESTAMPTZ NOT NULL DEFAULT now(),
+    "last_used_at"     TIMESTAMPTZ NOT NULL DEFAULT now(),
+    PRIMARY KEY ("course_id", "description_hash")
+);
+
+CREATE INDEX IF NOT EXISTS "course_summaries_last_used_at_idx"
+    ON "course_summaries" ("last_used_at");
@@ -0,0 +1,11 @@
+-- Cached NLP output per resume (server/services/resume_skills.py).
+-- A row is reused while "resume_updated_at" or "content_hash" still matches the resume.
+
+CREATE TABLE IF NOT EXISTS "resume_skills" (
+    "resume_id"         UUID        PRIMARY KEY REFERENCES "Resumes" ("id") ON DELETE CASCADE,
+    "resume_updated_at" TIMESTAMPTZ NOT NULL,
+    "content_hash"      CHAR(64)    NOT NULL,
+    "skills"            TEXT[],
+    "keywords"          TEXT[],
+    "updated_at"        TIMESTAMPTZ NOT NULL DEFAULT now()
+);
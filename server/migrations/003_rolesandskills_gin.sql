@@ -0,0 +1,5 @@
+-- GIN index backing ROLE_MATCH_MODE=db (server/services/role_matching.py).
+-- CONCURRENTLY avoids locking writers but cannot run inside a transaction block.
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS "rolesandskills_requiredskills_gin"
+    ON rolesandskills USING GIN (requiredskills);
@@ -0,0 +1,23 @@
+-- Materialized per-user keyword profile (server/services/keyword_profile.py).
+-- "counts" holds {source: {keyword: count}} for the sources resume, favorite and search.
+-- "fingerprints" holds [row count, max updated timestamp] per source as of the last sync.
+
+CREATE TABLE IF NOT EXISTS "user_keyword_profiles" (
+    "user_id"      UUID        PRIMARY KEY REFERENCES "Users" ("id") ON DELETE CASCADE,
+    "counts"       JSONB       NOT NULL DEFAULT '{}'::jsonb,
+    "fingerprints" JSONB       NOT NULL DEFAULT '{}'::jsonb,
+    "updated_at"   TIMESTAMPTZ NOT NULL DEFAULT now()
+);
+
+-- Keywords contributed by each resume, favorite or search term, so removals can be subtracted.
+CREATE TABLE IF NOT EXISTS "user_keyword_items" (
+    "source"          TEXT        NOT NULL,
+    "item_id"         UUID        NOT NULL,
+    "user_id"         UUID        NOT NULL REFERENCES "Users" ("id") ON DELETE CASCADE,
+    "item_updated_at" TIMESTAMPTZ,
+    "keywords"        TEXT[]      NOT NULL,
+    PRIMARY KEY ("source", "item_id")
+);
+
+CREATE INDEX IF NOT EXISTS "user_keyword_items_user_source_idx"
+    ON "user_keyword_items" ("user_id", "source");
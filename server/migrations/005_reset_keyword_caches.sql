@@ -0,0 +1,7 @@
+-- helpers.skills keyword extraction changed (taxonomy matching, whole stop phrases),
+-- so keywords derived with the old rules are cleared and recomputed on next read.
+
+UPDATE "resume_skills" SET "keywords" = NULL WHERE "keywords" IS NOT NULL;
+
+TRUNCATE "user_keyword_items";
+UPDATE "user_keyword_profiles" SET "counts" = '{}'::jsonb, "fingerprints" = '{}'::jsonb;
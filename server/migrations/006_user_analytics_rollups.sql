@@ -0,0 +1,145 @@
+-- Per-user analytics rollups maintained by triggers on "user_analytics" (server/routes/analytics.py).
+-- One row per (user, action, dimension, key):
+--   dimension 'all'      key ''              every event of the action
+--   dimension 'title'    key raw title       ('' when NULL)
+--   dimension 'location' key raw location    ('' when NULL)
+--   dimension 'month'    key 'YYYY-MM'       of "timestamp"
+-- "priced" counts events with both salary bounds set (and not NaN); "mid_sum"/"mid_count"
+-- cover their salary midpoints, with an infinite bound falling back to the other one.
+-- Readers normalize titles and locations (initcap/btrim) when grouping.
+
+BEGIN;
+
+CREATE TABLE IF NOT EXISTS "user_analytics_rollups" (
+    "user_id"    TEXT             NOT NULL,
+    "action"     TEXT             NOT NULL,
+    "dimension"  TEXT             NOT NULL,
+    "key"        TEXT             NOT NULL,
+    "events"     BIGINT           NOT NULL DEFAULT 0,
+    "priced"     BIGINT           NOT NULL DEFAULT 0,
+    "mid_count"  BIGINT           NOT NULL DEFAULT 0,
+    "mid_sum"    DOUBLE PRECISION NOT NULL DEFAULT 0,
+    "salary_min" DOUBLE PRECISION,
+    "salary_max" DOUBLE PRECISION,
+    "last_at"    TIMESTAMPTZ,
+    PRIMARY KEY ("user_id", "action", "dimension", "key")
+);
+
+CREATE OR REPLACE FUNCTION "user_analytics_rollup_keys"(r "user_analytics")
+RETURNS TABLE ("dimension" TEXT, "key" TEXT) AS $$
+    VALUES
+        ('all', ''),
+        ('title', COALESCE(r."title", '')),
+        ('location', COALESCE(r."location", '')),
+        ('month', COALESCE(to_char(r."timestamp", 'YYYY-MM'), ''))
+$$ LANGUAGE sql STABLE;
+
+CREATE OR REPLACE FUNCTION "user_analytics_rollup_apply"(r "user_analytics", sign INTEGER)
+RETURNS void AS $$
+DECLARE
+    v_lo     DOUBLE PRECISION := NULLIF(NULLIF(NULLIF(r."salaryMin"::float8, 'NaN'), 'Infinity'), '-Infinity');
+    v_hi     DOUBLE PRECISION := NULLIF(NULLIF(NULLIF(r."salaryMax"::float8, 'NaN'), 'Infinity'), '-Infinity');
+    v_priced BOOLEAN := r."salaryMin" IS NOT NULL AND r."salaryMax" IS NOT NULL
+                      AND r."salaryMin"::float8 <> 'NaN' AND r."salaryMax"::float8 <> 'NaN';
+    v_mid    DOUBLE PRECISION;
+    k      RECORD;
+BEGIN
+    IF v_priced THEN
+        v_mid := (COALESCE(v_lo, v_hi) + COALESCE(v_hi, v_lo)) / 2;
+    END IF;
+
+    FOR k IN SELECT * FROM "user_analytics_rollup_keys"(r) LOOP
+        IF sign > 0 THEN
+            INSERT INTO "user_analytics_rollups" AS u
+                ("user_id", "action", "dimension", "key", "events", "priced",
+                 "mid_count", "mid_sum", "salary_min", "salary_max", "last_at")
+            VALUES
+                (r."userId"::text, r."action", k."dimension", k."key", 1, v_priced::int,
+                 (v_mid IS NOT NULL)::int, COALESCE(v_mid, 0), v_lo, v_hi, r."timestamp")
+            ON CONFLICT ("user_id", "action", "dimension", "key") DO UPDATE SET
+                "events"     = u."events" + 1,
+                "priced"     = u."priced" + EXCLUDED."priced",
+                "mid_count"  = u."mid_count" + EXCLUDED."mid_count",
+                "mid_sum"    = u."mid_sum" + EXCLUDED."mid_sum",
+                "salary_min" = LEAST(u."salary_min", EXCLUDED."salary_min"),
+                "salary_max" = GREATEST(u."salary_max", EXCLUDED."salary_max"),
+                "last_at"    = GREATEST(u."last_at", EXCLUDED."last_at");
+        ELSE
+            UPDATE "user_analytics_rollups" u SET
+                "events"    = u."events" - 1,
+                "priced"    = u."priced" - v_priced::int,
+                "mid_count" = u."mid_count" - (v_mid IS NOT NULL)::int,
+                "mid_sum"   = u."mid_sum" - COALESCE(v_mid, 0)
+            WHERE u."user_id" = r."userId"::text AND u."action" = r."action"
+              AND u."dimension" = k."dimension" AND u."key" = k."key";
+
+            DELETE FROM "user_analytics_rollups" u
+            WHERE u."user_id" = r."userId"::text AND u."action" = r."action"
+              AND u."dimension" = k."dimension" AND u."key" = k."key" AND u."events" <= 0;
+
+            -- Extremes can't be decremented; rescan the group only when the removed row held one
+            UPDATE "user_analytics_rollups" u SET
+                ("salary_min", "salary_max", "last_at") = (
+                    SELECT
+                        min(NULLIF(NULLIF(NULLIF(a."salaryMin"::float8, 'NaN'), 'Infinity'), '-Infinity')),
+                        max(NULLIF(NULLIF(NULLIF(a."salaryMax"::float8, 'NaN'), 'Infinity'), '-Infinity')),
+                        max(a."timestamp")
+                    FROM "user_analytics" a, "user_analytics_rollup_keys"(a) ak
+                    WHERE a."userId" = r."userId" AND a."action" = u."action"
+                      AND ak."dimension" = u."dimension" AND ak."key" = u."key"
+                )
+            WHERE u."user_id" = r."userId"::text AND u."action" = r."action"
+              AND u."dimension" = k."dimension" AND u."key" = k."key"
+              AND (u."salary_min" = v_lo OR u."salary_max" = v_hi OR u."last_at" = r."timestamp");
+        END IF;
+    END LOOP;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION "user_analytics_rollup_trigger"()
+RETURNS trigger AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        PERFORM "user_analytics_rollup_apply"(OLD, -1);
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        PERFORM "user_analytics_rollup_apply"(NEW, 1);
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Block writers while the trigger is installed and existing rows are backfilled
+LOCK TABLE "user_analytics" IN SHARE ROW EXCLUSIVE MODE;
+
+DROP TRIGGER IF EXISTS "user_analytics_rollup" ON "user_analytics";
+CREATE TRIGGER "user_analytics_rollup"
+    AFTER INSERT OR UPDATE OR DELETE ON "user_analytics"
+    FOR EACH ROW EXECUTE FUNCTION "user_analytics_rollup_trigger"();
+
+TRUNCATE "user_analytics_rollups";
+INSERT INTO "user_analytics_rollups"
+    ("user_id", "action", "dimension", "key", "events", "priced",
+     "mid_count", "mid_sum", "salary_min", "salary_max", "last_at")
+SELECT
+    a."userId"::text, a."action", k."dimension", k."key",
+    count(*),
+    count(*) FILTER (WHERE s."priced"),
+    count(s."mid"),
+    COALESCE(sum(s."mid"), 0),
+    min(s."lo"), max(s."hi"), max(a."timestamp")
+FROM "user_analytics" a
+CROSS JOIN LATERAL "user_analytics_rollup_keys"(a) k
+CROSS JOIN LATERAL (
+    SELECT b."lo", b."hi", b."priced",
+           CASE WHEN b."priced" THEN (COALESCE(b."lo", b."hi") + COALESCE(b."hi", b."lo")) / 2 END AS "mid"
+    FROM (SELECT
+        NULLIF(NULLIF(NULLIF(a."salaryMin"::float8, 'NaN'), 'Infinity'), '-Infinity') AS "lo",
+        NULLIF(NULLIF(NULLIF(a."salaryMax"::float8, 'NaN'), 'Infinity'), '-Infinity') AS "hi",
+        a."salaryMin" IS NOT NULL AND a."salaryMax" IS NOT NULL
+            AND a."salaryMin"::float8 <> 'NaN' AND a."salaryMax"::float8 <> 'NaN' AS "priced"
+    ) b
+) s
+GROUP BY 1, 2, 3, 4;
+
+COMMIT;
@@ -0,0 +1,33 @@
+-- Incremental rebuilds of rolesandskills (scripts/populate_roles_and_skills.py).
+-- "role_skill_counts" holds how many job descriptions of a role mention each skill;
+-- rolesandskills.requiredskills is derived from it as the role's most frequent skills.
+-- "rolesandskills_watermark" records the last job processed so re-runs resume from there.
+
+BEGIN;
+
+-- Earlier runs inserted a new row per role each time; keep the row with the most skills
+DELETE FROM rolesandskills r
+USING rolesandskills d
+WHERE r.roletitle = d.roletitle
+  AND (cardinality(r.requiredskills), r.ctid) < (cardinality(d.requiredskills), d.ctid);
+
+CREATE UNIQUE INDEX IF NOT EXISTS "rolesandskills_roletitle_key" ON rolesandskills (roletitle);
+
+-- Incremental runs scan jobs after the watermark in this order
+CREATE INDEX IF NOT EXISTS "jobs_created_at_id_idx" ON jobs ("createdAt", "id");
+
+CREATE TABLE IF NOT EXISTS "role_skill_counts" (
+    "roletitle" TEXT    NOT NULL,
+    "skill"     TEXT    NOT NULL,
+    "jobs"      INTEGER NOT NULL,
+    PRIMARY KEY ("roletitle", "skill")
+);
+
+CREATE TABLE IF NOT EXISTS "rolesandskills_watermark" (
+    "name"       TEXT        PRIMARY KEY,
+    "created_at" TIMESTAMPTZ NOT NULL,
+    "job_id"     TEXT        NOT NULL,
+    "updated_at" TIMESTAMPTZ NOT NULL DEFAULT now()
+);
+
+COMMIT;
@@ -0,0 +1,18 @@
+-- TF-IDF weighted role profiles (scripts/populate_roles_and_skills.py, server/services/role_matching.py).
+-- "skillweights" is parallel to "requiredskills": the L2-normalized weight of each skill, highest first.
+-- "role_job_counts" holds how many job descriptions each role was built from.
+-- The counts are reset so the next populate run rebuilds them together with the job counts.
+
+BEGIN;
+
+ALTER TABLE rolesandskills ADD COLUMN IF NOT EXISTS skillweights REAL[];
+
+CREATE TABLE IF NOT EXISTS "role_job_counts" (
+    "roletitle" TEXT    PRIMARY KEY,
+    "jobs"      INTEGER NOT NULL
+);
+
+TRUNCATE "role_skill_counts";
+DELETE FROM "rolesandskills_watermark" WHERE "name" = 'jobs';
+
+COMMIT;
@@ -0,0 +1,11 @@
+-- Deletions of search-history terms (server/services/search_log.py). Terms are
+-- inserted in batches by each worker's write-behind buffer, so a term the user
+-- searched for before deleting it may still be pending in any worker. The
+-- buffer skips pending terms created at or before a matching deletion here.
+
+CREATE TABLE IF NOT EXISTS "search_term_deletions" (
+    "user_id"    UUID        NOT NULL REFERENCES "Users" ("id") ON DELETE CASCADE,
+    "query"      TEXT        NOT NULL,
+    "deleted_at" TIMESTAMPTZ NOT NULL,
+    PRIMARY KEY ("user_id", "query")
+);
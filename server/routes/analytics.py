@@ -1,16 +1,21 @@
 import uuid
-from fastapi import APIRouter, HTTPException, Depends, status
+from fastapi import APIRouter, HTTPException, Depends, Query, status
+from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel
-from typing import List, Optional, Dict
+from typing import List, Literal, Optional, Dict
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import text
 import pandas as pd
 from datetime import datetime, timezone
 import math
 
-from server.database import get_db
-from server.utils.auth import get_current_user
+from server.database import get_db, get_async_db, get_async_read_db
+from server.utils.auth import TokenUser, get_current_user, get_token_user
 from server.models.user import User
+from server.services.keyword_profile import forget_items
+from server.services.search_log import record_deletion, search_log
+from server.services.job_market import get_jobs_snapshot
 
 router = APIRouter()
 
@@ -29,74 +34,91 @@ class AnalyticsResponse(BaseModel):
     average_salary: float
     top_locations: Dict[str, int]
     common_titles: Dict[str, int]
+    salary_stats: Optional[Dict[str, float]] = None
+
+
+# Salary midpoints of favorites, by the same rules the rollups use
+# (server/migrations/006_user_analytics_rollups.sql): both bounds must be set,
+# and an infinite bound falls back to the finite one
+_FAVORITE_MIDPOINTS = """
+    SELECT (COALESCE(s."min", s."max") + COALESCE(s."max", s."min")) / 2 AS "mid"
+    FROM "user_analytics",
+    LATERAL (SELECT
+        NULLIF(NULLIF("salaryMin"::float8, 'Infinity'), '-Infinity') AS "min",
+        NULLIF(NULLIF("salaryMax"::float8, 'Infinity'), '-Infinity') AS "max"
+    ) s
+    WHERE "userId" = :userId AND "action" = 'favorite'
+      AND "salaryMin" IS NOT NULL AND "salaryMax" IS NOT NULL
+      AND "salaryMin"::float8 <> 'NaN' AND "salaryMax"::float8 <> 'NaN'
+"""
 
 
 @router.get("/salary-summary", response_model=AnalyticsResponse)
-def salary_summary(
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+async def salary_summary(
+    include_stats: bool = False,
+    db: AsyncSession = Depends(get_async_read_db),
+    current_user: TokenUser = Depends(get_token_user)
 ):
-    result = db.execute(
+    result = await db.execute(
         text("""
-            SELECT "title", "location", "salaryMin", "salaryMax"
-            FROM "user_analytics"
-            WHERE "userId" = :userId AND "action" = 'favorite'
+            WITH "rollups" AS (
+                SELECT "dimension", "key", "events", "priced", "mid_count", "mid_sum"
+                FROM "user_analytics_rollups"
+                WHERE "user_id" = :userId AND "action" = 'favorite'
+            )
+            SELECT
+                a."total", a."average",
+                l."names" AS "location_names", l."counts" AS "location_counts",
+                ti."names" AS "title_names", ti."counts" AS "title_counts"
+            FROM
+                (SELECT COALESCE(sum("events"), 0) AS "total",
+                        sum("mid_sum") / NULLIF(sum("mid_count"), 0) AS "average"
+                 FROM "rollups" WHERE "dimension" = 'all') a,
+                (SELECT array_agg("name" ORDER BY "n" DESC, "name") AS "names",
+                        array_agg("n" ORDER BY "n" DESC, "name") AS "counts"
+                 FROM (SELECT initcap(btrim("key")) AS "name", sum("priced") AS "n" FROM "rollups"
+                       WHERE "dimension" = 'location' AND "key" <> ''
+                       GROUP BY 1 HAVING sum("priced") > 0 ORDER BY 2 DESC, 1 LIMIT 5) x) l,
+                (SELECT array_agg("name" ORDER BY "n" DESC, "name") AS "names",
+                        array_agg("n" ORDER BY "n" DESC, "name") AS "counts"
+                 FROM (SELECT initcap(btrim("key")) AS "name", sum("priced") AS "n" FROM "rollups"
+                       WHERE "dimension" = 'title' AND "key" <> ''
+                       GROUP BY 1 HAVING sum("priced") > 0 ORDER BY 2 DESC, 1 LIMIT 7) x) ti
         """),
         {"userId": str(current_user.id)}
     )
-
-    rows = result.fetchall()
-    if not rows:
+    row = result.mappings().one()
+    if not row["total"]:
         raise HTTPException(status_code=404, detail="No jobs found for user.")
 
-    df = pd.DataFrame(rows, columns=["title", "location", "salaryMin", "salaryMax"])
-
-    print("\n=== Fetched Jobs for Analytics ===")
-    print(df.to_string(index=False))
-    print("==================================\n")
-
-    df = df.dropna(subset=["salaryMin", "salaryMax"])
-
-    df["salaryMin"] = df["salaryMin"].apply(lambda x: x if math.isfinite(x) else None)
-    df["salaryMax"] = df["salaryMax"].apply(lambda x: x if math.isfinite(x) else None)
-
-    df["salary_mid"] = df[["salaryMin", "salaryMax"]].mean(axis=1)
-    df["location"] = df["location"].str.strip().str.title()
-    df["title"] = df["title"].str.strip().str.title()
-    average_salary = round(df["salary_mid"].dropna().mean(), 2)
-
+    average_salary = round(float(row["average"]), 2) if row["average"] is not None else 0.0
     if not math.isfinite(average_salary):
         average_salary = 0.0
 
-    def extract_general_location(loc: str) -> str:
-        parts = [p.strip() for p in loc.split(",")]
-        return f"{parts[-2]}, {parts[-1]}" if len(parts) >= 2 else loc
-
-    df["normalized_location"] = df["location"].dropna().apply(extract_general_location)
-
-    top_locations = (
-        df["location"]
-        .dropna()
-        .str.strip()
-        .str.title()
-        .value_counts()
-        .head(5)
-        .to_dict()
-    )
-
-    common_titles = (
-        df["title"]
-        .dropna()
-        .value_counts()
-        .head(7)
-        .to_dict()
-    )
-
-    return {
+    response = {
         "average_salary": average_salary,
-        "top_locations": top_locations,
-        "common_titles": common_titles,
+        "top_locations": dict(zip(row["location_names"] or [], map(int, row["location_counts"] or []))),
+        "common_titles": dict(zip(row["title_names"] or [], map(int, row["title_counts"] or []))),
     }
+    if include_stats:
+        response["salary_stats"] = await _salary_stats(db, current_user.id)
+    return response
+
+
+async def _salary_stats(db: AsyncSession, user_id) -> Dict[str, float]:
+    """
+    Distribution of salary midpoints. Quantiles can't be rolled up, so unlike
+    the summary this reads the user's favorites, fetching only the midpoints.
+    """
+    result = await db.execute(
+        text(f"""SELECT "mid" FROM ({_FAVORITE_MIDPOINTS}) p WHERE "mid" IS NOT NULL"""),
+        {"userId": str(user_id)}
+    )
+    mids = pd.Series([float(m) for m in result.scalars().all()], dtype="float64")
+    if mids.empty:
+        return {}
+    stats = mids.describe(percentiles=[0.25, 0.5, 0.75])
+    return {k: round(float(v), 2) for k, v in stats.items() if math.isfinite(v)}
 
 class SearchLog(BaseModel):
     title: Optional[str] = None
@@ -104,16 +126,16 @@ class SearchLog(BaseModel):
     query: Optional[str] = None
 
 @router.get("/applied-jobs", response_model=List[str])
-def get_applied_jobs(
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+async def get_applied_jobs(
+    db: AsyncSession = Depends(get_async_read_db),
+    current_user: TokenUser = Depends(get_token_user)
 ):
-    result = db.execute(
+    result = await db.execute(
         text("""
-            SELECT DISTINCT ON ("title") "title"
-            FROM "user_analytics"
-            WHERE "userId" = :userId AND "action" = 'applied'
-            ORDER BY "title", "timestamp" DESC
+            SELECT "key"
+            FROM "user_analytics_rollups"
+            WHERE "user_id" = :userId AND "action" = 'applied' AND "dimension" = 'title'
+            ORDER BY "key"
         """),
         {"userId": str(current_user.id)}
     )
@@ -122,10 +144,43 @@ def get_applied_jobs(
     return titles
 
 
+class TrendPoint(BaseModel):
+    month: str
+    events: int
+    average_salary: Optional[float]
+
+
+@router.get("/trends", response_model=List[TrendPoint])
+async def get_trends(
+    action: str = "favorite",
+    months: int = Query(12, ge=1, le=120),
+    db: AsyncSession = Depends(get_async_read_db),
+    current_user: TokenUser = Depends(get_token_user)
+):
+    result = await db.execute(
+        text("""
+            SELECT "key", "events", "mid_sum" / NULLIF("mid_count", 0) AS "average"
+            FROM "user_analytics_rollups"
+            WHERE "user_id" = :userId AND "action" = :action AND "dimension" = 'month' AND "key" <> ''
+            ORDER BY "key" DESC
+            LIMIT :months
+        """),
+        {"userId": str(current_user.id), "action": action, "months": months}
+    )
+
+    return [
+        {
+            "month": month,
+            "events": events,
+            "average_salary": round(average, 2) if average is not None else None,
+        }
+        for month, events, average in reversed(result.fetchall())
+    ]
+
+
 @router.post("/search-history", status_code=status.HTTP_204_NO_CONTENT)
-def log_search_term(
+async def log_search_term(
     payload: SearchLog,
-    db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     title = (payload.title or "").strip()
@@ -137,49 +192,50 @@ def log_search_term(
 
     now = datetime.now(timezone.utc)
 
-    db.execute(
-        text("""
-            INSERT INTO "SearchTerms" ("id", "userId", "title", "location", "query", "createdAt", "updatedAt")
-            VALUES (:id, :userId, :title, :location, :query, :createdAt, :updatedAt)
-        """),
-        {
-            "id": str(uuid.uuid4()),
-            "userId": str(current_user.id),
-            "title": title or None,
-            "location": location or None,
-            "query": query,
-            "createdAt": now,
-            "updatedAt": now
-        }
-    )
-
-    db.commit()
+    # Written in batches by the write-behind buffer; see services.search_log
+    search_log.add({
+        "id": uuid.uuid4(),
+        "userId": current_user.id,
+        "title": title or None,
+        "location": location or None,
+        "query": query,
+        "createdAt": now,
+        "updatedAt": now
+    })
 
 @router.delete("/search-history/{query}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_search_term(
+async def delete_search_term(
     query: str,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    db.execute(
+    # Terms still buffered in any worker are skipped via the recorded deletion
+    await run_in_threadpool(_delete_search_term, db, current_user.id, query)
+
+def _delete_search_term(db: Session, user_id, query: str) -> None:
+    record_deletion(db, user_id, query, datetime.now(timezone.utc))
+    deleted = db.execute(
         text("""
             DELETE FROM "SearchTerms"
             WHERE "userId" = :userId AND "query" = :query
+            RETURNING "id"
         """),
         {
-            "userId": str(current_user.id),
+            "userId": str(user_id),
             "query": query,
         }
-    )
+    ).fetchall()
     db.commit()
 
+    forget_items(db, user_id, "search", [row[0] for row in deleted])
+
 @router.delete("/applied-jobs/{title}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_applied_job(
+async def delete_applied_job(
     title: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user)
 ):
-    db.execute(
+    await db.execute(
         text("""
             DELETE FROM "user_analytics"
             WHERE "userId" = :userId AND "action" = 'applied' AND "title" = :title
@@ -189,4 +245,59 @@ def delete_applied_job(
             "title": title,
         }
     )
-    db.commit()
+    await db.commit()
+
+
+# Market-wide analytics over the in-memory Jobs snapshot (services.job_market)
+
+class MarketFilters:
+    def __init__(
+        self,
+        title: Optional[str] = None,
+        location: Optional[str] = None,
+        company: Optional[str] = None,
+    ):
+        self.contains = {"title": title, "location": location, "company": company}
+
+
+@router.get("/market/groups")
+async def market_groups(
+    by: Literal["title", "location", "company"] = "location",
+    limit: int = Query(20, ge=1, le=200),
+    filters: MarketFilters = Depends(),
+    current_user: TokenUser = Depends(get_token_user)
+):
+    def compute():
+        snapshot = get_jobs_snapshot()
+        return snapshot.group_stats(by, snapshot.mask(**filters.contains), limit)
+
+    return {"by": by, "groups": await run_in_threadpool(compute)}
+
+
+@router.get("/market/histogram")
+async def market_histogram(
+    bins: int = Query(20, ge=1, le=200),
+    filters: MarketFilters = Depends(),
+    current_user: TokenUser = Depends(get_token_user)
+):
+    def compute():
+        snapshot = get_jobs_snapshot()
+        return snapshot.histogram(snapshot.mask(**filters.contains), bins)
+
+    return await run_in_threadpool(compute)
+
+
+@router.get("/market/percentiles")
+async def market_percentiles(
+    q: List[float] = Query([10, 25, 50, 75, 90]),
+    filters: MarketFilters = Depends(),
+    current_user: TokenUser = Depends(get_token_user)
+):
+    if any(not 0 <= p <= 100 for p in q):
+        raise HTTPException(status_code=400, detail="Percentiles must be between 0 and 100")
+
+    def compute():
+        snapshot = get_jobs_snapshot()
+        return snapshot.percentiles(snapshot.mask(**filters.contains), sorted(q))
+
+    return await run_in_threadpool(compute)
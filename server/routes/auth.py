@@ -1,14 +1,15 @@
 from fastapi import APIRouter, HTTPException, status, Depends, Request
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import datetime, timezone
-from passlib.hash import bcrypt
 from pydantic import BaseModel, EmailStr
 from uuid import uuid4
 import logging
 
 from server.models.user import User
-from server.database import get_db
+from server.database import get_async_db
 from server.utils.auth import create_jwt_token, get_current_user
+from server.utils.passwords import hash_password, verify_password
 
 router = APIRouter(tags=["auth"])
 logger = logging.getLogger(__name__)
@@ -18,18 +19,21 @@ class LoginRequest(BaseModel):
     password: str
 
 @router.post("/login")
-def login_user(payload: LoginRequest, db: Session = Depends(get_db)):
+async def login_user(payload: LoginRequest, db: AsyncSession = Depends(get_async_db)):
     try:
-        user = db.query(User).filter(User.email == payload.email).first()
-
-        assert isinstance(user, User)
+        result = await db.execute(select(User).where(User.email == payload.email))
+        user = result.scalars().first()
 
         if not user or not user.passwordHash:
             raise HTTPException(status_code=401, detail="Invalid credentials")
 
-        if not bcrypt.verify(payload.password, user.passwordHash):
+        matches, needs_rehash = await verify_password(payload.password, user.passwordHash)
+        if not matches:
             raise HTTPException(status_code=401, detail="Invalid credentials")
 
+        if needs_rehash:
+            await _rehash(user, payload.password, db)
+
         token = create_jwt_token(user)
 
         return {
@@ -43,11 +47,30 @@ def login_user(payload: LoginRequest, db: Session = Depends(get_db)):
             }
         }
 
+    except HTTPException:
+        raise
+
     except Exception as e:
         print("🔥 UNHANDLED ERROR:", e)
         raise HTTPException(status_code=500, detail="Internal server error", headers={"WWW-Authenticate": "Bearer"})
 
 
+async def _rehash(user: User, password: str, db: AsyncSession) -> None:
+    """Move a stored hash to the configured cost; best effort, login proceeds either way."""
+    try:
+        new_hash = await hash_password(password)
+    except HTTPException:
+        return
+
+    try:
+        user.passwordHash = new_hash
+        user.updatedAt = datetime.now(timezone.utc)
+        await db.commit()
+    except Exception as e:
+        await db.rollback()
+        logger.warning(f"Password rehash failed for {user.id}: {e}")
+
+
 class RegisterRequest(BaseModel):
     firstName: str
     lastName: str
@@ -55,14 +78,16 @@ class RegisterRequest(BaseModel):
     password: str
 
 @router.post("/register")
-def register_user(req: RegisterRequest, db: Session = Depends(get_db)):
-    existing_user = db.query(User).filter(User.email == req.email).first()
+async def register_user(req: RegisterRequest, db: AsyncSession = Depends(get_async_db)):
+    result = await db.execute(select(User).where(User.email == req.email))
+    existing_user = result.scalars().first()
     if existing_user:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Email is already registered"
         )
 
+    password_hash = await hash_password(req.password)
     now = datetime.now(timezone.utc)
 
     new_user = User(
@@ -70,15 +95,14 @@ def register_user(req: RegisterRequest, db: Session = Depends(get_db)):
         firstName=req.firstName,
         lastName=req.lastName,
         email=str(req.email),
-        passwordHash=bcrypt.hash(req.password),
+        passwordHash=password_hash,
         role="user",
         createdAt=now,
         updatedAt=now
     )
 
     db.add(new_user)
-    db.commit()
-    db.refresh(new_user)
+    await db.commit()
 
     token = create_jwt_token(new_user)
 
@@ -94,9 +118,8 @@ def register_user(req: RegisterRequest, db: Session = Depends(get_db)):
     }
 
 @router.post("/refresh-token")
-def refresh_token(
+async def refresh_token(
     request: Request,
-    db: Session = Depends(get_db),
     user: User = Depends(get_current_user)
 ):
     """
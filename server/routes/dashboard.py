@@ -1,65 +1,145 @@
-from fastapi import APIRouter, Depends
+import os
+import uuid
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from server.database import get_db
+from server.database import get_db, get_async_read_db
 from server.models.user import User
 from server.models.resume import Resume
 from server.models.favorite_job import FavoriteJob
 from server.models.search_term import SearchTerm
-from server.utils.auth import get_current_user
-from server.helpers.skills import extract_skills_section, extract_technical_keywords
+from server.utils.auth import TokenUser, get_current_user, get_token_user
+from server.utils.pagination import keyset_page
+from server.services.keyword_profile import get_keyword_profile, interest_keywords, resume_keywords
 
 router = APIRouter()
 
+DASHBOARD_PAGE_SIZE = int(os.getenv("DASHBOARD_PAGE_SIZE", "20"))
+DASHBOARD_MAX_PAGE_SIZE = 100
+
+
+def _resumes_query(user_id):
+    return select(Resume.id, Resume.title, Resume.created_at).where(Resume.user_id == user_id)
+
+
+def _favorites_query(user_id):
+    return (
+        select(FavoriteJob.id, FavoriteJob.title, FavoriteJob.company, FavoriteJob.createdAt)
+          .where(FavoriteJob.user_id == user_id)
+    )
+
+
+def _search_terms_query(user_id):
+    return select(SearchTerm.id, SearchTerm.query, SearchTerm.createdAt).where(SearchTerm.userId == user_id)
+
+
+def _resume_item(r) -> dict:
+    return {"id": r.id, "title": r.title, "created_at": r.created_at.isoformat()}
+
+
+def _favorite_item(f) -> dict:
+    return {"id": f.id, "title": f.title, "company": f.company}
+
+
 @router.get("/dashboard")
-def get_dashboard_data(
+async def get_dashboard_data(
     db: Session = Depends(get_db),
+    read_db: AsyncSession = Depends(get_async_read_db),
     current_user: User = Depends(get_current_user)
 ):
-    # 1. Load user data
-    resumes = (
-        db.query(Resume)
-          .filter(Resume.user_id == current_user.id)
-          .order_by(Resume.created_at.desc())
-          .all()
+    # 1. First page of each section, projected to the columns we return; clients
+    # page through /dashboard/<section> from nextCursors for older rows
+    resumes, resumes_cursor = await keyset_page(
+        read_db, _resumes_query(current_user.id), Resume.created_at, Resume.id, None, DASHBOARD_PAGE_SIZE
     )
-    favorites = (
-        db.query(FavoriteJob)
-          .filter(FavoriteJob.user_id == current_user.id)
-          .order_by(FavoriteJob.createdAt.desc())
-          .all()
+    favorites, favorites_cursor = await keyset_page(
+        read_db, _favorites_query(current_user.id), FavoriteJob.createdAt, FavoriteJob.id, None, DASHBOARD_PAGE_SIZE
     )
-    recent_terms = (
-        db.query(SearchTerm)
-          .filter(SearchTerm.userId == current_user.id)
-          .order_by(SearchTerm.createdAt.desc())
-          .all()
+    search_terms, search_terms_cursor = await keyset_page(
+        read_db, _search_terms_query(current_user.id), SearchTerm.createdAt, SearchTerm.id, None, DASHBOARD_PAGE_SIZE
     )
 
-    # 2. Build skill-text & extract
-    combined = "\n".join(
-        s for r in resumes
-        if (s := extract_skills_section(r.content or ""))
+    # 2. Resume and interest keywords from the materialized per-user profile. It is
+    # written on read and may run NLP, so it stays on the sync primary session.
+    profile = await run_in_threadpool(get_keyword_profile, db, current_user.id)
+    interests = interest_keywords(profile)
+
+    # 3. Prepare response; resume bodies are fetched separately via /resumes/{id}
+    return {
+        "userName": current_user.firstName,
+        "resumes": [_resume_item(r) for r in resumes],
+        "favorites": [_favorite_item(f) for f in favorites],
+        "keywords": sorted(interests),
+        "resumeKeywords": sorted(resume_keywords(profile) & interests),
+        "searchTerms": [t.query for t in search_terms],
+        "nextCursors": {
+            "resumes": resumes_cursor,
+            "favorites": favorites_cursor,
+            "searchTerms": search_terms_cursor,
+        },
+    }
+
+
+@router.get("/dashboard/resumes")
+async def get_dashboard_resumes(
+    cursor: Optional[str] = None,
+    limit: int = Query(DASHBOARD_PAGE_SIZE, ge=1, le=DASHBOARD_MAX_PAGE_SIZE),
+    db: AsyncSession = Depends(get_async_read_db),
+    current_user: TokenUser = Depends(get_token_user)
+):
+    rows, next_cursor = await keyset_page(
+        db, _resumes_query(current_user.id), Resume.created_at, Resume.id, cursor, limit
+    )
+    return {"items": [_resume_item(r) for r in rows], "nextCursor": next_cursor}
+
+
+@router.get("/dashboard/favorites")
+async def get_dashboard_favorites(
+    cursor: Optional[str] = None,
+    limit: int = Query(DASHBOARD_PAGE_SIZE, ge=1, le=DASHBOARD_MAX_PAGE_SIZE),
+    db: AsyncSession = Depends(get_async_read_db),
+    current_user: TokenUser = Depends(get_token_user)
+):
+    rows, next_cursor = await keyset_page(
+        db, _favorites_query(current_user.id), FavoriteJob.createdAt, FavoriteJob.id, cursor, limit
     )
-    resume_keywords = extract_technical_keywords(combined)
+    return {"items": [_favorite_item(f) for f in rows], "nextCursor": next_cursor}
 
-    # 3. Interest keywords
-    combined_interest = " ".join(
-        f.title or "" for f in favorites
-    ) + " " + " ".join(t.title or "" for t in recent_terms)
-    interest_keywords = extract_technical_keywords(combined_interest)
 
-    # 4. Prepare response
+@router.get("/dashboard/search-terms")
+async def get_dashboard_search_terms(
+    cursor: Optional[str] = None,
+    limit: int = Query(DASHBOARD_PAGE_SIZE, ge=1, le=DASHBOARD_MAX_PAGE_SIZE),
+    db: AsyncSession = Depends(get_async_read_db),
+    current_user: TokenUser = Depends(get_token_user)
+):
+    rows, next_cursor = await keyset_page(
+        db, _search_terms_query(current_user.id), SearchTerm.createdAt, SearchTerm.id, cursor, limit
+    )
+    return {"items": [t.query for t in rows], "nextCursor": next_cursor}
+
+
+@router.get("/resumes/{resume_id}")
+async def get_resume(
+    resume_id: uuid.UUID,
+    db: AsyncSession = Depends(get_async_read_db),
+    current_user: TokenUser = Depends(get_token_user)
+):
+    result = await db.execute(
+        select(Resume.id, Resume.title, Resume.content, Resume.created_at)
+          .where(Resume.id == resume_id, Resume.user_id == current_user.id)
+    )
+    resume = result.first()
+    if resume is None:
+        raise HTTPException(status_code=404, detail="Resume not found")
+
     return {
-        "userName": current_user.firstName,
-        "resumes": [
-            {"id": r.id, "title": r.title, "content": r.content, "created_at": r.created_at.isoformat()}
-            for r in resumes
-        ],
-        "favorites": [
-            {"id": f.id, "title": f.title, "company": f.company}
-            for f in favorites
-        ],
-        "keywords": sorted(interest_keywords),
-        "resumeKeywords": sorted(resume_keywords & interest_keywords),
-        "searchTerms": [t.query for t in recent_terms],
+        "id": resume.id,
+        "title": resume.title,
+        "content": resume.content,
+        "created_at": resume.created_at.isoformat(),
     }
@@ -1,12 +1,16 @@
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
-from openai import OpenAI, OpenAIError
+from openai import OpenAIError
 import os
 import json
 import logging
 from dotenv import load_dotenv
 import re
 
+from server.services.openai_client import get_async_client, create_chat_completion, stream_chat_completion
+from server.services.question_pools import QuestionPools
+from server.utils.sse import sse_event, sse_response
+
 load_dotenv()
 
 router = APIRouter()
@@ -15,7 +19,7 @@ api_key_4o = os.getenv("OPENAI_API_KEY_4O")
 if not api_key_4o:
     raise RuntimeError("Missing required environment variable: OPENAI_API_KEY_4O")
 
-client = OpenAI(api_key=api_key_4o)
+client = get_async_client(api_key_4o)
 
 
 
@@ -23,51 +27,112 @@ class JobRequest(BaseModel):
     title: str
 
 
-@router.post("/generate-questions")
-async def generate_questions(req: JobRequest):
-    try:
-        prompt = (
-            "Return a JSON array of exactly 10 interview questions for a "
-            f"{req.title.strip()} role. Each question should be a single string. "
-            "The list must contain exactly 10 questions—no more, no less. "
-            "Include a mix of behavioral, technical, and situational types. "
-            "Make the questions clear, concise, and relevant to the job title. "
-            "Increase difficulty gradually. Do not include any explanations or extra formatting. "
-            "Compound terms like 'full-time', 'object-oriented', or 'results-oriented' must be hyphenated. "
-            "Output ONLY the JSON array and nothing else."
-        )
-
-        response = client.chat.completions.create(
-            model="gpt-4o",
-            messages=[{"role": "user", "content": prompt}],
-            temperature=0.7,
-            max_tokens=200,
-        )
-
-        raw_output = response.choices[0].message.content.strip()
-
-        if raw_output.startswith("```"):
-            raw_output = re.sub(r"^```(?:json)?\n?", "", raw_output)
-            raw_output = re.sub(r"\n?```$", "", raw_output)
+def _questions_prompt(title: str) -> str:
+    return (
+        "Return a JSON array of exactly 10 interview questions for a "
+        f"{title.strip()} role. Each question should be a single string. "
+        "The list must contain exactly 10 questions—no more, no less. "
+        "Include a mix of behavioral, technical, and situational types. "
+        "Make the questions clear, concise, and relevant to the job title. "
+        "Increase difficulty gradually. Do not include any explanations or extra formatting. "
+        "Compound terms like 'full-time', 'object-oriented', or 'results-oriented' must be hyphenated. "
+        "Output ONLY the JSON array and nothing else."
+    )
 
-        try:
-            questions = json.loads(raw_output)
 
-            if not isinstance(questions, list):
-                raise ValueError("Response is not a JSON array.")
-            if len(questions) != 10:
-                raise ValueError("Expected exactly 10 questions.")
+async def generate_question_set(title: str) -> list[str]:
+    """One validated set of exactly 10 questions; raises ValueError on a bad response."""
+    response = await create_chat_completion(
+        client,
+        model="gpt-4o",
+        messages=[{"role": "user", "content": _questions_prompt(title)}],
+        temperature=0.7,
+        max_tokens=200,
+    )
 
-            return {"questions": questions}
+    raw_output = response.choices[0].message.content.strip()
 
+    if raw_output.startswith("```"):
+        raw_output = re.sub(r"^```(?:json)?\n?", "", raw_output)
+        raw_output = re.sub(r"\n?```$", "", raw_output)
 
-        except json.JSONDecodeError:
-            logging.error(f"OpenAI did not return valid JSON:\n{raw_output}")
-            raise HTTPException(status_code=500, detail="OpenAI returned invalid JSON.")
+    try:
+        questions = json.loads(raw_output)
+    except json.JSONDecodeError:
+        logging.error(f"OpenAI did not return valid JSON:\n{raw_output}")
+        raise ValueError("OpenAI returned invalid JSON.")
+
+    try:
+        _validate_questions(questions)
+    except ValueError as ve:
+        logging.error(f"Validation error: {ve}\nResponse:\n{raw_output}")
+        raise
+
+    return questions
+
+
+def _validate_questions(questions) -> None:
+    if not isinstance(questions, list):
+        raise ValueError("Response is not a JSON array.")
+    if len(questions) != 10:
+        raise ValueError("Expected exactly 10 questions.")
+
+
+class _JsonArrayReader:
+    """
+    Incrementally decodes the top-level elements of a streamed JSON array.
+    Text before the opening bracket (such as a code fence) is skipped.
+    """
+
+    def __init__(self):
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._pos = 0
+        self.started = False
+        self.closed = False
+
+    def feed(self, chunk: str) -> list:
+        self._buffer += chunk
+        items = []
+
+        if not self.started:
+            start = self._buffer.find("[")
+            if start < 0:
+                return items
+            self.started = True
+            self._pos = start + 1
+
+        while not self.closed:
+            while self._pos < len(self._buffer) and self._buffer[self._pos] in " \t\r\n,":
+                self._pos += 1
+            if self._pos >= len(self._buffer):
+                break
+            if self._buffer[self._pos] == "]":
+                self.closed = True
+                break
+            try:
+                item, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                break  # element still incomplete
+            if end >= len(self._buffer) and not isinstance(item, (str, list, dict)):
+                break  # a bare number or literal may still be growing
+            items.append(item)
+            self._pos = end
+
+        return items
+
+
+question_pools = QuestionPools(generate_question_set)
 
-        except ValueError as ve:
-            logging.error(f"Validation error: {ve}\nResponse:\n{raw_output}")
-            raise HTTPException(status_code=500, detail=str(ve))
+
+@router.post("/generate-questions")
+async def generate_questions(req: JobRequest):
+    try:
+        questions = await question_pools.get(req.title)
+        return {"questions": questions}
+
+    except ValueError as ve:
+        raise HTTPException(status_code=500, detail=str(ve))
 
     except OpenAIError as oe:
         logging.error(f"OpenAI API error: {oe}")
@@ -76,3 +141,59 @@ async def generate_questions(req: JobRequest):
     except Exception:
         logging.exception("Unexpected server error")
         raise HTTPException(status_code=500, detail="Internal server error.")
+
+
+@router.post("/generate-questions/stream")
+async def generate_questions_stream(req: JobRequest):
+    """
+    Emits one `question` event per question as soon as its JSON element is
+    complete, then `done`, or `error` if the response fails the same checks as
+    /generate-questions. Pooled sets are replayed immediately; a streamed set
+    that validates is added to the pool.
+    """
+    async def events():
+        pooled = question_pools.take(req.title)
+        if pooled is not None:
+            for index, question in enumerate(pooled):
+                yield sse_event("question", {"index": index, "question": question})
+            yield sse_event("done", {"count": len(pooled)})
+            return
+
+        reader = _JsonArrayReader()
+        questions = []
+        try:
+            async for delta in stream_chat_completion(
+                client,
+                model="gpt-4o",
+                messages=[{"role": "user", "content": _questions_prompt(req.title)}],
+                temperature=0.7,
+                max_tokens=200,
+            ):
+                for question in reader.feed(delta):
+                    if len(questions) >= 10:
+                        raise ValueError("Expected exactly 10 questions.")
+                    yield sse_event("question", {"index": len(questions), "question": question})
+                    questions.append(question)
+
+            if not reader.started:
+                raise ValueError("Response is not a JSON array.")
+            if not reader.closed:
+                raise ValueError("OpenAI returned invalid JSON.")
+            _validate_questions(questions)
+
+            question_pools.add(req.title, questions)
+            yield sse_event("done", {"count": len(questions)})
+
+        except ValueError as ve:
+            logging.error(f"Validation error while streaming questions: {ve}")
+            yield sse_event("error", {"detail": str(ve)})
+
+        except OpenAIError as oe:
+            logging.error(f"OpenAI API error: {oe}")
+            yield sse_event("error", {"detail": "Error from OpenAI API."})
+
+        except Exception:
+            logging.exception("Unexpected server error")
+            yield sse_event("error", {"detail": "Internal server error."})
+
+    return sse_response(events())
@@ -1,28 +1,148 @@
-from fastapi import APIRouter, HTTPException
-from sqlalchemy import create_engine, text
+import json
 import os
-from fastapi import Depends
-from sqlalchemy.orm import Session
-from server.database import get_db
-from dotenv import load_dotenv
+from typing import Optional
 
-load_dotenv()
+from fastapi import APIRouter, HTTPException, Query
+from sqlalchemy import text
+from fastapi import Depends
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+from server.database import AsyncReadSessionLocal, get_async_read_db
+from server.utils.pagination import decode_key_cursor, encode_key_cursor
 
 router = APIRouter()
 
-DB_URL = f"postgresql://{os.getenv('DB_USER')}:{os.getenv('DB_PASSWORD')}@{os.getenv('DB_HOST')}:{os.getenv('DB_PORT')}/{os.getenv('DB_NAME')}"
-engine = create_engine(DB_URL, pool_pre_ping=True)
+# Page size for paged /jobs requests that pass a cursor but no limit
+JOBS_PAGE_SIZE = int(os.getenv("JOBS_PAGE_SIZE", "500"))
+JOBS_MAX_PAGE_SIZE = 5000
+# Rows fetched per round trip from the server-side cursor while exporting
+JOBS_EXPORT_BATCH = int(os.getenv("JOBS_EXPORT_BATCH", "1000"))
+
+
+class JobFilters:
+    """Optional filters shared by /jobs and the export route, applied in SQL."""
+
+    def __init__(
+        self,
+        title: Optional[str] = None,
+        location: Optional[str] = None,
+        min_salary: Optional[float] = Query(None, ge=0),
+        max_salary: Optional[float] = Query(None, ge=0),
+    ):
+        self.title = title
+        self.location = location
+        self.min_salary = min_salary
+        self.max_salary = max_salary
+
+    def where(self) -> tuple[str, dict]:
+        clauses = ['"salaryMin" IS NOT NULL', '"salaryMax" IS NOT NULL']
+        params = {}
+        if self.title:
+            clauses.append('"title" ILIKE :title')
+            params["title"] = f"%{_escape_like(self.title.strip())}%"
+        if self.location:
+            clauses.append('"location" ILIKE :location')
+            params["location"] = f"%{_escape_like(self.location.strip())}%"
+        if self.min_salary is not None:
+            clauses.append('"salaryMax" >= CAST(:minSalary AS float8)')
+            params["minSalary"] = self.min_salary
+        if self.max_salary is not None:
+            clauses.append('"salaryMin" <= CAST(:maxSalary AS float8)')
+            params["maxSalary"] = self.max_salary
+        return " AND ".join(clauses), params
+
+
+def _escape_like(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
 
 @router.get("/jobs")
-def get_jobs(db: Session = Depends(get_db)):
+async def get_jobs(
+    cursor: Optional[str] = None,
+    limit: Optional[int] = Query(None, ge=1, le=JOBS_MAX_PAGE_SIZE),
+    filters: JobFilters = Depends(),
+    db: AsyncSession = Depends(get_async_read_db)
+):
+    """
+    Every salaried job by default. Passing `cursor` or `limit` switches to
+    paged mode: one page in id order, with the row ids and a `nextCursor` to
+    pass back for the next page.
+    """
+    where, params = filters.where()
+    if cursor is None and limit is None:
+        try:
+            result = await db.execute(
+                text(f"""
+                  SELECT
+                    title, location, "salaryMin", "salaryMax"
+                  FROM "Jobs"
+                  WHERE {where}
+                """),
+                params
+            )
+            return {"jobs": [dict(r._mapping) for r in result.all()]}
+        except Exception as e:
+            print("🔥 /jobs failed:", e)
+            raise HTTPException(500, detail=str(e))
+
+    limit = limit or JOBS_PAGE_SIZE
+    if cursor:
+        where += ' AND "id" > :after'
+        params["after"] = decode_key_cursor(cursor)
+
     try:
-        rows = db.execute(text("""
-          SELECT 
-            title, location, "salaryMin", "salaryMax"
-          FROM "Jobs" 
-          WHERE "salaryMin" IS NOT NULL AND "salaryMax" IS NOT NULL
-        """)).all()
-        return {"jobs": [dict(r._mapping) for r in rows]}
+        result = await db.execute(
+            text(f"""
+              SELECT
+                "id", title, location, "salaryMin", "salaryMax"
+              FROM "Jobs"
+              WHERE {where}
+              ORDER BY "id"
+              LIMIT :limit
+            """),
+            {**params, "limit": limit + 1}
+        )
+        rows = [dict(r._mapping) for r in result.all()]
     except Exception as e:
         print("🔥 /jobs failed:", e)
         raise HTTPException(500, detail=str(e))
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_key_cursor(rows[-1]["id"])
+    return {"jobs": rows, "nextCursor": next_cursor}
+
+
+@router.get("/jobs/export")
+async def export_jobs(filters: JobFilters = Depends()):
+    """
+    Every matching job as newline-delimited JSON, read through a server-side
+    cursor so memory stays flat however large the table is. The body outlives
+    request dependencies, so it opens its own session.
+    """
+    where, params = filters.where()
+
+    async def lines():
+        async with AsyncReadSessionLocal() as db:
+            try:
+                result = await db.stream(
+                    text(f"""
+                      SELECT
+                        "id", title, location, "salaryMin", "salaryMax"
+                      FROM "Jobs"
+                      WHERE {where}
+                    """),
+                    params
+                )
+                async for partition in result.partitions(JOBS_EXPORT_BATCH):
+                    yield "".join(json.dumps(dict(r._mapping), default=str) + "\n" for r in partition)
+            except Exception as e:
+                print("🔥 /jobs/export failed:", e)
+                yield json.dumps({"error": "Export interrupted"}) + "\n"
+
+    return StreamingResponse(
+        lines(),
+        media_type="application/x-ndjson",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
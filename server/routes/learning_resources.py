@@ -1,4 +1,5 @@
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel
 from sqlalchemy.orm import Session
 from server.database import get_db
@@ -6,18 +7,26 @@ from server.utils.auth import get_current_user
 from server.models.user import User
 from server.models.resume import Resume
 from server.services.skills import extract_skills_from_resume
+from server.services.resume_skills import get_resume_skills
 from server.services.career_path import get_top_matching_roles
-import requests
+from server.services.coursera import fetch_courses_concurrently
+from server.services.course_summaries import summary_key, get_cached_summaries, store_summaries
+from server.services.openai_client import get_async_client, create_chat_completion
 from random import shuffle
 import langid
-from openai import OpenAI
+import asyncio
 import json
+import os
 import re
 
-client = OpenAI()
+client = get_async_client()
 
 router = APIRouter()
 
+MAX_COURSES = 10
+NO_SUMMARY = "No condensed summary available."
+SUMMARY_BATCH_SIZE = int(os.getenv("SUMMARY_BATCH_SIZE", "10"))
+
 
 def rotate_skills_into_queries(skills: list[str], per_query: int = 2, max_queries: int = 6) -> list[str]:
     shuffle(skills)
@@ -35,19 +44,23 @@ def rotate_skills_into_queries(skills: list[str], per_query: int = 2, max_querie
 
 
 @router.get("/learning-resources")
-def get_learning_resources(
+async def get_learning_resources(
     user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
-    resume = (
-        db.query(Resume)
-        .filter(Resume.user_id == user.id)
-        .order_by(Resume.updated_at.desc())
-        .first()
-    )
-    if not resume:
+    def load_latest_resume_skills():
+        resume = (
+            db.query(Resume)
+            .filter(Resume.user_id == user.id)
+            .order_by(Resume.updated_at.desc())
+            .first()
+        )
+        return get_resume_skills(resume, db) if resume else None
+
+    skills = await run_in_threadpool(load_latest_resume_skills)
+    if skills is None:
         raise HTTPException(status_code=404, detail="No resume found for user")
-    return _generate_course_recommendations(resume.content or "", db)
+    return await _generate_course_recommendations(skills, db)
 
 
 class LearningRequest(BaseModel):
@@ -55,20 +68,20 @@ class LearningRequest(BaseModel):
 
 
 @router.post("/learning-resources")
-def get_learning_resources_from_resume(
+async def get_learning_resources_from_resume(
     payload: LearningRequest,
     user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
-    return _generate_course_recommendations(payload.resume, db)
+    skills = await run_in_threadpool(extract_skills_from_resume, payload.resume or "")
+    return await _generate_course_recommendations(skills, db)
 
 
-def _generate_course_recommendations(resume_text: str, db: Session):
-    skills = extract_skills_from_resume(resume_text or "")
+async def _generate_course_recommendations(skills: list[str], db: Session):
     if not skills:
         raise HTTPException(status_code=400, detail="No skills found in resume")
 
-    top_roles = get_top_matching_roles(skills, db)
+    top_roles = await run_in_threadpool(get_top_matching_roles, skills, db)
     print("🎯 Top roles:", top_roles)
 
     relevant_skills = skills[:12]
@@ -77,22 +90,9 @@ def _generate_course_recommendations(resume_text: str, db: Session):
     print("🔍 Extracted skills:", skills)
     print("🔁 Coursera queries:", queries)
 
-    seen_ids = set()
-    all_courses = []
-
-    for query in queries:
-        print(f"🚀 Querying Coursera: {query}")
-        courses = fetch_courses_from_coursera(query)
-
-        for course in courses:
-            if not is_valid_course(course, seen_ids):
-                continue
-            formatted = format_course(course)
-            seen_ids.add(formatted["id"])
-            all_courses.append(formatted)
-
-        if len(all_courses) >= 10:
-            break
+    selected = await run_in_threadpool(_collect_courses, queries)
+    summaries = await summarize_courses(selected, db)
+    all_courses = [format_course(course, summaries[course["id"]]) for course in selected]
 
     return {
         "courses": all_courses,
@@ -100,29 +100,19 @@ def _generate_course_recommendations(resume_text: str, db: Session):
     }
 
 
-def fetch_courses_from_coursera(query: str) -> list[dict]:
-    try:
-        response = requests.get(
-            "https://api.coursera.org/api/courses.v1",
-            params={
-                "q": "search",
-                "query": query,
-                "limit": 10,
-                "fields": "id,name,slug,description",
-            },
-        )
-        response.raise_for_status()
-        courses = response.json().get("elements", [])
-
-        return [
-            course for course in courses
-            if course.get("description") and len(course["description"].strip()) > 40
-        ]
+def _collect_courses(queries: list[str]) -> list[dict]:
+    seen_ids = set()
+    selected = []
 
-    except Exception as e:
-        print(f"❌ Coursera query failed: {query} — {e}")
-        return []
+    print(f"🚀 Querying Coursera concurrently: {len(queries)} queries")
+    for courses in fetch_courses_concurrently(queries, enough=lambda: len(selected) >= MAX_COURSES):
+        for course in courses:
+            if not is_valid_course(course, seen_ids):
+                continue
+            seen_ids.add(course["id"])
+            selected.append(course)
 
+    return selected
 
 
 def is_valid_course(course: dict, seen_ids: set) -> bool:
@@ -144,9 +134,7 @@ def is_valid_course(course: dict, seen_ids: set) -> bool:
 
     return True
 
-def format_course(course: dict) -> dict:
-    full_description = course.get("description", "No description provided.").strip()
-
+def trim_description(full_description: str) -> str:
     # Soft cap to ~1000 characters, cut at nearest sentence boundary if possible
     if len(full_description) > 600:
         sentences = full_description.split(".")
@@ -155,27 +143,93 @@ def format_course(course: dict) -> dict:
             if len(trimmed) + len(sentence) + 1 > 600:
                 break
             trimmed += sentence.strip() + ". "
-        description = trimmed.strip()
-    else:
-        description = full_description
+        return trimmed.strip()
+    return full_description
+
+
+async def summarize_courses(courses: list[dict], db: Session) -> dict[str, str]:
+    """Return a condensed summary per course id, calling the model only for cache misses."""
+    keys = {
+        course["id"]: summary_key(course["id"], trim_description(_full_description(course)))
+        for course in courses
+    }
+    cached = await run_in_threadpool(get_cached_summaries, list(keys.values()), db)
+
+    summaries = {}
+    pending = {}
+    for course in courses:
+        key = keys[course["id"]]
+        if key in cached:
+            summaries[course["id"]] = cached[key]
+        else:
+            pending[course["id"]] = trim_description(_full_description(course))
+
+    print(f"🗂️ Summary cache: {len(cached)} hits, {len(pending)} misses")
+
+    batches = await asyncio.gather(
+        *(condense_descriptions(batch) for batch in _in_batches(pending, SUMMARY_BATCH_SIZE))
+    )
+
+    fresh = {}
+    for batch in batches:
+        for course_id, (condensed, validated) in batch.items():
+            summaries[course_id] = condensed
+            # Unvalidated fallbacks are served once but never shared through the cache
+            if validated:
+                fresh[keys[course_id]] = condensed
+
+    await run_in_threadpool(store_summaries, fresh, db)
+    return summaries
+
+
+def _in_batches(items: dict[str, str], size: int):
+    batch = {}
+    for key, value in items.items():
+        batch[key] = value
+        if len(batch) >= size:
+            yield batch
+            batch = {}
+    if batch:
+        yield batch
+
+
+def _full_description(course: dict) -> str:
+    return course.get("description", "No description provided.").strip()
 
-    condensed = condense_description(description)
 
+def format_course(course: dict, condensed: str) -> dict:
     return {
         "id": course["id"],
         "title": course.get("name", "No Title"),
-        "description": full_description,
+        "description": _full_description(course),
         "shortDescription": condensed,
         "url": f"https://www.coursera.org/learn/{course['slug']}",
         "platform": "Coursera",
     }
 
-def condense_description(text: str) -> str:
+
+SUMMARY_INSTRUCTIONS = (
+    "✅ Requirements:\n"
+    "- Be brief, technical, and insightful\n"
+    "- Use clear, plain language\n"
+    "- Focus on practical takeaways for developers\n\n"
+    "❌ Do NOT:\n"
+    "- Use markdown, bullet points, titles, or emojis\n"
+    "- Include course metadata, instructor names, dates, or structural descriptions\n\n"
+)
+
+
+async def condense_description(text: str) -> tuple[str, bool]:
+    """
+    The summary and whether it passed validation; when the model's JSON can't
+    be parsed, the truncated raw output is returned unvalidated.
+    """
     if not text or len(text.strip()) < 40:
-        return "No condensed summary available."
+        return NO_SUMMARY, False
 
     try:
-        response = client.chat.completions.create(
+        response = await create_chat_completion(
+            client,
             model="gpt-4.1",
             temperature=0.5,
             max_tokens=200,
@@ -192,13 +246,7 @@ def condense_description(text: str) -> str:
                     "role": "user",
                     "content": (
                         "Summarize the following text into a concise, developer-focused summary of **5 sentences**.\n\n"
-                        "✅ Requirements:\n"
-                        "- Be brief, technical, and insightful\n"
-                        "- Use clear, plain language\n"
-                        "- Focus on practical takeaways for developers\n\n"
-                        "❌ Do NOT:\n"
-                        "- Use markdown, bullet points, titles, or emojis\n"
-                        "- Include course metadata, instructor names, dates, or structural descriptions\n\n"
+                        f"{SUMMARY_INSTRUCTIONS}"
                         "⚠️ The final output MUST be a valid JSON object like this:\n"
                         '{ "summary": "Your 5 sentence summary here." }\n\n'
                         "TEXT TO SUMMARIZE:\n\n"
@@ -222,19 +270,109 @@ def condense_description(text: str) -> str:
             if not summary:
                 raise ValueError("Missing 'summary' in JSON.")
 
-            if len(summary) > 600:
-                print(f"⚠️ Summary too long: {len(summary)} characters. Truncating.")
-                summary = summary[:597].rsplit(" ", 1)[0] + "..."
-
-            return summary
+            return _cap_summary(summary), True
 
         except ValueError as e:
             print(f"⚠️ Failed to parse JSON, falling back to raw truncation: {e}")
-            if len(raw_output) > 600:
-                raw_output = raw_output[:597].rsplit(" ", 1)[0] + "..."
-            return raw_output
+            return _truncate(raw_output), False
 
     except Exception as e:
         print(f"❌ OpenAI summarization failed — {e}")
-        return "No condensed summary available."
+        return NO_SUMMARY, False
+
+
+async def condense_descriptions(texts: dict[str, str]) -> dict[str, tuple[str, bool]]:
+    """
+    Summarize several course descriptions in one model call. The response is a
+    JSON object keyed by course id; ids that are missing or fail validation are
+    retried one at a time with condense_description. Each summary comes with
+    its validated flag, as from condense_description.
+    """
+    if len(texts) == 1:
+        ((course_id, text),) = texts.items()
+        return {course_id: await condense_description(text)}
+
+    summaries: dict[str, tuple[str, bool]] = {}
+    batchable = {}
+    for course_id, text in texts.items():
+        if not text or len(text.strip()) < 40:
+            summaries[course_id] = (NO_SUMMARY, False)
+        else:
+            batchable[course_id] = text
+
+    if batchable:
+        parsed = await _request_batch_summaries(batchable)
+        retry = [course_id for course_id in batchable if course_id not in parsed]
+        if retry:
+            print(f"⚠️ Batch summaries missing or invalid for {retry}, retrying individually")
+        retried = await asyncio.gather(*(condense_description(batchable[course_id]) for course_id in retry))
+
+        summaries.update((course_id, (summary, True)) for course_id, summary in parsed.items())
+        summaries.update(zip(retry, retried))
+
+    return summaries
+
+
+async def _request_batch_summaries(texts: dict[str, str]) -> dict[str, str]:
+    courses_block = "\n\n".join(
+        f"COURSE ID: {course_id}\nTEXT:\n{text}" for course_id, text in texts.items()
+    )
+
+    try:
+        response = await create_chat_completion(
+            client,
+            model="gpt-4.1",
+            temperature=0.5,
+            max_tokens=min(200 * len(texts), 4000),
+            response_format={"type": "json_object"},
+            messages=[
+                {
+                    "role": "system",
+                    "content": (
+                        "You are a professional summarization expert. "
+                        "Your summaries must follow user instructions exactly and NEVER exceed 5 sentences."
+                    )
+                },
+                {
+                    "role": "user",
+                    "content": (
+                        "Summarize each of the following course texts into a concise, "
+                        "developer-focused summary of **5 sentences**.\n\n"
+                        f"{SUMMARY_INSTRUCTIONS}"
+                        "⚠️ The final output MUST be a valid JSON object with one entry per course id, like this:\n"
+                        '{ "summaries": { "<course id>": "Your 5 sentence summary here." } }\n\n'
+                        "TEXTS TO SUMMARIZE:\n\n"
+                        f"{courses_block}"
+                    )
+                }
+            ]
+        )
+
+        raw_output = response.choices[0].message.content.strip()
+        data = json.loads(raw_output)
+        items = data.get("summaries") if isinstance(data, dict) else None
+        if not isinstance(items, dict):
+            raise ValueError("Missing 'summaries' object in JSON.")
+
+    except Exception as e:
+        print(f"⚠️ Batch summarization failed, falling back to single calls — {e}")
+        return {}
+
+    parsed = {}
+    for course_id in texts:
+        summary = items.get(course_id)
+        if isinstance(summary, str) and len(summary.strip()) >= 10:
+            parsed[course_id] = _cap_summary(summary.strip())
+    return parsed
+
+
+def _cap_summary(summary: str) -> str:
+    if len(summary) > 600:
+        print(f"⚠️ Summary too long: {len(summary)} characters. Truncating.")
+    return _truncate(summary)
+
 
+def _truncate(text: str) -> str:
+    if len(text) > 600:
+        return text[:597].rsplit(" ", 1)[0] + "..."
+    return text
@@ -1,11 +1,13 @@
 from sqlalchemy import text
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel, Field
 from sqlalchemy.orm import Session
 from typing import List
-from server.database import get_db
+from server.database import get_db, SessionLocal
 from server.services.skills import extract_skills_from_resume
-from server.services.career_path import generate_career_suggestions
+from server.services.career_path import generate_career_suggestions, stream_career_suggestions
+from server.utils.sse import sse_event, sse_response
 
 router = APIRouter()
 
@@ -25,27 +27,67 @@ class SuggestionResponse(BaseModel):
     status_code=status.HTTP_200_OK,
     summary="Generate and store AI career suggestions"
 )
-def career_suggestions(
+async def career_suggestions(
     payload: SuggestionRequest,
     db: Session = Depends(get_db),
 ):
-    skills = extract_skills_from_resume(payload.resume)
+    skills = await run_in_threadpool(extract_skills_from_resume, payload.resume)
     if not skills:
         raise HTTPException(400, "No skills could be extracted from resume")
 
-    ai_suggestions = generate_career_suggestions(payload.resume, db)
+    ai_suggestions = await generate_career_suggestions(payload.resume, db)
 
+    roles_only = [s["role"] for s in ai_suggestions]
+    await run_in_threadpool(_save_suggestions, db, payload.userId, roles_only, skills)
+
+    return {"skillsExtracted": skills, "suggestedRoles": ai_suggestions}
+
+
+@router.post(
+    "/career-suggestions/stream",
+    summary="Stream AI career suggestions as server-sent events"
+)
+async def career_suggestions_stream(payload: SuggestionRequest):
+    """
+    Emits `skills` once, then one `suggestion` event per parsed role as soon as
+    its line completes, then `done` after the suggestions are stored. Failures
+    after the stream has started are reported as an `error` event. The body
+    outlives request dependencies, so it opens its own session.
+    """
+    skills = await run_in_threadpool(extract_skills_from_resume, payload.resume)
+    if not skills:
+        raise HTTPException(400, "No skills could be extracted from resume")
+
+    async def events():
+        yield sse_event("skills", {"skillsExtracted": skills})
+        db = SessionLocal()
+        try:
+            roles_only = []
+            async for suggestion in stream_career_suggestions(payload.resume, db):
+                roles_only.append(suggestion["role"])
+                yield sse_event("suggestion", suggestion)
+
+            await run_in_threadpool(_save_suggestions, db, payload.userId, roles_only, skills)
+            yield sse_event("done", {"count": len(roles_only)})
+
+        except Exception as e:
+            print(f"🔥 Streaming career suggestions failed — {e}")
+            yield sse_event("error", {"detail": "Failed to generate career suggestions."})
+
+        finally:
+            await run_in_threadpool(db.close)
+
+    return sse_response(events())
+
+
+def _save_suggestions(db: Session, user_id: str, roles: List[str], skills: List[str]):
     insert_stmt = text("""
         INSERT INTO careerSuggestions (userId, suggestedRoles, skillsExtracted)
         VALUES (:userId, :roles, :skills)
     """)
 
-    roles_only = [s["role"] for s in ai_suggestions]
-
     db.execute(
         insert_stmt,
-        {"userId": payload.userId, "roles": roles_only, "skills": skills}
+        {"userId": user_id, "roles": roles, "skills": skills}
     )
     db.commit()
-
-    return {"skillsExtracted": skills, "suggestedRoles": ai_suggestions}
@@ -1,12 +1,16 @@
-from openai import OpenAI
-from sqlalchemy import text
 import os
+from typing import AsyncIterator, Optional
+
+from fastapi.concurrency import run_in_threadpool
+
+from server.services.openai_client import get_async_client, create_chat_completion, stream_chat_completion
+from server.services.role_matching import top_matching_roles
 
 api_key_4o = os.getenv("OPENAI_API_KEY_4O")
 if not api_key_4o:
     raise RuntimeError("Missing required environment variable: OPENAI_API_KEY_4O")
 
-client = OpenAI(api_key=api_key_4o)
+client = get_async_client(api_key_4o)
 
 def get_user_skills_from_resume(resume_content: str) -> list[str]:
     """Extract skills from 'Skills' section of resume markdown."""
@@ -15,25 +19,10 @@ def get_user_skills_from_resume(resume_content: str) -> list[str]:
 
 def get_top_matching_roles(user_skills: list[str], db) -> list[str]:
     """Find top roles from the DB based on shared skills."""
+    return top_matching_roles(user_skills, db, k=5)
 
-    raw_sql = """
-        SELECT roleTitle, requiredSkills
-        FROM rolesAndSkills
-    """
-    query = text(raw_sql)
-    rows = db.execute(query).fetchall()
-
-    scored_roles = []
-    for row in rows:
-        role_skills = row.requiredskills
-        match_score = len(set(user_skills) & set(role_skills)) / max(len(role_skills), 1)
-        scored_roles.append((row.roletitle, match_score))
-
-    scored_roles.sort(key=lambda x: x[1], reverse=True)
-    return [title for title, _ in scored_roles[:5]]
-
-def ask_openai_for_suggestions(skills: list[str], roles: list[str], user_name: str) -> list[dict]:
-    prompt = (
+def _suggestions_prompt(skills: list[str], roles: list[str], user_name: str) -> str:
+    return (
         f"The user has the following skills:\n\n{', '.join(skills)}\n\n"
         f"Here are some potential job roles: {', '.join(roles)}.\n\n"
         "**Choose the 5 most fitting roles** and explain each in 100 words (about 500 words total).\n"
@@ -42,9 +31,24 @@ def ask_openai_for_suggestions(skills: list[str], roles: list[str], user_name: s
         "Do not include any extra formatting, headings, or introductions. Only return the list."
     )
 
-    response = client.chat.completions.create(
+
+def parse_suggestion_line(line: str) -> Optional[dict]:
+    """Parse one '1. [Role]: [Explanation]' line; anything else is skipped."""
+    if line.strip() and line[0].isdigit():
+        parts = line.split(":", 1)
+        if len(parts) == 2:
+            return {
+                "role": parts[0].split(".")[1].strip(),
+                "explanation": parts[1].strip()
+            }
+    return None
+
+
+async def ask_openai_for_suggestions(skills: list[str], roles: list[str], user_name: str) -> list[dict]:
+    response = await create_chat_completion(
+        client,
         model="gpt-4o",
-        messages=[{"role": "user", "content": prompt}],
+        messages=[{"role": "user", "content": _suggestions_prompt(skills, roles, user_name)}],
         temperature=0.5,
         max_tokens=600,
     )
@@ -54,18 +58,50 @@ def ask_openai_for_suggestions(skills: list[str], roles: list[str], user_name: s
 
     results = []
     for line in lines:
-        if line.strip() and line[0].isdigit():
-            parts = line.split(":", 1)
-            if len(parts) == 2:
-                results.append({
-                    "role": parts[0].split(".")[1].strip(),
-                    "explanation": parts[1].strip()
-                })
+        suggestion = parse_suggestion_line(line)
+        if suggestion:
+            results.append(suggestion)
     return results
 
 
-def generate_career_suggestions(resume_content: str, db):
-    user_skills = get_user_skills_from_resume(resume_content)
-    matched_roles = get_top_matching_roles(user_skills, db)
-    openai_suggestions = ask_openai_for_suggestions(user_skills, matched_roles, user_name=resume_content)
+async def stream_openai_suggestions(
+    skills: list[str], roles: list[str], user_name: str
+) -> AsyncIterator[dict]:
+    """Same prompt and parse rules as ask_openai_for_suggestions, yielding each line as it completes."""
+    buffer = ""
+    started = False
+    async for delta in stream_chat_completion(
+        client,
+        model="gpt-4o",
+        messages=[{"role": "user", "content": _suggestions_prompt(skills, roles, user_name)}],
+        temperature=0.5,
+        max_tokens=600,
+    ):
+        buffer += delta
+        if not started:
+            # The batch parser strips the whole reply, so leading whitespace never counts
+            buffer = buffer.lstrip()
+            started = bool(buffer)
+        *lines, buffer = buffer.split("\n")
+        for line in lines:
+            suggestion = parse_suggestion_line(line)
+            if suggestion:
+                yield suggestion
+
+    suggestion = parse_suggestion_line(buffer.rstrip())
+    if suggestion:
+        yield suggestion
+
+
+async def generate_career_suggestions(resume_content: str, db):
+    user_skills = await run_in_threadpool(get_user_skills_from_resume, resume_content)
+    matched_roles = await run_in_threadpool(get_top_matching_roles, user_skills, db)
+    openai_suggestions = await ask_openai_for_suggestions(user_skills, matched_roles, user_name=resume_content)
     return openai_suggestions
+
+
+async def stream_career_suggestions(resume_content: str, db) -> AsyncIterator[dict]:
+    user_skills = await run_in_threadpool(get_user_skills_from_resume, resume_content)
+    matched_roles = await run_in_threadpool(get_top_matching_roles, user_skills, db)
+    async for suggestion in stream_openai_suggestions(user_skills, matched_roles, user_name=resume_content):
+        yield suggestion
@@ -0,0 +1,135 @@
+import os
+from datetime import datetime, timedelta, timezone
+
+from dotenv import load_dotenv
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from server.utils.cache import TTLCache, content_hash
+
+load_dotenv()
+
+# Summaries older than this are treated as missing and pruned from Postgres
+SUMMARY_CACHE_TTL_DAYS = int(os.getenv("SUMMARY_CACHE_TTL_DAYS", "30"))
+# Row cap for the Postgres tier; least recently used rows beyond it are evicted
+SUMMARY_CACHE_MAX_ROWS = int(os.getenv("SUMMARY_CACHE_MAX_ROWS", "50000"))
+# Entry cap for the in-process LRU tier
+SUMMARY_MEMORY_CACHE_SIZE = int(os.getenv("SUMMARY_MEMORY_CACHE_SIZE", "2000"))
+# Prune the Postgres tier after this many writes from this process
+SUMMARY_PRUNE_EVERY = int(os.getenv("SUMMARY_PRUNE_EVERY", "200"))
+
+_memory = TTLCache(maxsize=SUMMARY_MEMORY_CACHE_SIZE, ttl=SUMMARY_CACHE_TTL_DAYS * 86400)
+_writes_since_prune = 0
+
+SummaryKey = tuple[str, str]
+
+
+def summary_key(course_id: str, description: str) -> SummaryKey:
+    """Content-addressed key: a changed description never hits a stale summary."""
+    return course_id, content_hash(description)
+
+
+def get_cached_summaries(keys: list[SummaryKey], db: Session) -> dict[SummaryKey, str]:
+    found: dict[SummaryKey, str] = {}
+    missing: list[SummaryKey] = []
+
+    for key in keys:
+        summary = _memory.get(key)
+        if summary is None:
+            missing.append(key)
+        else:
+            found[key] = summary
+
+    if not missing:
+        return found
+
+    try:
+        cutoff = datetime.now(timezone.utc) - timedelta(days=SUMMARY_CACHE_TTL_DAYS)
+        rows = db.execute(
+            text("""
+                SELECT "course_id", "description_hash", "summary"
+                FROM "course_summaries"
+                WHERE "course_id" = ANY(:courseIds) AND "created_at" > :cutoff
+            """),
+            {"courseIds": [course_id for course_id, _ in missing], "cutoff": cutoff}
+        ).fetchall()
+
+        wanted = set(missing)
+        hits = []
+        for course_id, description_hash, summary in rows:
+            key = (course_id, description_hash)
+            if key in wanted:
+                found[key] = summary
+                _memory.set(key, summary)
+                hits.append({"courseId": course_id, "descriptionHash": description_hash})
+
+        if hits:
+            db.execute(
+                text("""
+                    UPDATE "course_summaries" SET "last_used_at" = now()
+                    WHERE "course_id" = :courseId AND "description_hash" = :descriptionHash
+                """),
+                hits
+            )
+            db.commit()
+
+    except Exception as e:
+        db.rollback()
+        print(f"⚠️ Summary cache lookup failed — {e}")
+
+    return found
+
+
+def store_summaries(summaries: dict[SummaryKey, str], db: Session) -> None:
+    global _writes_since_prune
+
+    if not summaries:
+        return
+
+    for key, summary in summaries.items():
+        _memory.set(key, summary)
+
+    try:
+        db.execute(
+            text("""
+                INSERT INTO "course_summaries" ("course_id", "description_hash", "summary", "created_at", "last_used_at")
+                VALUES (:courseId, :descriptionHash, :summary, now(), now())
+                ON CONFLICT ("course_id", "description_hash")
+                DO UPDATE SET "summary" = EXCLUDED."summary", "created_at" = now(), "last_used_at" = now()
+            """),
+            [
+                {"courseId": course_id, "descriptionHash": description_hash, "summary": summary}
+                for (course_id, description_hash), summary in summaries.items()
+            ]
+        )
+        db.commit()
+
+        _writes_since_prune += len(summaries)
+        if _writes_since_prune >= SUMMARY_PRUNE_EVERY:
+            _writes_since_prune = 0
+            _prune(db)
+
+    except Exception as e:
+        db.rollback()
+        print(f"⚠️ Summary cache write failed — {e}")
+
+
+def _prune(db: Session) -> None:
+    cutoff = datetime.now(timezone.utc) - timedelta(days=SUMMARY_CACHE_TTL_DAYS)
+    db.execute(
+        text('DELETE FROM "course_summaries" WHERE "created_at" <= :cutoff'),
+        {"cutoff": cutoff}
+    )
+    db.execute(
+        text("""
+            DELETE FROM "course_summaries"
+            WHERE ("course_id", "description_hash") IN (
+                SELECT "course_id", "description_hash"
+                FROM "course_summaries"
+                ORDER BY "last_used_at" DESC
+                OFFSET :maxRows
+            )
+        """),
+        {"maxRows": SUMMARY_CACHE_MAX_ROWS}
+    )
+    db.commit()
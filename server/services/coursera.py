@@ -0,0 +1,143 @@
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed, TimeoutError as FuturesTimeoutError
+from typing import Callable, Iterator
+
+import requests
+from requests.adapters import HTTPAdapter
+from dotenv import load_dotenv
+
+from server.utils.cache import TTLCache
+
+load_dotenv()
+
+COURSERA_API_URL = "https://api.coursera.org/api/courses.v1"
+
+# Per-request (connect, read) timeout and overall deadline for a fan-out, in seconds
+COURSERA_CONNECT_TIMEOUT = float(os.getenv("COURSERA_CONNECT_TIMEOUT", "3"))
+COURSERA_READ_TIMEOUT = float(os.getenv("COURSERA_READ_TIMEOUT", "6"))
+COURSERA_DEADLINE = float(os.getenv("COURSERA_DEADLINE", "8"))
+
+# Upper bound on concurrent queries and on pooled keep-alive connections
+COURSERA_MAX_CONNECTIONS = int(os.getenv("COURSERA_MAX_CONNECTIONS", "6"))
+
+# Results are fresh for COURSERA_CACHE_TTL seconds, then served stale for up to
+# COURSERA_CACHE_STALE_TTL more while a background refresh replaces them
+COURSERA_CACHE_TTL = float(os.getenv("COURSERA_CACHE_TTL", "3600"))
+COURSERA_CACHE_STALE_TTL = float(os.getenv("COURSERA_CACHE_STALE_TTL", "86400"))
+COURSERA_CACHE_SIZE = int(os.getenv("COURSERA_CACHE_SIZE", "1000"))
+# Background refreshes run on their own workers and connections, so a burst of
+# stale entries never holds the connections user-facing fetches wait on
+COURSERA_REFRESH_CONNECTIONS = int(os.getenv("COURSERA_REFRESH_CONNECTIONS", "2"))
+
+_session = requests.Session()
+_session.mount(
+    "https://",
+    HTTPAdapter(pool_connections=1, pool_maxsize=COURSERA_MAX_CONNECTIONS, pool_block=True),
+)
+_refresh_session = requests.Session()
+_refresh_session.mount(
+    "https://",
+    HTTPAdapter(pool_connections=1, pool_maxsize=COURSERA_REFRESH_CONNECTIONS, pool_block=True),
+)
+_executor = ThreadPoolExecutor(max_workers=COURSERA_MAX_CONNECTIONS, thread_name_prefix="coursera")
+_refresh_executor = ThreadPoolExecutor(max_workers=COURSERA_REFRESH_CONNECTIONS, thread_name_prefix="coursera-refresh")
+
+_query_cache = TTLCache(maxsize=COURSERA_CACHE_SIZE, ttl=COURSERA_CACHE_TTL + COURSERA_CACHE_STALE_TTL)
+_refreshing: set[str] = set()
+_refreshing_lock = threading.Lock()
+
+
+def normalize_query(query: str) -> str:
+    """Case and spacing don't change Coursera's results, so they don't change the key."""
+    return " ".join(query.lower().split())
+
+
+def fetch_courses_from_coursera(query: str) -> list[dict]:
+    key = normalize_query(query)
+    cached = _query_cache.get(key)
+    if cached is not None:
+        fetched_at, courses = cached
+        if time.monotonic() - fetched_at > COURSERA_CACHE_TTL:
+            _refresh_in_background(key, query)
+        return courses
+
+    try:
+        courses = _request_courses(query)
+    except Exception as e:
+        print(f"❌ Coursera query failed: {query} — {e}")
+        return []
+
+    _query_cache.set(key, (time.monotonic(), courses))
+    return courses
+
+
+def _refresh_in_background(key: str, query: str) -> None:
+    with _refreshing_lock:
+        if key in _refreshing:
+            return
+        _refreshing.add(key)
+
+    def refresh():
+        try:
+            _query_cache.set(key, (time.monotonic(), _request_courses(query, _refresh_session)))
+        except Exception as e:
+            print(f"⚠️ Coursera background refresh failed: {query} — {e}")
+        finally:
+            with _refreshing_lock:
+                _refreshing.discard(key)
+
+    _refresh_executor.submit(refresh)
+
+
+def _request_courses(query: str, session: requests.Session = _session) -> list[dict]:
+    response = session.get(
+        COURSERA_API_URL,
+        params={
+            "q": "search",
+            "query": query,
+            "limit": 10,
+            "fields": "id,name,slug,description",
+        },
+        timeout=(COURSERA_CONNECT_TIMEOUT, COURSERA_READ_TIMEOUT),
+    )
+    response.raise_for_status()
+    courses = response.json().get("elements", [])
+
+    return [
+        course for course in courses
+        if course.get("description") and len(course["description"].strip()) > 40
+    ]
+
+
+def fetch_courses_concurrently(
+    queries: list[str],
+    enough: Callable[[], bool],
+    deadline: float = COURSERA_DEADLINE,
+) -> Iterator[list[dict]]:
+    """
+    Run all queries at once over the shared pool and yield each result list
+    as soon as it arrives. Stops at the deadline or once `enough()` is true,
+    cancelling any queries that have not started yet. The deadline starts when
+    the first query starts, so time queued behind other requests doesn't count.
+    """
+    started = threading.Event()
+
+    def fetch(query: str) -> list[dict]:
+        started.set()
+        return fetch_courses_from_coursera(query)
+
+    futures = {_executor.submit(fetch, q): q for q in queries}
+    try:
+        started.wait()
+        for future in as_completed(futures, timeout=deadline):
+            yield future.result()
+            if enough():
+                break
+    except FuturesTimeoutError:
+        pending = [q for f, q in futures.items() if not f.done()]
+        print(f"⏱️ Coursera deadline of {deadline}s reached, dropping: {pending}")
+    finally:
+        for future in futures:
+            future.cancel()
@@ -0,0 +1,196 @@
+import os
+import threading
+import time
+from array import array
+from typing import Optional
+
+import numpy as np
+from sqlalchemy import text
+from dotenv import load_dotenv
+
+from server.database import read_engine
+
+load_dotenv()
+
+# Seconds a snapshot is served before a background rebuild starts
+JOBS_SNAPSHOT_TTL = float(os.getenv("JOBS_SNAPSHOT_TTL", "900"))
+# Rows pulled per round trip from the server-side cursor while building
+JOBS_SNAPSHOT_BATCH = int(os.getenv("JOBS_SNAPSHOT_BATCH", "5000"))
+
+STRING_COLUMNS = ("title", "location", "company")
+
+
+def normalize_location(loc: Optional[str]) -> str:
+    """Last two comma-separated parts, title-cased: "Austin, Travis County, TX" -> "Travis County, Tx"."""
+    if not loc:
+        return ""
+    parts = [p.strip() for p in loc.split(",") if p.strip()]
+    general = ", ".join(parts[-2:]) if len(parts) >= 2 else " ".join(parts)
+    return general.title()
+
+
+class _Encoder:
+    """Builds a dictionary-encoded column: int32 codes into a list of distinct values."""
+
+    def __init__(self):
+        self.values: list[str] = []
+        self.lookup: dict[str, int] = {}
+        self.codes = array("i")
+
+    def add(self, value: str) -> None:
+        code = self.lookup.get(value)
+        if code is None:
+            code = self.lookup[value] = len(self.values)
+            self.values.append(value)
+        self.codes.append(code)
+
+
+class JobsSnapshot:
+    """
+    Columnar copy of the Jobs table. String columns are dictionary-encoded
+    (`codes[name]` indexes `values[name]`); salaries are float64 with NaN for
+    missing or non-finite bounds. Every query below is a vectorized pass over
+    these arrays.
+    """
+
+    def __init__(self, encoders: dict[str, _Encoder], salary_min: array, salary_max: array):
+        self.values = {name: np.array(enc.values, dtype=object) for name, enc in encoders.items()}
+        self.codes = {name: np.frombuffer(enc.codes, dtype=np.int32) for name, enc in encoders.items()}
+        self.salary_min = np.frombuffer(salary_min, dtype=np.float64)
+        self.salary_max = np.frombuffer(salary_max, dtype=np.float64)
+        self.salary_min = np.where(np.isfinite(self.salary_min), self.salary_min, np.nan)
+        self.salary_max = np.where(np.isfinite(self.salary_max), self.salary_max, np.nan)
+        # Midpoint falls back to whichever bound is present
+        lo, hi = self.salary_min, self.salary_max
+        self.salary_mid = np.where(np.isnan(lo), hi, np.where(np.isnan(hi), lo, (lo + hi) / 2))
+        self.built_at = time.time()
+
+    def __len__(self) -> int:
+        return len(self.salary_mid)
+
+    def mask(self, **contains: Optional[str]) -> np.ndarray:
+        """Rows whose string columns contain the given substrings (case-insensitive)."""
+        keep = np.ones(len(self), dtype=bool)
+        for name, needle in contains.items():
+            if not needle:
+                continue
+            needle = needle.strip().lower()
+            matching = np.array(
+                [i for i, v in enumerate(self.values[name]) if needle in v.lower()],
+                dtype=np.int32,
+            )
+            keep &= np.isin(self.codes[name], matching)
+        return keep
+
+    def group_stats(self, by: str, keep: np.ndarray, limit: int) -> list[dict]:
+        """Job count, salaried count, mean and median midpoint for the largest groups."""
+        codes = self.codes[by][keep]
+        mids = self.salary_mid[keep]
+        size = len(self.values[by])
+
+        counts = np.bincount(codes, minlength=size)
+        salaried = ~np.isnan(mids)
+        priced = np.bincount(codes[salaried], minlength=size)
+        sums = np.bincount(codes[salaried], weights=mids[salaried], minlength=size)
+
+        top = [c for c in np.argsort(-counts, kind="stable")[:limit] if counts[c] > 0]
+
+        # Medians from one sort of the salaried rows by (group, midpoint)
+        order = np.lexsort((mids[salaried], codes[salaried]))
+        sorted_codes = codes[salaried][order]
+        sorted_mids = mids[salaried][order]
+        starts = np.searchsorted(sorted_codes, top, side="left")
+        ends = np.searchsorted(sorted_codes, top, side="right")
+
+        groups = []
+        for code, start, end in zip(top, starts, ends):
+            groups.append({
+                "name": self.values[by][code],
+                "jobs": int(counts[code]),
+                "salaried": int(priced[code]),
+                "average_salary": round(float(sums[code] / priced[code]), 2) if priced[code] else None,
+                "median_salary": round(float(np.median(sorted_mids[start:end])), 2) if end > start else None,
+            })
+        return groups
+
+    def histogram(self, keep: np.ndarray, bins: int) -> dict:
+        mids = self.salary_mid[keep]
+        mids = mids[~np.isnan(mids)]
+        if not len(mids):
+            return {"edges": [], "counts": []}
+        counts, edges = np.histogram(mids, bins=bins)
+        return {"edges": [round(float(e), 2) for e in edges], "counts": counts.tolist()}
+
+    def percentiles(self, keep: np.ndarray, qs: list[float]) -> dict[str, Optional[float]]:
+        mids = self.salary_mid[keep]
+        mids = mids[~np.isnan(mids)]
+        if not len(mids):
+            return {f"p{q:g}": None for q in qs}
+        values = np.percentile(mids, qs)
+        return {f"p{q:g}": round(float(v), 2) for q, v in zip(qs, values)}
+
+
+def build_snapshot() -> JobsSnapshot:
+    encoders = {name: _Encoder() for name in STRING_COLUMNS}
+    salary_min, salary_max = array("d"), array("d")
+
+    with read_engine.connect() as conn:
+        result = conn.execution_options(stream_results=True, max_row_buffer=JOBS_SNAPSHOT_BATCH).execute(text("""
+            SELECT title, location, company, "salaryMin"::float8, "salaryMax"::float8
+            FROM "Jobs"
+        """))
+        for partition in result.partitions(JOBS_SNAPSHOT_BATCH):
+            for title, location, company, lo, hi in partition:
+                encoders["title"].add((title or "").strip().title())
+                encoders["location"].add(normalize_location(location))
+                encoders["company"].add((company or "").strip())
+                salary_min.append(lo if lo is not None else np.nan)
+                salary_max.append(hi if hi is not None else np.nan)
+
+    return JobsSnapshot(encoders, salary_min, salary_max)
+
+
+_snapshot: Optional[JobsSnapshot] = None
+_refreshing = False
+_lock = threading.Lock()
+
+
+def get_jobs_snapshot() -> JobsSnapshot:
+    """
+    This process's snapshot. The first call builds it inline; afterwards a
+    stale snapshot keeps being served while a background thread replaces it.
+    """
+    global _snapshot, _refreshing
+
+    if _snapshot is None:
+        with _lock:
+            if _snapshot is None:
+                _snapshot = _timed_build()
+        return _snapshot
+
+    if time.time() - _snapshot.built_at > JOBS_SNAPSHOT_TTL:
+        with _lock:
+            if not _refreshing:
+                _refreshing = True
+                threading.Thread(target=_refresh, daemon=True).start()
+    return _snapshot
+
+
+def _refresh() -> None:
+    global _snapshot, _refreshing
+    try:
+        _snapshot = _timed_build()
+    except Exception as e:
+        # Keep serving the old snapshot and wait a full TTL before retrying
+        _snapshot.built_at = time.time()
+        print(f"⚠️ Jobs snapshot refresh failed — {e}")
+    finally:
+        _refreshing = False
+
+
+def _timed_build() -> JobsSnapshot:
+    started = time.monotonic()
+    snapshot = build_snapshot()
+    sizes = ", ".join(f"{len(snapshot.values[name])} {name}s" for name in STRING_COLUMNS)
+    print(f"📊 Jobs snapshot built: {len(snapshot)} rows ({sizes}) in {time.monotonic() - started:.1f}s")
+    return snapshot
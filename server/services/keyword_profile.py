@@ -0,0 +1,269 @@
+import json
+import uuid
+from collections import Counter
+from datetime import datetime
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from server.models.resume import Resume
+from server.models.favorite_job import FavoriteJob
+from server.models.search_term import SearchTerm
+from server.helpers.skills import extract_technical_keywords
+from server.services.resume_skills import get_resumes_keywords
+
+# source -> (model, user column, updated column)
+SOURCES = {
+    "resume": (Resume, Resume.user_id, Resume.updated_at),
+    "favorite": (FavoriteJob, FavoriteJob.user_id, FavoriteJob.updatedAt),
+    "search": (SearchTerm, SearchTerm.userId, SearchTerm.updatedAt),
+}
+INTEREST_SOURCES = ("favorite", "search")
+
+
+def get_keyword_profile(db: Session, user_id) -> dict[str, Counter]:
+    """
+    Keyword counts per source for a user. Normally a single-row read; when a
+    source table changed behind our back (resumes and favorites are written by
+    the sibling apps) only that source's added, edited or removed rows are
+    re-processed. See _fingerprints for which changes are detected.
+    """
+    row = _load_profile(db, user_id)
+    fingerprints = _fingerprints(db, user_id)
+    if row is not None and row["fingerprints"] == fingerprints:
+        return _counters(row["counts"])
+
+    _ensure_profile(db, user_id)
+    row = _load_profile(db, user_id, for_update=True)
+    counts = _counters(row["counts"])
+    stored = row["fingerprints"]
+
+    for source in SOURCES:
+        if stored.get(source) != fingerprints[source]:
+            _reconcile(db, user_id, source, counts)
+            stored[source] = fingerprints[source]
+
+    _save_profile(db, user_id, counts, stored)
+    db.commit()
+    return counts
+
+
+def interest_keywords(counts: dict[str, Counter]) -> set[str]:
+    return {kw for source in INTEREST_SOURCES for kw in counts.get(source, ())}
+
+
+def resume_keywords(counts: dict[str, Counter]) -> set[str]:
+    return set(counts.get("resume", ()))
+
+
+def record_items(db: Session, user_id, source: str, items: list[tuple]) -> None:
+    """
+    Hook for resumes, favorites or search terms of one user just inserted by
+    this app, as (item_id, keywords, item_updated_at) tuples. A failure only
+    leaves the profile behind; the next read reconciles it.
+    """
+    if not items:
+        return
+    try:
+        _ensure_profile(db, user_id)
+        row = _load_profile(db, user_id, for_update=True)
+        counts = _counters(row["counts"])
+        stored = row["fingerprints"]
+
+        _remove_items(db, source, [item_id for item_id, _, _ in items], counts)
+        _add_items(db, user_id, source, [
+            (item_id, updated, sorted(set(keywords))) for item_id, keywords, updated in items
+        ], counts)
+
+        # Keep the fingerprint in step so the next read doesn't reconcile these writes again
+        timestamps = [updated for _, _, updated in items if updated is not None]
+        if len(stored.get(source, ())) == 3 and len(timestamps) == len(items):
+            count, max_updated, id_sum = stored[source]
+            latest = max(timestamps)
+            if max_updated is None or datetime.fromisoformat(max_updated) < latest:
+                max_updated = latest.isoformat()
+            stored[source] = [count + len(items), max_updated, id_sum + _id_sum(item_id for item_id, _, _ in items)]
+
+        _save_profile(db, user_id, counts, stored)
+        db.commit()
+    except Exception as e:
+        db.rollback()
+        print(f"⚠️ Keyword profile update failed — {e}")
+
+
+def forget_items(db: Session, user_id, source: str, item_ids: list) -> None:
+    """Hook for resumes, favorites or search terms deleted by this app."""
+    if not item_ids:
+        return
+    try:
+        _ensure_profile(db, user_id)
+        row = _load_profile(db, user_id, for_update=True)
+        counts = _counters(row["counts"])
+        removed = _remove_items(db, source, item_ids, counts)
+
+        stored = row["fingerprints"]
+        if len(stored.get(source, ())) == 3:
+            count, max_updated, id_sum = stored[source]
+            stored[source] = [count - len(item_ids), max_updated, id_sum - _id_sum(item_ids)]
+
+        _save_profile(db, user_id, counts, stored)
+        db.commit()
+        print(f"🧮 Keyword profile: removed {removed} {source} item(s) for {user_id}")
+    except Exception as e:
+        db.rollback()
+        print(f"⚠️ Keyword profile update failed — {e}")
+
+
+def _reconcile(db: Session, user_id, source: str, counts: dict[str, Counter]) -> None:
+    model, user_col, updated_col = SOURCES[source]
+
+    known = dict(db.execute(
+        text("""
+            SELECT "item_id", "item_updated_at"
+            FROM "user_keyword_items"
+            WHERE "user_id" = :userId AND "source" = :source
+        """),
+        {"userId": user_id, "source": source}
+    ).fetchall())
+    current = dict(db.query(model.id, updated_col).filter(user_col == user_id).all())
+
+    stale = [item_id for item_id, updated in known.items() if current.get(item_id, object()) != updated]
+    fresh = [item_id for item_id, updated in current.items() if known.get(item_id, object()) != updated]
+
+    _remove_items(db, source, stale, counts)
+    _add_items(db, user_id, source, _extract(db, source, fresh), counts)
+    print(f"🧮 Keyword profile: {source} -{len(stale)} +{len(fresh)} for {user_id}")
+
+
+def _extract(db: Session, source: str, item_ids: list) -> list[tuple]:
+    if not item_ids:
+        return []
+
+    if source == "resume":
+        resumes = db.query(Resume).filter(Resume.id.in_(item_ids)).all()
+        keywords = get_resumes_keywords(resumes, db)
+        return [(r.id, r.updated_at, sorted(keywords[r.id])) for r in resumes]
+
+    model, _, updated_col = SOURCES[source]
+    rows = db.query(model.id, model.title, updated_col).filter(model.id.in_(item_ids)).all()
+    return [
+        (item_id, updated, sorted(extract_technical_keywords(title or "")))
+        for item_id, title, updated in rows
+    ]
+
+
+def _add_items(db: Session, user_id, source: str, items: list[tuple], counts: dict[str, Counter]) -> None:
+    if not items:
+        return
+    db.execute(
+        text("""
+            INSERT INTO "user_keyword_items" ("source", "item_id", "user_id", "item_updated_at", "keywords")
+            VALUES (:source, :itemId, :userId, :itemUpdatedAt, :keywords)
+        """),
+        [
+            {"source": source, "itemId": item_id, "userId": user_id, "itemUpdatedAt": updated, "keywords": keywords}
+            for item_id, updated, keywords in items
+        ]
+    )
+    bucket = counts.setdefault(source, Counter())
+    for _, _, keywords in items:
+        bucket.update(keywords)
+
+
+def _remove_items(db: Session, source: str, item_ids: list, counts: dict[str, Counter]) -> int:
+    if not item_ids:
+        return 0
+    rows = db.execute(
+        text("""
+            DELETE FROM "user_keyword_items"
+            WHERE "source" = :source AND "item_id" = ANY(:itemIds)
+            RETURNING "keywords"
+        """),
+        {"source": source, "itemIds": list(item_ids)}
+    ).fetchall()
+    bucket = counts.setdefault(source, Counter())
+    for (keywords,) in rows:
+        bucket.subtract(keywords)
+    counts[source] = +bucket
+    return len(rows)
+
+
+# Leading 60 bits of a UUID id, as a bigint; _id_sum computes the same in Python
+_ID_BITS = """('x' || substr(replace({}::text, '-', ''), 1, 15))::bit(60)::bigint"""
+
+
+def _fingerprints(db: Session, user_id) -> dict[str, list]:
+    """
+    [row count, max updated timestamp, sum of id bits] per source, in one round
+    trip. Inserts and deletes change the count or the id sum (a delete plus an
+    insert of an older row included), and edits move the max timestamp since
+    they set it to now. Only an edit that leaves updated_at behind is missed.
+    """
+    row = db.execute(
+        text(f"""
+            SELECT
+                (SELECT count(*) FROM "Resumes" WHERE "user_id" = :userId),
+                (SELECT max("updated_at") FROM "Resumes" WHERE "user_id" = :userId),
+                (SELECT sum({_ID_BITS.format('"id"')}) FROM "Resumes" WHERE "user_id" = :userId),
+                (SELECT count(*) FROM "Favorites" WHERE "userId" = :userId),
+                (SELECT max("updatedAt") FROM "Favorites" WHERE "userId" = :userId),
+                (SELECT sum({_ID_BITS.format('"id"')}) FROM "Favorites" WHERE "userId" = :userId),
+                (SELECT count(*) FROM "SearchTerms" WHERE "userId" = :userId),
+                (SELECT max("updatedAt") FROM "SearchTerms" WHERE "userId" = :userId),
+                (SELECT sum({_ID_BITS.format('"id"')}) FROM "SearchTerms" WHERE "userId" = :userId)
+        """),
+        {"userId": user_id}
+    ).one()
+
+    fingerprints = {}
+    for i, source in enumerate(("resume", "favorite", "search")):
+        count, max_updated, id_sum = row[3 * i], row[3 * i + 1], row[3 * i + 2]
+        fingerprints[source] = [count, max_updated.isoformat() if max_updated else None, int(id_sum or 0)]
+    return fingerprints
+
+
+def _id_sum(item_ids) -> int:
+    return sum(int(uuid.UUID(str(item_id)).hex[:15], 16) for item_id in item_ids)
+
+
+def _counters(raw: dict) -> dict[str, Counter]:
+    return {source: Counter(counts) for source, counts in (raw or {}).items()}
+
+
+def _ensure_profile(db: Session, user_id) -> None:
+    db.execute(
+        text("""
+            INSERT INTO "user_keyword_profiles" ("user_id") VALUES (:userId)
+            ON CONFLICT ("user_id") DO NOTHING
+        """),
+        {"userId": user_id}
+    )
+
+
+def _load_profile(db: Session, user_id, for_update: bool = False):
+    return db.execute(
+        text(f"""
+            SELECT "counts", "fingerprints"
+            FROM "user_keyword_profiles"
+            WHERE "user_id" = :userId
+            {"FOR UPDATE" if for_update else ""}
+        """),
+        {"userId": user_id}
+    ).mappings().first()
+
+
+def _save_profile(db: Session, user_id, counts: dict[str, Counter], fingerprints: dict) -> None:
+    db.execute(
+        text("""
+            UPDATE "user_keyword_profiles"
+            SET "counts" = CAST(:counts AS jsonb),
+                "fingerprints" = CAST(:fingerprints AS jsonb),
+                "updated_at" = now()
+            WHERE "user_id" = :userId
+        """),
+        {
+            "userId": user_id,
+            "counts": json.dumps({source: dict(bucket) for source, bucket in counts.items()}),
+            "fingerprints": json.dumps(fingerprints),
+        }
+    )
@@ -0,0 +1,61 @@
+import os
+import threading
+from typing import Iterable, Iterator
+
+import spacy
+from spacy.language import Language
+from spacy.tokens import Doc
+
+SPACY_MODEL = os.getenv("SPACY_MODEL", "en_core_web_sm")
+
+# Components skipped per task. The lemmatizer is never used, so it is excluded at load.
+# "pos":      POS tags and stop words only
+# "skills":   POS tags plus entity types (services.skills)
+# "keywords": POS tags, entities and noun chunks (helpers.skills)
+_TASK_DISABLE = {
+    "pos": ("parser", "ner"),
+    "skills": ("parser",),
+    "keywords": (),
+}
+
+_nlp: Language | None = None
+_load_lock = threading.Lock()
+
+
+def get_nlp() -> Language:
+    """Load the spaCy pipeline once per process."""
+    global _nlp
+    if _nlp is None:
+        with _load_lock:
+            if _nlp is None:
+                _nlp = spacy.load(SPACY_MODEL, exclude=["lemmatizer"])
+    return _nlp
+
+
+def _disabled(nlp: Language, task: str) -> list[str]:
+    if task not in _TASK_DISABLE:
+        raise ValueError(f"Unknown NLP task: {task}")
+    return [name for name in _TASK_DISABLE[task] if name in nlp.pipe_names]
+
+
+def parse(text: str, task: str) -> Doc:
+    nlp = get_nlp()
+    return nlp(text, disable=_disabled(nlp, task))
+
+
+def parse_many(
+    texts: Iterable,
+    task: str,
+    batch_size: int = 64,
+    n_process: int = 1,
+    as_tuples: bool = False,
+) -> Iterator:
+    """Docs for `texts`, in order; with as_tuples, (text, context) pairs in and (doc, context) out."""
+    nlp = get_nlp()
+    return nlp.pipe(
+        texts,
+        disable=_disabled(nlp, task),
+        batch_size=batch_size,
+        n_process=n_process,
+        as_tuples=as_tuples,
+    )
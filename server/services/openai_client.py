@@ -0,0 +1,50 @@
+import asyncio
+import os
+from typing import AsyncIterator, Optional
+
+import httpx
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# Model calls in flight per worker process; extra calls wait for a slot
+OPENAI_MAX_CONCURRENCY = int(os.getenv("OPENAI_MAX_CONCURRENCY", "8"))
+# Pooled keep-alive connections to the API, shared by every client in the process
+OPENAI_MAX_CONNECTIONS = int(os.getenv("OPENAI_MAX_CONNECTIONS", "20"))
+OPENAI_TIMEOUT = float(os.getenv("OPENAI_TIMEOUT", "60"))
+
+_http_client = DefaultAsyncHttpxClient(
+    limits=httpx.Limits(
+        max_connections=OPENAI_MAX_CONNECTIONS,
+        max_keepalive_connections=OPENAI_MAX_CONNECTIONS,
+    ),
+    timeout=OPENAI_TIMEOUT,
+)
+_clients: dict[Optional[str], AsyncOpenAI] = {}
+_semaphore = asyncio.Semaphore(OPENAI_MAX_CONCURRENCY)
+
+
+def get_async_client(api_key: Optional[str] = None) -> AsyncOpenAI:
+    """One AsyncOpenAI per API key, all on the shared connection pool."""
+    if api_key not in _clients:
+        _clients[api_key] = AsyncOpenAI(api_key=api_key, http_client=_http_client)
+    return _clients[api_key]
+
+
+async def create_chat_completion(client: AsyncOpenAI, **kwargs):
+    async with _semaphore:
+        return await client.chat.completions.create(**kwargs)
+
+
+async def stream_chat_completion(client: AsyncOpenAI, **kwargs) -> AsyncIterator[str]:
+    """Yield content deltas of a streamed completion, holding a concurrency slot until it ends."""
+    async with _semaphore:
+        stream = await client.chat.completions.create(stream=True, **kwargs)
+        async for chunk in stream:
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+
+
+async def close_clients() -> None:
+    await _http_client.aclose()
@@ -0,0 +1,103 @@
+import asyncio
+import logging
+import os
+import re
+from collections import deque
+from typing import Awaitable, Callable, Optional
+
+from dotenv import load_dotenv
+
+from server.utils.cache import TTLCache
+
+load_dotenv()
+
+# Validated question sets kept per title, and the level that triggers a background refill
+QUESTION_POOL_TARGET = int(os.getenv("QUESTION_POOL_TARGET", "5"))
+QUESTION_POOL_LOW_WATER = int(os.getenv("QUESTION_POOL_LOW_WATER", "2"))
+# Requests for a title before its pool is pre-filled; one-off titles only cost their inline generation
+QUESTION_POOL_WARM_REQUESTS = int(os.getenv("QUESTION_POOL_WARM_REQUESTS", "2"))
+# Times a single set is served before it is retired from the pool
+QUESTION_SET_MAX_SERVES = int(os.getenv("QUESTION_SET_MAX_SERVES", "20"))
+QUESTION_POOL_MAX_TITLES = int(os.getenv("QUESTION_POOL_MAX_TITLES", "500"))
+QUESTION_POOL_TTL = float(os.getenv("QUESTION_POOL_TTL", "86400"))
+
+
+def normalize_title(title: str) -> str:
+    return re.sub(r"\s+", " ", re.sub(r"[^\w\s+#/-]", " ", title.lower())).strip()
+
+
+class _Pool:
+    def __init__(self, title: str):
+        self.title = title
+        self.sets: deque[list] = deque()  # [questions, serves_left]
+        self.requests = 0
+        self.refilling = False
+
+
+class QuestionPools:
+    """
+    Per-title pools of pre-generated question sets. Sets are served round-robin
+    and retired after QUESTION_SET_MAX_SERVES uses; a pool that drops below
+    QUESTION_POOL_LOW_WATER is topped back up to QUESTION_POOL_TARGET in the
+    background once its title has been requested QUESTION_POOL_WARM_REQUESTS
+    times. Only titles with an empty pool wait on the model.
+    """
+
+    def __init__(self, generate: Callable[[str], Awaitable[list[str]]]):
+        self._generate = generate
+        self._pools = TTLCache(maxsize=QUESTION_POOL_MAX_TITLES, ttl=QUESTION_POOL_TTL)
+        self._tasks: set[asyncio.Task] = set()
+
+    async def get(self, title: str) -> list[str]:
+        questions = self.take(title)
+        if questions is None:
+            questions = await self._generate(title.strip())
+            self.add(title, questions)
+        return questions
+
+    def take(self, title: str) -> Optional[list[str]]:
+        """Serve a pooled set without touching the model, or None if the pool is empty."""
+        pool = self._pool(title)
+        pool.requests += 1
+        questions = self._take(pool) if pool.sets else None
+        if len(pool.sets) < QUESTION_POOL_LOW_WATER and pool.requests >= QUESTION_POOL_WARM_REQUESTS:
+            self._schedule_refill(pool)
+        return list(questions) if questions is not None else None
+
+    def add(self, title: str, questions: list[str]) -> None:
+        """Pool a set generated outside the pool (it has already been served once)."""
+        pool = self._pool(title)
+        pool.sets.append([list(questions), QUESTION_SET_MAX_SERVES - 1])
+
+    def _pool(self, title: str) -> _Pool:
+        key = normalize_title(title)
+        pool = self._pools.get(key)
+        if pool is None:
+            pool = _Pool(title.strip())
+            self._pools.set(key, pool)
+        return pool
+
+    @staticmethod
+    def _take(pool: _Pool) -> list[str]:
+        entry = pool.sets.popleft()
+        entry[1] -= 1
+        if entry[1] > 0:
+            pool.sets.append(entry)
+        return entry[0]
+
+    def _schedule_refill(self, pool: _Pool) -> None:
+        if pool.refilling:
+            return
+        pool.refilling = True
+        task = asyncio.create_task(self._refill(pool))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _refill(self, pool: _Pool) -> None:
+        try:
+            while len(pool.sets) < QUESTION_POOL_TARGET:
+                pool.sets.append([await self._generate(pool.title), QUESTION_SET_MAX_SERVES])
+        except Exception:
+            logging.exception(f"Question pool refill failed for '{pool.title}'")
+        finally:
+            pool.refilling = False
@@ -0,0 +1,118 @@
+from typing import Optional
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from server.database import SessionLocal
+from server.models.resume import Resume
+from server.services.skills import extract_skills_from_resume
+from server.helpers.skills import extract_skills_section, extract_technical_keywords
+from server.utils.cache import content_hash
+
+
+def get_resume_skills(resume: Resume, db: Session) -> list[str]:
+    """services.skills extraction for a stored resume, reused until the resume changes."""
+    row = _load_rows([resume], db).get(resume.id)
+    if row is not None and row["skills"] is not None and _is_current(row, resume):
+        return list(row["skills"])
+
+    skills = extract_skills_from_resume(resume.content or "")
+    _save([_entry(resume, skills=skills)])
+    return skills
+
+
+def get_resumes_keywords(resumes: list[Resume], db: Session) -> dict:
+    """helpers.skills keywords of each resume's skills section, keyed by resume id."""
+    rows = _load_rows(resumes, db)
+
+    keywords = {}
+    entries = []
+    for resume in resumes:
+        row = rows.get(resume.id)
+        if row is not None and row["keywords"] is not None and _is_current(row, resume):
+            keywords[resume.id] = set(row["keywords"])
+            continue
+
+        section = extract_skills_section(resume.content or "")
+        keywords[resume.id] = extract_technical_keywords(section) if section else set()
+        entries.append(_entry(resume, keywords=sorted(keywords[resume.id])))
+
+    _save(entries)
+    return keywords
+
+
+def _is_current(row: dict, resume: Resume) -> bool:
+    if row["resume_updated_at"] == resume.updated_at:
+        return True
+    return row["content_hash"] == content_hash(resume.content or "")
+
+
+def _load_rows(resumes: list[Resume], db: Session) -> dict:
+    if not resumes:
+        return {}
+    try:
+        rows = db.execute(
+            text("""
+                SELECT "resume_id", "resume_updated_at", "content_hash", "skills", "keywords"
+                FROM "resume_skills"
+                WHERE "resume_id" = ANY(:resumeIds)
+            """),
+            {"resumeIds": [r.id for r in resumes]}
+        ).mappings().all()
+    except Exception as e:
+        db.rollback()
+        print(f"⚠️ Resume skills cache lookup failed — {e}")
+        return {}
+    return {row["resume_id"]: row for row in rows}
+
+
+def _entry(
+    resume: Resume,
+    skills: Optional[list[str]] = None,
+    keywords: Optional[list[str]] = None,
+) -> dict:
+    return {
+        "resumeId": resume.id,
+        "resumeUpdatedAt": resume.updated_at,
+        "contentHash": content_hash(resume.content or ""),
+        "skills": skills,
+        "keywords": keywords,
+    }
+
+
+def _save(entries: list[dict]) -> None:
+    """
+    Upsert cache rows on a separate session so committing doesn't expire the
+    caller's loaded Resume objects. A column left as NULL keeps its stored value
+    only while the content hash still matches; otherwise it belonged to an older
+    version of the resume and is cleared.
+    """
+    if not entries:
+        return
+
+    with SessionLocal() as db:
+        try:
+            db.execute(
+                text("""
+                    INSERT INTO "resume_skills"
+                        ("resume_id", "resume_updated_at", "content_hash", "skills", "keywords", "updated_at")
+                    VALUES (:resumeId, :resumeUpdatedAt, :contentHash, :skills, :keywords, now())
+                    ON CONFLICT ("resume_id") DO UPDATE SET
+                        "skills" = CASE
+                            WHEN EXCLUDED."skills" IS NOT NULL THEN EXCLUDED."skills"
+                            WHEN "resume_skills"."content_hash" = EXCLUDED."content_hash" THEN "resume_skills"."skills"
+                        END,
+                        "keywords" = CASE
+                            WHEN EXCLUDED."keywords" IS NOT NULL THEN EXCLUDED."keywords"
+                            WHEN "resume_skills"."content_hash" = EXCLUDED."content_hash" THEN "resume_skills"."keywords"
+                        END,
+                        "resume_updated_at" = EXCLUDED."resume_updated_at",
+                        "content_hash" = EXCLUDED."content_hash",
+                        "updated_at" = now()
+                """),
+                entries
+            )
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            print(f"⚠️ Resume skills cache write failed — {e}")
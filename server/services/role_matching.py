@@ -0,0 +1,245 @@
+import heapq
+import math
+import os
+import threading
+import time
+from collections import defaultdict
+from typing import Iterable, Optional
+
+import numpy as np
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# "index": score against this process's inverted index (default)
+# "db":    rank in Postgres with the GIN-indexed && operator and return only the top rows
+ROLE_MATCH_MODE = os.getenv("ROLE_MATCH_MODE", "index").lower()
+
+# How get_top_matching_roles ranks roles:
+# "coverage": share of a role's required skills the user has, per ROLE_MATCH_MODE (default)
+# "cosine":   weighted cosine between the user's skills and the roles' TF-IDF
+#             profiles (rolesandskills.skillweights); needs the in-process index
+ROLE_MATCH_SCORING = os.getenv("ROLE_MATCH_SCORING", "coverage").lower()
+
+if ROLE_MATCH_SCORING == "cosine" and ROLE_MATCH_MODE == "db":
+    raise RuntimeError("ROLE_MATCH_SCORING=cosine requires ROLE_MATCH_MODE=index")
+
+# How often a worker checks whether rolesandskills changed since its index was built
+ROLE_INDEX_CHECK_SECONDS = float(os.getenv("ROLE_INDEX_CHECK_SECONDS", "60"))
+
+
+class RoleIndex:
+    """
+    Inverted skill -> roles index over the rolesandskills table, plus the same
+    data as a sparse role x skill weight matrix stored skill-major (CSC), so
+    cosine scoring is one sparse matrix-vector product.
+    """
+
+    def __init__(self, rows: Iterable[tuple]):
+        self.titles: list[str] = []
+        self.sizes: list[int] = []
+        self.postings: dict[str, list[int]] = defaultdict(list)
+        self.weights: dict[str, list[float]] = defaultdict(list)
+
+        for title, skills, *rest in rows:
+            idx = len(self.titles)
+            skills = list(dict.fromkeys(skills or []))
+            weights = rest[0] if rest else None
+            if not weights or len(weights) != len(skills):
+                # Roles without a weighted profile count every skill equally
+                weights = [1 / math.sqrt(len(skills))] * len(skills) if skills else []
+
+            self.titles.append(title)
+            self.sizes.append(len(skills))
+            for skill, weight in zip(skills, weights):
+                self.postings[skill].append(idx)
+                self.weights[skill].append(float(weight))
+
+        self._build_matrix()
+
+    def _build_matrix(self) -> None:
+        self.skill_ids = {skill: i for i, skill in enumerate(self.postings)}
+        lengths = np.array([len(p) for p in self.postings.values()], dtype=np.int64)
+        self.indptr = np.concatenate([[0], np.cumsum(lengths)])
+        self.row_roles = np.fromiter(
+            (idx for p in self.postings.values() for idx in p), dtype=np.int64, count=int(self.indptr[-1])
+        )
+        self.row_weights = np.fromiter(
+            (w for ws in self.weights.values() for w in ws), dtype=np.float64, count=int(self.indptr[-1])
+        )
+
+    def overlap_counts(self, skills: Iterable[str]) -> dict[int, int]:
+        counts: dict[int, int] = defaultdict(int)
+        for skill in set(skills):
+            for idx in self.postings.get(skill, ()):
+                counts[idx] += 1
+        return counts
+
+    def top_by_coverage(self, skills: Iterable[str], k: int) -> list[str]:
+        """
+        Roles ranked by the share of their required skills the user has. Only
+        posting lists for the user's skills are walked; if fewer than k roles
+        overlap, the rest are filled in table order like the old full scan.
+        """
+        counts = self.overlap_counts(skills)
+        best = heapq.nlargest(
+            k,
+            counts.items(),
+            key=lambda item: (item[1] / max(self.sizes[item[0]], 1), -item[0]),
+        )
+        titles = [self.titles[idx] for idx, _ in best]
+
+        for idx in range(len(self.titles)):
+            if len(titles) >= k:
+                break
+            if idx not in counts:
+                titles.append(self.titles[idx])
+
+        return titles
+
+    def cosine_scores(self, skills: Iterable[str]) -> np.ndarray:
+        """Cosine of every role's weighted profile with the user's binary skill vector."""
+        skills = set(skills)
+        ids = [self.skill_ids[s] for s in skills if s in self.skill_ids]
+        if not ids:
+            return np.zeros(len(self.titles))
+
+        # Only the matrix columns of the user's skills contribute to the product
+        cols = np.concatenate([np.arange(self.indptr[i], self.indptr[i + 1]) for i in ids])
+        scores = np.bincount(self.row_roles[cols], weights=self.row_weights[cols], minlength=len(self.titles))
+        return scores / math.sqrt(len(skills))
+
+    def top_by_cosine(self, skills: Iterable[str], k: int) -> list[tuple[str, float]]:
+        """
+        Roles ranked by weighted cosine similarity; if fewer than k roles share
+        a skill, the rest are filled in table order with a score of 0.
+        """
+        scores = self.cosine_scores(skills)
+        ranked = [int(i) for i in np.argsort(-scores, kind="stable")[:k] if scores[i] > 0]
+        best = [(self.titles[i], round(float(scores[i]), 4)) for i in ranked]
+
+        seen = set(ranked)
+        for idx in range(len(self.titles)):
+            if len(best) >= k:
+                break
+            if idx not in seen:
+                best.append((self.titles[idx], 0.0))
+
+        return best
+
+    def top_by_overlap(self, skills: Iterable[str], k: int) -> list[tuple[str, int]]:
+        counts = self.overlap_counts(skills)
+        best = heapq.nlargest(k, counts.items(), key=lambda item: (item[1], -item[0]))
+        return [(self.titles[idx], overlap) for idx, overlap in best]
+
+
+_index: Optional[RoleIndex] = None
+_fingerprint: Optional[tuple] = None
+_checked_at = 0.0
+_lock = threading.Lock()
+
+
+def get_role_index(db: Session) -> RoleIndex:
+    """
+    Return this process's index, rebuilding it when the table's checksum changes.
+    The checksum is computed in Postgres, so a check transfers one row.
+    """
+    global _index, _fingerprint, _checked_at
+
+    if _index is not None and time.monotonic() - _checked_at < ROLE_INDEX_CHECK_SECONDS:
+        return _index
+
+    # Wait only while there is no index yet; otherwise a request already
+    # checking keeps the current index served meanwhile
+    acquired = _lock.acquire(blocking=_index is None)
+    if not acquired:
+        return _index
+
+    try:
+        if _index is not None and time.monotonic() - _checked_at < ROLE_INDEX_CHECK_SECONDS:
+            return _index
+
+        fingerprint = tuple(db.execute(text("""
+            SELECT count(*), coalesce(sum(hashtext(
+                roletitle || ':' || array_to_string(requiredskills, ',') || ':' || coalesce(array_to_string(skillweights, ','), '')
+            )::bigint), 0)
+            FROM rolesandskills
+        """)).one())
+
+        if _index is None or fingerprint != _fingerprint:
+            rows = db.execute(text("""
+                SELECT roletitle, requiredskills, skillweights
+                FROM rolesandskills
+            """)).fetchall()
+            _index = RoleIndex((row.roletitle, row.requiredskills, row.skillweights) for row in rows)
+            _fingerprint = fingerprint
+            print(f"📇 Role index built: {len(_index.titles)} roles, {len(_index.postings)} skills")
+
+        _checked_at = time.monotonic()
+        return _index
+    finally:
+        _lock.release()
+
+
+def invalidate_role_index() -> None:
+    """Force a rebuild on the next lookup in this process."""
+    global _fingerprint, _checked_at
+    _fingerprint = None
+    _checked_at = 0.0
+
+
+def top_matching_roles(skills: list[str], db: Session, k: int = 5) -> list[str]:
+    """Best roles for a user's skills under ROLE_MATCH_SCORING."""
+    if ROLE_MATCH_SCORING == "cosine":
+        return [title for title, _ in get_role_index(db).top_by_cosine(skills, k)]
+    return top_roles_by_coverage(skills, db, k)
+
+
+def top_roles_by_coverage(skills: list[str], db: Session, k: int = 5) -> list[str]:
+    """Roles ranked by the share of their required skills the user has."""
+    if ROLE_MATCH_MODE == "db":
+        return [title for title, _ in _query_top_roles(skills, db, k, order_by="coverage")]
+    return get_role_index(db).top_by_coverage(skills, k)
+
+
+def top_roles_by_overlap(skills: list[str], db: Session, k: int = 5) -> list[tuple[str, int]]:
+    """Roles sharing at least one skill, ranked by how many they share."""
+    if ROLE_MATCH_MODE == "db":
+        return _query_top_roles(skills, db, k, order_by="overlap")
+    return get_role_index(db).top_by_overlap(skills, k)
+
+
+_ORDER_BY = {
+    "coverage": "m.overlap::float / GREATEST(cardinality(r.requiredskills), 1) DESC",
+    "overlap": "m.overlap DESC",
+}
+
+
+def _query_top_roles(skills: list[str], db: Session, k: int, order_by: str) -> list[tuple[str, int]]:
+    """
+    Only roles sharing a skill are considered (served by the GIN index on
+    requiredskills), so unlike the index mode there is no zero-overlap padding.
+    """
+    skills = sorted(set(skills))
+    if not skills:
+        return []
+
+    rows = db.execute(
+        text(f"""
+            SELECT r.roletitle, m.overlap
+            FROM rolesandskills r
+            CROSS JOIN LATERAL (
+                SELECT count(DISTINCT s) AS overlap
+                FROM unnest(r.requiredskills) AS s
+                WHERE s = ANY(CAST(:skills AS text[]))
+            ) m
+            WHERE r.requiredskills && CAST(:skills AS text[])
+            ORDER BY {_ORDER_BY[order_by]}, r.roletitle
+            LIMIT :limit
+        """),
+        {"skills": skills, "limit": k}
+    ).fetchall()
+
+    return [(row.roletitle, row.overlap) for row in rows]
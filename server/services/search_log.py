@@ -0,0 +1,183 @@
+import asyncio
+import os
+from collections import defaultdict
+from datetime import datetime, timedelta
+from typing import Optional
+
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+from dotenv import load_dotenv
+
+from server.database import AsyncSessionLocal, SessionLocal
+from server.helpers.skills import extract_technical_keywords
+from server.services.keyword_profile import record_items
+
+load_dotenv()
+
+# Buffered search terms are written once this many are pending, or after this many seconds
+SEARCH_LOG_BATCH_SIZE = int(os.getenv("SEARCH_LOG_BATCH_SIZE", "200"))
+SEARCH_LOG_FLUSH_SECONDS = float(os.getenv("SEARCH_LOG_FLUSH_SECONDS", "2"))
+
+# Deletions older than this can no longer match a pending term and are pruned
+SEARCH_LOG_TOMBSTONE_TTL = timedelta(hours=1)
+
+# Advisory lock namespace serializing a user's buffered inserts with their deletions
+_LOCK_NAMESPACE = 23_001
+
+_LOCK_USERS = text("""
+    SELECT pg_advisory_xact_lock_shared(:namespace, hashtext(u))
+    FROM unnest(CAST(:userIds AS text[])) AS u
+""")
+
+# Terms created at or before a deletion of the same query were deleted while pending
+_INSERT = text("""
+    INSERT INTO "SearchTerms" ("id", "userId", "title", "location", "query", "createdAt", "updatedAt")
+    SELECT t.*
+    FROM unnest(
+        CAST(:ids AS uuid[]), CAST(:userIds AS uuid[]), CAST(:titles AS text[]), CAST(:locations AS text[]),
+        CAST(:queries AS text[]), CAST(:createdAts AS timestamptz[]), CAST(:updatedAts AS timestamptz[])
+    ) AS t("id", "userId", "title", "location", "query", "createdAt", "updatedAt")
+    WHERE NOT EXISTS (
+        SELECT 1 FROM "search_term_deletions" d
+        WHERE d."user_id" = t."userId" AND d."query" = t."query" AND d."deleted_at" >= t."createdAt"
+    )
+    RETURNING "id"
+""")
+
+
+class SearchLogBuffer:
+    """
+    Write-behind buffer for "SearchTerms". Requests only append; pending rows
+    are inserted in one batch and one commit when SEARCH_LOG_BATCH_SIZE is
+    reached or SEARCH_LOG_FLUSH_SECONDS after the first pending row. Keyword
+    profiles of the inserted terms are updated afterwards in a separate task.
+    Terms deleted while pending (in any worker, see record_deletion) are
+    skipped. Rows still pending when a worker dies without shutdown are lost.
+    """
+
+    def __init__(self):
+        self._pending: list[dict] = []
+        self._flush_lock = asyncio.Lock()
+        self._timer: Optional[asyncio.Task] = None
+        self._tasks: set[asyncio.Task] = set()
+
+    def add(self, row: dict) -> None:
+        self._pending.append(row)
+        if len(self._pending) >= SEARCH_LOG_BATCH_SIZE:
+            self._spawn(self.flush())
+        elif self._timer is None:
+            self._timer = self._spawn(self._flush_later())
+
+    async def flush(self) -> None:
+        """Write everything pending, including rows of a flush already in progress."""
+        async with self._flush_lock:
+            batch, self._pending = self._pending, []
+            if not batch:
+                return
+            inserted = await self._insert(batch)
+            print(f"🗂️ Search log: flushed {len(inserted)}/{len(batch)} term(s)")
+
+        if inserted:
+            self._spawn(run_in_threadpool(_record_keywords, inserted))
+
+    async def close(self) -> None:
+        """Write everything pending and wait for in-flight flushes and keyword updates."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        await self.flush()
+        while self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    async def _flush_later(self) -> None:
+        # Only the sleep runs in the timer task, so cancelling it never interrupts a flush
+        await asyncio.sleep(SEARCH_LOG_FLUSH_SECONDS)
+        self._timer = None
+        self._spawn(self.flush())
+
+    async def _insert(self, batch: list[dict]) -> list[dict]:
+        async with AsyncSessionLocal() as db:
+            try:
+                inserted = await _insert_rows(db, batch)
+                await db.commit()
+                return inserted
+            except Exception as e:
+                await db.rollback()
+                print(f"⚠️ Search log batch insert failed, retrying row by row — {e}")
+
+            # One bad row (e.g. a user deleted meanwhile) shouldn't drop the rest
+            inserted = []
+            for row in batch:
+                try:
+                    inserted += await _insert_rows(db, [row])
+                    await db.commit()
+                except Exception as e:
+                    await db.rollback()
+                    print(f"⚠️ Search log row dropped — {e}")
+            return inserted
+
+    def _spawn(self, coro) -> asyncio.Task:
+        task = asyncio.create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+
+async def _insert_rows(db, rows: list[dict]) -> list[dict]:
+    """Insert rows not deleted while pending, in the caller's transaction; returns the inserted ones."""
+    user_ids = sorted({str(row["userId"]) for row in rows})
+    await db.execute(_LOCK_USERS, {"namespace": _LOCK_NAMESPACE, "userIds": user_ids})
+    result = await db.execute(_INSERT, {
+        "ids": [row["id"] for row in rows],
+        "userIds": [row["userId"] for row in rows],
+        "titles": [row["title"] for row in rows],
+        "locations": [row["location"] for row in rows],
+        "queries": [row["query"] for row in rows],
+        "createdAts": [row["createdAt"] for row in rows],
+        "updatedAts": [row["updatedAt"] for row in rows],
+    })
+    inserted = {row_id for (row_id,) in result.all()}
+    return [row for row in rows if row["id"] in inserted]
+
+
+def record_deletion(db: Session, user_id, query: str, deleted_at: datetime) -> None:
+    """
+    Record, in the caller's transaction, that the user deleted `query`, so
+    terms still pending in any worker's buffer are skipped. The advisory lock
+    makes a concurrent batch either commit before the caller's DELETE runs or
+    see this deletion.
+    """
+    db.execute(
+        text("SELECT pg_advisory_xact_lock(:namespace, hashtext(:userId))"),
+        {"namespace": _LOCK_NAMESPACE, "userId": str(user_id)}
+    )
+    db.execute(
+        text("""
+            INSERT INTO "search_term_deletions" ("user_id", "query", "deleted_at")
+            VALUES (:userId, :query, :deletedAt)
+            ON CONFLICT ("user_id", "query") DO UPDATE SET "deleted_at" = EXCLUDED."deleted_at"
+        """),
+        {"userId": str(user_id), "query": query, "deletedAt": deleted_at}
+    )
+    db.execute(
+        text("""
+            DELETE FROM "search_term_deletions"
+            WHERE "user_id" = :userId AND "deleted_at" < :before
+        """),
+        {"userId": str(user_id), "before": deleted_at - SEARCH_LOG_TOMBSTONE_TTL}
+    )
+
+
+def _record_keywords(rows: list[dict]) -> None:
+    by_user = defaultdict(list)
+    for row in rows:
+        keywords = extract_technical_keywords(row["title"] or "")
+        by_user[row["userId"]].append((row["id"], keywords, row["updatedAt"]))
+
+    with SessionLocal() as db:
+        for user_id, items in by_user.items():
+            record_items(db, user_id, "search", items)
+
+
+search_log = SearchLogBuffer()
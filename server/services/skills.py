@@ -1,10 +1,13 @@
-from sqlalchemy import text
-import spacy
 from typing import List, Dict
 from sqlalchemy.orm import Session
 import re
 
-nlp = spacy.load("en_core_web_sm")
+from server.services.nlp import parse
+from server.services.role_matching import top_roles_by_overlap
+from server.utils.cache import TTLCache, content_hash
+
+# Extracted skills keyed by a hash of the skills section text
+_skills_cache = TTLCache(maxsize=2048, ttl=6 * 3600)
 
 def extract_skills_section(resume_text: str) -> str:
     markdown_match = re.search(r"```markdown\n(.*?)\n```", resume_text, re.DOTALL)
@@ -28,7 +31,12 @@ def extract_skills_from_resume(resume_text: str) -> List[str]:
     if not skill_text:
         return []
 
-    doc = nlp(skill_text)
+    key = content_hash(skill_text)
+    cached = _skills_cache.get(key)
+    if cached is not None:
+        return list(cached)
+
+    doc = parse(skill_text, task="skills")
     tokens = {
         token.text.lower()
         for token in doc
@@ -39,23 +47,11 @@ def extract_skills_from_resume(resume_text: str) -> List[str]:
         and len(token.text) > 1
     }
 
+    _skills_cache.set(key, tuple(tokens))
     return list(tokens)
 
 def suggest_roles(user_skills: List[str], db: Session) -> List[Dict]:
-    stmt = text("""
-        SELECT roletitle, requiredskills
-        FROM rolesandskills
-    """)
-    result = db.execute(stmt).fetchall()
-
-    suggestions = []
-    for role_title, required_skills in result:
-        overlap = len(set(user_skills).intersection(set(required_skills)))
-        if overlap >= 1:
-            suggestions.append({
-                "roleTitle": role_title,
-                "matchStrength": overlap,
-            })
-
-    suggestions.sort(key=lambda x: x["matchStrength"], reverse=True)
-    return suggestions[:5]
+    return [
+        {"roleTitle": role_title, "matchStrength": overlap}
+        for role_title, overlap in top_roles_by_overlap(user_skills, db, k=5)
+    ]
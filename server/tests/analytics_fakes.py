@@ -0,0 +1,50 @@
+import uuid
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from server.database import get_async_read_db
+from server.routes import analytics
+from server.utils.auth import TokenUser, get_token_user
+
+USER = TokenUser(id=uuid.uuid4(), email="ada@example.com", role="user")
+
+
+class FakeResult:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def mappings(self):
+        return self
+
+    def one(self):
+        return self.rows[0]
+
+    def scalars(self):
+        return self
+
+    def all(self):
+        return self.rows
+
+    def fetchall(self):
+        return self.rows
+
+
+class FakeAsyncDB:
+    """Answers each execute with the next queued row list and records the SQL."""
+
+    def __init__(self, *results):
+        self.results = list(results)
+        self.calls = []
+
+    async def execute(self, stmt, params=None):
+        self.calls.append((str(stmt), params))
+        return FakeResult(self.results.pop(0))
+
+
+def analytics_client(db: FakeAsyncDB) -> TestClient:
+    app = FastAPI()
+    app.include_router(analytics.router)
+    app.dependency_overrides[get_async_read_db] = lambda: db
+    app.dependency_overrides[get_token_user] = lambda: USER
+    return TestClient(app)
@@ -0,0 +1,20 @@
+from server.tests.analytics_fakes import USER, FakeAsyncDB, analytics_client
+
+
+def test_trends_are_oldest_first_over_the_latest_months():
+    db = FakeAsyncDB([("2026-03", 2, None), ("2026-02", 4, 1234.567)])
+    body = analytics_client(db).get("/trends", params={"months": 2}).json()
+    assert body == [
+        {"month": "2026-02", "events": 4, "average_salary": 1234.57},
+        {"month": "2026-03", "events": 2, "average_salary": None},
+    ]
+    sql, params = db.calls[0]
+    assert '"dimension" = \'month\'' in sql and 'ORDER BY "key" DESC' in sql
+    assert params == {"userId": str(USER.id), "action": "favorite", "months": 2}
+
+
+def test_applied_jobs_read_title_rollups_and_skip_blank_titles():
+    db = FakeAsyncDB([("Data Engineer",), ("",), ("QA",)])
+    assert analytics_client(db).get("/applied-jobs").json() == ["Data Engineer", "QA"]
+    assert '"action" = \'applied\' AND "dimension" = \'title\'' in db.calls[0][0]
+
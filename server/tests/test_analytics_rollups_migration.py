@@ -0,0 +1,188 @@
+import math
+import os
+import uuid
+from collections import defaultdict
+from datetime import datetime, timezone
+from decimal import Decimal
+from pathlib import Path
+
+import psycopg2
+import pytest
+
+# Runs migration 006 against a real Postgres; set TEST_DATABASE_URL to a
+# database the tests may create and drop schemas in
+TEST_DATABASE_URL = os.getenv("TEST_DATABASE_URL")
+MIGRATION = Path(__file__).resolve().parents[1] / "migrations" / "006_user_analytics_rollups.sql"
+
+pytestmark = pytest.mark.skipif(not TEST_DATABASE_URL, reason="TEST_DATABASE_URL not set")
+
+ADA, BOB = uuid.uuid4(), uuid.uuid4()
+
+
+def _ts(month, day=1):
+    return datetime(2026, month, day, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def cur():
+    conn = psycopg2.connect(TEST_DATABASE_URL)
+    conn.autocommit = True
+    schema = f"rollups_{uuid.uuid4().hex[:12]}"
+    cur = conn.cursor()
+    cur.execute(f'CREATE SCHEMA "{schema}"')
+    cur.execute(f'SET search_path TO "{schema}"')
+    cur.execute("SET TIME ZONE 'UTC'")
+    # The columns of the sibling app's table that the rollups read
+    cur.execute("""
+        CREATE TABLE "user_analytics" (
+            "id"        SERIAL PRIMARY KEY,
+            "userId"    UUID NOT NULL,
+            "action"    TEXT NOT NULL,
+            "title"     TEXT,
+            "location"  TEXT,
+            "salaryMin" NUMERIC,
+            "salaryMax" NUMERIC,
+            "timestamp" TIMESTAMPTZ
+        )
+    """)
+    try:
+        yield cur
+    finally:
+        cur.execute(f'DROP SCHEMA "{schema}" CASCADE')
+        conn.close()
+
+
+def _insert(cur, user, action, title, location, lo, hi, ts) -> int:
+    cur.execute(
+        """
+        INSERT INTO "user_analytics" ("userId", "action", "title", "location", "salaryMin", "salaryMax", "timestamp")
+        VALUES (%s, %s, %s, %s, %s, %s, %s) RETURNING "id"
+        """,
+        (str(user), action, title, location, lo, hi, ts)
+    )
+    return cur.fetchone()[0]
+
+
+def _migrate(cur):
+    cur.execute(MIGRATION.read_text())
+
+
+def _finite(value):
+    if value is None:
+        return None
+    value = float(value)
+    return value if math.isfinite(value) else None
+
+
+def _expected(cur) -> dict:
+    """The rollups recomputed in Python from every row of user_analytics."""
+    cur.execute('SELECT "userId", "action", "title", "location", "salaryMin", "salaryMax", "timestamp" FROM "user_analytics"')
+    groups = defaultdict(lambda: {"events": 0, "priced": 0, "mids": [], "los": [], "his": [], "times": []})
+    for user, action, title, location, lo_raw, hi_raw, ts in cur.fetchall():
+        lo, hi = _finite(lo_raw), _finite(hi_raw)
+        priced = (
+            lo_raw is not None and hi_raw is not None
+            and not Decimal(lo_raw).is_nan() and not Decimal(hi_raw).is_nan()
+        )
+        mid = None
+        if priced and (lo is not None or hi is not None):
+            mid = ((lo if lo is not None else hi) + (hi if hi is not None else lo)) / 2
+        month = ts.astimezone(timezone.utc).strftime("%Y-%m") if ts else ""
+        for dimension, key in (("all", ""), ("title", title or ""), ("location", location or ""), ("month", month)):
+            g = groups[(str(user), action, dimension, key)]
+            g["events"] += 1
+            g["priced"] += priced
+            g["mids"] += [mid] if mid is not None else []
+            g["los"] += [lo] if lo is not None else []
+            g["his"] += [hi] if hi is not None else []
+            g["times"] += [ts] if ts else []
+
+    return {
+        key: (
+            g["events"], g["priced"], len(g["mids"]), pytest.approx(sum(g["mids"])),
+            min(g["los"], default=None), max(g["his"], default=None), max(g["times"], default=None),
+        )
+        for key, g in groups.items()
+    }
+
+
+def _rollups(cur) -> dict:
+    cur.execute("""
+        SELECT "user_id", "action", "dimension", "key",
+               "events", "priced", "mid_count", "mid_sum", "salary_min", "salary_max", "last_at"
+        FROM "user_analytics_rollups"
+    """)
+    return {tuple(row[:4]): tuple(row[4:]) for row in cur.fetchall()}
+
+
+def _seed(cur) -> dict:
+    return {
+        "low": _insert(cur, ADA, "favorite", "Data Engineer", "Berlin", 40000, 60000, _ts(1, 5)),
+        "high": _insert(cur, ADA, "favorite", "Data Engineer", "Berlin", 90000, 150000, _ts(2, 3)),
+        "mid": _insert(cur, ADA, "favorite", "data engineer ", None, 70000, 80000, _ts(2, 20)),
+        "open": _insert(cur, ADA, "favorite", "QA", "Remote", 50000, None, _ts(3, 1)),
+        "nan": _insert(cur, ADA, "favorite", "QA", "Remote", Decimal("NaN"), 70000, _ts(3, 2)),
+        "inf": _insert(cur, ADA, "favorite", "SRE", "Remote", 65000, float("inf"), _ts(3, 9)),
+        "undated": _insert(cur, ADA, "applied", None, None, None, None, None),
+        "bob": _insert(cur, BOB, "favorite", "Data Engineer", "Berlin", 10000, 20000, _ts(1, 1)),
+    }
+
+
+def test_backfill_matches_the_full_aggregate(cur):
+    _seed(cur)
+    _migrate(cur)
+    assert _rollups(cur) == _expected(cur)
+
+    everything = _rollups(cur)[(str(ADA), "favorite", "all", "")]
+    assert everything[:3] == (6, 4, 4)
+    assert everything[4:6] == (40000, 150000)
+
+
+def test_trigger_tracks_inserts_updates_and_deletes(cur):
+    ids = _seed(cur)
+    _migrate(cur)
+
+    _insert(cur, ADA, "favorite", "SRE", "Remote", 55000, 75000, _ts(4, 2))
+    assert _rollups(cur) == _expected(cur)
+
+    cur.execute(
+        'UPDATE "user_analytics" SET "title" = %s, "salaryMax" = %s WHERE "id" = %s',
+        ("QA", 95000, ids["mid"])
+    )
+    assert _rollups(cur) == _expected(cur)
+
+    cur.execute('UPDATE "user_analytics" SET "timestamp" = %s WHERE "id" = %s', (_ts(5, 1), ids["open"]))
+    assert _rollups(cur) == _expected(cur)
+    assert _rollups(cur)[(str(ADA), "favorite", "month", "2026-05")][0] == 1
+
+
+def test_deleting_the_current_extremes_rescans_them(cur):
+    ids = _seed(cur)
+    _migrate(cur)
+    key = (str(ADA), "favorite", "all", "")
+
+    cur.execute('DELETE FROM "user_analytics" WHERE "id" = %s', (ids["low"],))
+    assert _rollups(cur) == _expected(cur)
+    assert _rollups(cur)[key][4] == 50000
+
+    cur.execute('DELETE FROM "user_analytics" WHERE "id" = %s', (ids["high"],))
+    assert _rollups(cur) == _expected(cur)
+    assert _rollups(cur)[key][5] == 80000
+
+    cur.execute('DELETE FROM "user_analytics" WHERE "id" = %s', (ids["inf"],))
+    assert _rollups(cur) == _expected(cur)
+    assert _rollups(cur)[key][6] == _ts(3, 2)
+
+
+def test_emptied_groups_are_removed(cur):
+    ids = _seed(cur)
+    _migrate(cur)
+
+    cur.execute('DELETE FROM "user_analytics" WHERE "id" IN (%s, %s)', (ids["open"], ids["nan"]))
+    rollups = _rollups(cur)
+    assert rollups == _expected(cur)
+    assert (str(ADA), "favorite", "title", "QA") not in rollups
+    assert (str(ADA), "favorite", "location", "Remote") in rollups
+
+    cur.execute('DELETE FROM "user_analytics" WHERE "userId" = %s', (str(BOB),))
+    assert not any(user == str(BOB) for user, *_ in _rollups(cur))
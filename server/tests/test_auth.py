@@ -0,0 +1,89 @@
+import asyncio
+import uuid
+from datetime import datetime, timezone
+
+import jwt
+import pytest
+from fastapi import HTTPException
+
+from server.models.user import User
+from server.utils import auth
+from server.utils.cache import TTLCache
+
+
+def _user():
+    now = datetime.now(timezone.utc)
+    return User(
+        id=uuid.uuid4(), firstName="Ada", lastName="Lovelace", email="ada@example.com",
+        passwordHash="x", role="user", createdAt=now, updatedAt=now,
+    )
+
+
+class _Scalars:
+    def __init__(self, user):
+        self.user = user
+
+    def first(self):
+        return self.user
+
+
+class FakeAsyncDB:
+    def __init__(self, user):
+        self.user = user
+        self.queries = 0
+
+    async def execute(self, stmt):
+        self.queries += 1
+        return type("Result", (), {"scalars": lambda _: _Scalars(self.user)})()
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache(monkeypatch):
+    monkeypatch.setattr(auth, "_user_cache", TTLCache(maxsize=10, ttl=60))
+
+
+def test_current_user_is_cached_as_detached_copies():
+    user = _user()
+    token = auth.create_jwt_token(user)
+    db = FakeAsyncDB(user)
+
+    first = asyncio.run(auth.get_current_user(token, db))
+    second = asyncio.run(auth.get_current_user(token, db))
+    third = asyncio.run(auth.get_current_user(token, db))
+    assert db.queries == 1
+    assert first is not user and second is not third
+    assert (second.id, second.email, second.firstName) == (user.id, user.email, user.firstName)
+
+
+def test_password_hash_is_not_cached_or_returned():
+    user = _user()
+    token = auth.create_jwt_token(user)
+    current = asyncio.run(auth.get_current_user(token, FakeAsyncDB(user)))
+    assert "passwordHash" not in auth._user_cache.get(user.id)
+    assert "passwordHash" not in current.__dict__
+
+
+def test_invalidate_forces_a_lookup():
+    user = _user()
+    token = auth.create_jwt_token(user)
+    db = FakeAsyncDB(user)
+    asyncio.run(auth.get_current_user(token, db))
+    auth.invalidate_user(str(user.id))
+    asyncio.run(auth.get_current_user(token, db))
+    assert db.queries == 2
+
+
+def test_token_user_comes_from_claims():
+    user = _user()
+    assert auth.get_token_user(auth.create_jwt_token(user)) == auth.TokenUser(user.id, user.email, "user")
+
+
+@pytest.mark.parametrize("token", [
+    "garbage",
+    jwt.encode({"id": str(uuid.uuid4()), "aud": "someone-else", "iss": "PyDataPro"}, auth.SECRET_KEY, algorithm=auth.ALGORITHM),
+    jwt.encode({"id": "not-a-uuid", "aud": "pydatapro_user", "iss": "PyDataPro"}, auth.SECRET_KEY, algorithm=auth.ALGORITHM),
+])
+def test_bad_tokens_are_401(token):
+    with pytest.raises(HTTPException) as exc:
+        auth.get_token_user(token)
+    assert exc.value.status_code == 401
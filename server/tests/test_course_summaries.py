@@ -0,0 +1,54 @@
+import time
+
+from server.services import course_summaries
+from server.services.course_summaries import summary_key
+from server.utils.cache import TTLCache
+
+
+class FailingDB:
+    """Any query fails, so only the in-process tier can answer."""
+
+    def __init__(self):
+        self.rolled_back = False
+
+    def execute(self, *args, **kwargs):
+        raise RuntimeError("no database")
+
+    def rollback(self):
+        self.rolled_back = True
+
+
+def test_summary_key_follows_description_content():
+    assert summary_key("c1", "Intro to SQL") == summary_key("c1", "Intro to SQL")
+    assert summary_key("c1", "Intro to SQL") != summary_key("c1", "Intro to SQL, revised")
+
+
+def test_ttl_cache_expires_and_evicts_least_recently_used(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(time, "monotonic", lambda: now[0])
+    cache = TTLCache(maxsize=2, ttl=10)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+    assert cache.get("b") is None and cache.get("a") == 1
+
+    now[0] += 11
+    assert cache.get("a") is None and len(cache) == 1
+
+
+def test_memory_tier_answers_without_the_database(monkeypatch):
+    monkeypatch.setattr(course_summaries, "_memory", TTLCache(maxsize=10, ttl=60))
+    key = summary_key("c1", "text")
+    db = FailingDB()
+
+    course_summaries.store_summaries({key: "summary"}, db)
+    assert db.rolled_back
+    assert course_summaries.get_cached_summaries([key], FailingDB()) == {key: "summary"}
+
+
+def test_database_failure_is_a_miss(monkeypatch):
+    monkeypatch.setattr(course_summaries, "_memory", TTLCache(maxsize=10, ttl=60))
+    db = FailingDB()
+    assert course_summaries.get_cached_summaries([summary_key("c1", "text")], db) == {}
+    assert db.rolled_back
@@ -0,0 +1,66 @@
+from server.services import coursera
+from server.services.coursera import normalize_query
+
+
+def test_normalize_query_keeps_word_order_and_repeats():
+    assert normalize_query("  Machine   LEARNING ") == "machine learning"
+    assert normalize_query("learning machine") != normalize_query("machine learning")
+    assert normalize_query("python python") != normalize_query("python")
+
+
+def test_equivalent_queries_share_a_cache_entry(monkeypatch):
+    calls = []
+
+    def fake_request(query):
+        calls.append(query)
+        return [{"name": query}]
+
+    monkeypatch.setattr(coursera, "_request_courses", fake_request)
+    monkeypatch.setattr(coursera, "_query_cache", coursera.TTLCache(maxsize=10, ttl=60))
+
+    first = coursera.fetch_courses_from_coursera("Data  Science")
+    assert coursera.fetch_courses_from_coursera("data science") == first
+    coursera.fetch_courses_from_coursera("science data")
+    assert calls == ["Data  Science", "science data"]
+
+
+def test_stale_entry_is_served_while_refreshing(monkeypatch):
+    calls = []
+    monkeypatch.setattr(coursera, "_request_courses", lambda q: calls.append(q) or [{"name": f"v{len(calls)}"}])
+    monkeypatch.setattr(coursera, "_query_cache", coursera.TTLCache(maxsize=10, ttl=60))
+    monkeypatch.setattr(coursera, "COURSERA_CACHE_TTL", 0)
+    refreshes = []
+    monkeypatch.setattr(coursera, "_refresh_in_background", lambda key, query: refreshes.append(key))
+
+    first = coursera.fetch_courses_from_coursera("SQL")
+    assert coursera.fetch_courses_from_coursera("sql") == first
+    assert calls == ["SQL"] and refreshes == ["sql"]
+
+
+def test_failed_request_is_not_cached(monkeypatch):
+    def failing(query):
+        raise RuntimeError("down")
+
+    monkeypatch.setattr(coursera, "_request_courses", failing)
+    monkeypatch.setattr(coursera, "_query_cache", coursera.TTLCache(maxsize=10, ttl=60))
+    assert coursera.fetch_courses_from_coursera("sql") == []
+    assert len(coursera._query_cache) == 0
+
+
+class _InlineExecutor:
+    def submit(self, fn):
+        fn()
+
+
+def test_refresh_uses_its_own_connections(monkeypatch):
+    sessions = []
+    monkeypatch.setattr(
+        coursera, "_request_courses", lambda q, session=coursera._session: sessions.append(session) or [{"name": q}]
+    )
+    monkeypatch.setattr(coursera, "_query_cache", coursera.TTLCache(maxsize=10, ttl=60))
+    monkeypatch.setattr(coursera, "_refresh_executor", _InlineExecutor())
+
+    coursera._refresh_in_background("sql", "SQL")
+    assert sessions == [coursera._refresh_session]
+    assert coursera._refresh_session is not coursera._session
+    assert coursera._query_cache.get("sql")[1] == [{"name": "SQL"}]
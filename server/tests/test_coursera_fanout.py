@@ -0,0 +1,61 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from server.services import coursera
+
+
+def test_results_are_yielded_as_they_arrive(monkeypatch):
+    delays = {"slow": 0.3, "fast": 0.0}
+
+    def fake_fetch(query):
+        time.sleep(delays[query])
+        return [{"id": query}]
+
+    monkeypatch.setattr(coursera, "fetch_courses_from_coursera", fake_fetch)
+    results = list(coursera.fetch_courses_concurrently(["slow", "fast"], enough=lambda: False, deadline=5))
+    assert results == [[{"id": "fast"}], [{"id": "slow"}]]
+
+
+def test_stops_once_enough(monkeypatch):
+    monkeypatch.setattr(coursera, "fetch_courses_from_coursera", lambda q: [{"id": q}])
+    results = list(coursera.fetch_courses_concurrently(["a", "b", "c"], enough=lambda: True, deadline=5))
+    assert len(results) == 1
+
+
+def test_deadline_drops_slow_queries(monkeypatch):
+    release = threading.Event()
+
+    def fake_fetch(query):
+        if query == "stuck":
+            release.wait(timeout=5)
+        return [{"id": query}]
+
+    monkeypatch.setattr(coursera, "fetch_courses_from_coursera", fake_fetch)
+    started = time.monotonic()
+    results = list(coursera.fetch_courses_concurrently(["stuck", "ok"], enough=lambda: False, deadline=0.2))
+    release.set()
+    assert results == [[{"id": "ok"}]]
+    assert time.monotonic() - started < 2
+
+
+def test_deadline_excludes_time_queued_behind_other_callers(monkeypatch):
+    delays = {"busy-1": 0.5, "busy-2": 0.5, "quick-1": 0.05, "quick-2": 0.05}
+
+    def fake_fetch(query):
+        time.sleep(delays[query])
+        return [{"id": query}]
+
+    monkeypatch.setattr(coursera, "fetch_courses_from_coursera", fake_fetch)
+    monkeypatch.setattr(coursera, "_executor", ThreadPoolExecutor(max_workers=2))
+
+    first = threading.Thread(target=lambda: list(
+        coursera.fetch_courses_concurrently(["busy-1", "busy-2"], enough=lambda: False, deadline=5)
+    ))
+    first.start()
+    time.sleep(0.05)
+    # Both workers are busy for ~0.5s, longer than this caller's whole deadline
+    results = list(coursera.fetch_courses_concurrently(["quick-1", "quick-2"], enough=lambda: False, deadline=0.3))
+    first.join()
+
+    assert sorted(r[0]["id"] for r in results) == ["quick-1", "quick-2"]
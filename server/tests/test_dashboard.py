@@ -0,0 +1,74 @@
+import uuid
+from collections import Counter
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from server.database import get_async_read_db, get_db
+from server.routes import dashboard
+from server.utils.auth import TokenUser, get_current_user, get_token_user
+from server.utils.pagination import decode_cursor
+
+USER = SimpleNamespace(id=uuid.uuid4(), firstName="Ada")
+T0 = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+class FakeAsyncDB:
+    def __init__(self, *results):
+        self.results = list(results)
+        self.statements = []
+
+    async def execute(self, stmt):
+        self.statements.append(stmt)
+        rows = self.results.pop(0)
+        limit = getattr(stmt, "_limit", None)
+        rows = rows[:limit] if limit is not None else rows
+        return FakeResult(rows)
+
+
+class FakeResult(list):
+    def all(self):
+        return list(self)
+
+
+def _client(db, monkeypatch):
+    profile = {"resume": Counter({"Python": 1}), "search": Counter({"Python": 1, "Sql": 2})}
+    monkeypatch.setattr(dashboard, "get_keyword_profile", lambda db, user_id: profile)
+    app = FastAPI()
+    app.include_router(dashboard.router)
+    app.dependency_overrides[get_async_read_db] = lambda: db
+    app.dependency_overrides[get_db] = lambda: None
+    app.dependency_overrides[get_current_user] = lambda: USER
+    app.dependency_overrides[get_token_user] = lambda: TokenUser(USER.id, "ada@example.com", "user")
+    return TestClient(app)
+
+
+def _terms(n):
+    return [SimpleNamespace(id=uuid.uuid4(), query=f"q{i}", createdAt=None if i == n - 1 else T0) for i in range(n)]
+
+
+def test_dashboard_returns_the_first_page_of_each_section(monkeypatch):
+    monkeypatch.setattr(dashboard, "DASHBOARD_PAGE_SIZE", 20)
+    resumes = [SimpleNamespace(id=uuid.uuid4(), title=f"CV {i}", created_at=T0) for i in range(30)]
+    favorites = [SimpleNamespace(id=uuid.uuid4(), title="Dev", company="Acme", createdAt=None)]
+    db = FakeAsyncDB(resumes, favorites, _terms(25))
+
+    body = _client(db, monkeypatch).get("/dashboard").json()
+    assert len(body["resumes"]) == 20 and "content" not in body["resumes"][0]
+    assert len(body["searchTerms"]) == 20
+    assert body["favorites"] == [{"id": str(favorites[0].id), "title": "Dev", "company": "Acme"}]
+    assert body["keywords"] == ["Python", "Sql"] and body["resumeKeywords"] == ["Python"]
+    assert decode_cursor(body["nextCursors"]["resumes"]) == (T0, resumes[19].id)
+    assert body["nextCursors"]["favorites"] is None
+    assert body["nextCursors"]["searchTerms"] is not None
+    assert all(stmt._limit == 21 for stmt in db.statements)
+
+
+def test_section_pages_reach_undated_rows(monkeypatch):
+    terms = _terms(3)
+    db = FakeAsyncDB(terms)
+    body = _client(db, monkeypatch).get("/dashboard/search-terms", params={"limit": 2}).json()
+    assert body["items"] == ["q0", "q1"]
+    assert decode_cursor(body["nextCursor"]) == (T0, terms[1].id)
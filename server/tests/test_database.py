@@ -0,0 +1,38 @@
+import pytest
+
+from server import database
+
+
+def test_engines_use_the_configured_pool():
+    e = database.make_engine("postgresql://u:p@db.example:5432/app")
+    assert e.pool.size() == database.DB_POOL_SIZE
+    assert e.pool._max_overflow == database.DB_MAX_OVERFLOW
+    assert e.pool._recycle == database.DB_POOL_RECYCLE
+    assert e.pool._pre_ping == database.DB_POOL_PRE_PING
+
+
+def test_async_engine_translates_sslmode():
+    e = database.make_async_engine("postgresql://u:p@db.example:5432/app?sslmode=require")
+    assert e.url.drivername == "postgresql+asyncpg"
+    assert "sslmode" not in e.url.query
+    assert e.sync_engine.pool.size() == database.DB_ASYNC_POOL_SIZE
+    assert e.sync_engine.pool._max_overflow == database.DB_ASYNC_MAX_OVERFLOW
+
+
+@pytest.mark.skipif(bool(database.DATABASE_READ_URL), reason="a replica is configured")
+def test_reads_fall_back_to_the_primary_without_a_replica():
+    assert database.read_engine is database.engine
+    assert database.async_read_engine is database.async_engine
+    stats = database.pool_stats()
+    assert set(stats) == {"primary", "primaryAsync"}
+    assert stats["primary"]["checkedOut"] == 0
+
+
+def test_pools_saturated_once_overflow_is_used_up(monkeypatch):
+    e = database.make_engine("postgresql://u:p@db.example:5432/app")
+    monkeypatch.setattr(database, "engine", e)
+    monkeypatch.setattr(database, "read_engine", e)
+    monkeypatch.setattr(e.pool, "checkedout", lambda: database.DB_POOL_SIZE + database.DB_MAX_OVERFLOW - 1)
+    assert not database.pools_saturated()
+    monkeypatch.setattr(e.pool, "checkedout", lambda: database.DB_POOL_SIZE + database.DB_MAX_OVERFLOW)
+    assert database.pools_saturated()
@@ -0,0 +1,69 @@
+import json
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from server.routes import interview
+from server.routes.interview import _JsonArrayReader
+from server.services import question_pools
+from server.services.question_pools import QuestionPools
+from server.utils.sse import sse_event
+
+QUESTIONS = [f"Question {i}?" for i in range(10)]
+
+
+def _events(body: str) -> list[tuple[str, dict]]:
+    events = []
+    for block in body.strip().split("\n\n"):
+        name, data = block.split("\n")
+        events.append((name.removeprefix("event: "), json.loads(data.removeprefix("data: "))))
+    return events
+
+
+def test_sse_event_format():
+    assert sse_event("done", {"count": 2}) == 'event: done\ndata: {"count": 2}\n\n'
+
+
+def test_reader_yields_elements_as_they_complete():
+    reader = _JsonArrayReader()
+    assert reader.feed('```json\n["one", "tw') == ["one"]
+    assert reader.feed('o", 3') == ["two"]
+    assert reader.feed("4]") == [34]
+    assert reader.started and reader.closed
+
+
+@pytest.fixture
+def client(monkeypatch):
+    # No background refills, which would call the model
+    monkeypatch.setattr(question_pools, "QUESTION_POOL_WARM_REQUESTS", 100)
+    monkeypatch.setattr(interview, "question_pools", QuestionPools(interview.generate_question_set))
+    app = FastAPI()
+    app.include_router(interview.router)
+    return TestClient(app)
+
+
+def _fake_stream(monkeypatch, text: str, size: int = 7):
+    async def fake_stream(client, **kwargs):
+        for i in range(0, len(text), size):
+            yield text[i:i + size]
+
+    monkeypatch.setattr(interview, "stream_chat_completion", fake_stream)
+
+
+def test_stream_emits_each_question_then_pools_the_set(client, monkeypatch):
+    _fake_stream(monkeypatch, json.dumps(QUESTIONS))
+    events = _events(client.post("/generate-questions/stream", json={"title": "QA"}).text)
+    assert [e for e, _ in events] == ["question"] * 10 + ["done"]
+    assert [d["question"] for _, d in events[:-1]] == QUESTIONS
+
+    # The validated set is now replayed from the pool without a model call
+    _fake_stream(monkeypatch, "should not be read")
+    replay = _events(client.post("/generate-questions/stream", json={"title": "qa"}).text)
+    assert [d["question"] for e, d in replay if e == "question"] == QUESTIONS
+
+
+def test_stream_reports_invalid_sets(client, monkeypatch):
+    _fake_stream(monkeypatch, json.dumps(QUESTIONS[:3]))
+    events = _events(client.post("/generate-questions/stream", json={"title": "QA"}).text)
+    assert events[-1] == ("error", {"detail": "Expected exactly 10 questions."})
@@ -0,0 +1,71 @@
+from array import array
+
+import numpy as np
+
+from server.services import job_market
+from server.services.job_market import JobsSnapshot, _Encoder, normalize_location
+from server.tests.analytics_fakes import FakeAsyncDB, analytics_client
+
+JOBS = [
+    # title, location, company, salaryMin, salaryMax
+    ("Data Engineer", "Austin, Travis County, TX", "Acme", 100.0, 200.0),
+    ("data engineer", "Dallas, TX", "Acme", 140.0, None),
+    ("Developer", "Austin, Travis County, TX", "Initech", None, None),
+    ("Developer", "Remote", "Initech", 50.0, float("inf")),
+]
+
+
+def _snapshot(rows=JOBS) -> JobsSnapshot:
+    encoders = {name: _Encoder() for name in job_market.STRING_COLUMNS}
+    lo, hi = array("d"), array("d")
+    for title, location, company, salary_min, salary_max in rows:
+        encoders["title"].add(title.strip().title())
+        encoders["location"].add(normalize_location(location))
+        encoders["company"].add(company)
+        lo.append(salary_min if salary_min is not None else np.nan)
+        hi.append(salary_max if salary_max is not None else np.nan)
+    return JobsSnapshot(encoders, lo, hi)
+
+
+def test_normalize_location():
+    assert normalize_location("Austin, Travis County, TX") == "Travis County, Tx"
+    assert normalize_location("  remote ") == "Remote"
+    assert normalize_location(None) == ""
+
+
+def test_midpoints_fall_back_to_the_present_bound():
+    mids = _snapshot().salary_mid
+    assert mids[:2].tolist() == [150.0, 140.0]
+    assert np.isnan(mids[2]) and mids[3] == 50.0
+
+
+def test_mask_matches_substrings_case_insensitively():
+    snapshot = _snapshot()
+    assert snapshot.mask(title="ENGINEER").tolist() == [True, True, False, False]
+    assert snapshot.mask(title="dev", location="travis").tolist() == [False, False, True, False]
+    assert snapshot.mask(title=None).all()
+
+
+def test_group_stats():
+    snapshot = _snapshot()
+    groups = snapshot.group_stats("title", snapshot.mask(), limit=5)
+    assert groups == [
+        {"name": "Data Engineer", "jobs": 2, "salaried": 2, "average_salary": 145.0, "median_salary": 145.0},
+        {"name": "Developer", "jobs": 2, "salaried": 1, "average_salary": 50.0, "median_salary": 50.0},
+    ]
+
+
+def test_histogram_and_percentiles_skip_unsalaried_rows():
+    snapshot = _snapshot()
+    keep = snapshot.mask()
+    assert sum(snapshot.histogram(keep, bins=2)["counts"]) == 3
+    assert snapshot.percentiles(keep, [50]) == {"p50": 140.0}
+    assert snapshot.percentiles(snapshot.mask(company="nobody"), [50]) == {"p50": None}
+
+
+def test_market_percentiles_route_validates_range(monkeypatch):
+    monkeypatch.setattr(job_market, "_snapshot", _snapshot())
+    monkeypatch.setattr(job_market._snapshot, "built_at", float("inf"))
+    client = analytics_client(FakeAsyncDB())
+    assert client.get("/market/percentiles", params={"q": [50]}).json() == {"p50": 140.0}
+    assert client.get("/market/percentiles", params={"q": [101]}).status_code == 400
@@ -0,0 +1,70 @@
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from server.database import get_async_read_db
+from server.routes import jobs
+from server.utils.pagination import decode_key_cursor
+
+
+class _Row:
+    def __init__(self, mapping):
+        self._mapping = mapping
+
+
+class _Result:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def all(self):
+        return [_Row(r) for r in self.rows]
+
+
+class FakeDB:
+    def __init__(self, rows):
+        self.rows = rows
+        self.calls = []
+
+    async def execute(self, stmt, params):
+        self.calls.append((str(stmt), params))
+        if "LIMIT" in str(stmt):
+            return _Result(self.rows[:params["limit"]])
+        return _Result([{k: v for k, v in r.items() if k != "id"} for r in self.rows])
+
+
+ROWS = [
+    {"id": i, "title": f"Job {i}", "location": "Austin, TX", "salaryMin": 100, "salaryMax": 200}
+    for i in range(1, 6)
+]
+
+
+def _client(db):
+    app = FastAPI()
+    app.include_router(jobs.router)
+    app.dependency_overrides[get_async_read_db] = lambda: db
+    return TestClient(app)
+
+
+def test_filters_build_escaped_ilike_and_typed_salary_bounds():
+    where, params = jobs.JobFilters(title=" 100%_dev ", min_salary=50, max_salary=None).where()
+    assert '"title" ILIKE :title' in where
+    assert 'CAST(:minSalary AS float8)' in where
+    assert params == {"title": "%100\\%\\_dev%", "minSalary": 50}
+
+
+def test_jobs_without_paging_params_returns_everything():
+    db = FakeDB(ROWS)
+    body = _client(db).get("/jobs").json()
+    assert body == {"jobs": [{k: v for k, v in r.items() if k != "id"} for r in ROWS]}
+    assert "LIMIT" not in db.calls[0][0]
+
+
+def test_jobs_paged_mode_returns_cursor():
+    db = FakeDB(ROWS)
+    body = _client(db).get("/jobs", params={"limit": 2}).json()
+    assert [j["id"] for j in body["jobs"]] == [1, 2]
+    assert decode_key_cursor(body["nextCursor"]) == 2
+
+    _client(db).get("/jobs", params={"cursor": body["nextCursor"]})
+    sql, params = db.calls[-1]
+    assert '"id" > :after' in sql
+    assert params["after"] == 2 and params["limit"] == jobs.JOBS_PAGE_SIZE + 1
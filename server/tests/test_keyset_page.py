@@ -0,0 +1,54 @@
+import asyncio
+import uuid
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+from server.models.search_term import SearchTerm
+from server.utils.pagination import decode_cursor, keyset_page
+
+T0 = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+class FakeAsyncDB:
+    def __init__(self, rows):
+        self.rows = rows
+        self.statements = []
+
+    async def execute(self, stmt):
+        self.statements.append(str(stmt.compile(dialect=postgresql.dialect())))
+        return SimpleNamespace(all=lambda: self.rows[:stmt._limit])
+
+
+def _rows(n):
+    return [SimpleNamespace(id=uuid.uuid4(), createdAt=T0 - timedelta(minutes=i)) for i in range(n)]
+
+
+def _page(db, cursor=None, limit=2):
+    stmt = select(SearchTerm.id, SearchTerm.createdAt)
+    return asyncio.run(keyset_page(db, stmt, SearchTerm.createdAt, SearchTerm.id, cursor, limit))
+
+
+def test_full_page_returns_cursor_of_last_row():
+    rows = _rows(3)
+    db = FakeAsyncDB(rows)
+    page, cursor = _page(db)
+    assert page == rows[:2]
+    assert decode_cursor(cursor) == (rows[1].createdAt, rows[1].id)
+    assert 'ORDER BY "SearchTerms"."createdAt" DESC NULLS LAST, "SearchTerms".id DESC' in db.statements[0]
+
+
+def test_last_page_has_no_cursor():
+    rows = _rows(2)
+    page, cursor = _page(FakeAsyncDB(rows))
+    assert page == rows and cursor is None
+
+
+def test_cursor_filters_the_next_page():
+    rows = _rows(3)
+    db = FakeAsyncDB(rows)
+    _, cursor = _page(db)
+    _page(db, cursor)
+    assert '("SearchTerms"."createdAt", "SearchTerms".id) <' in db.statements[1]
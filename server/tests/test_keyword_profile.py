@@ -0,0 +1,91 @@
+import uuid
+from collections import Counter
+from datetime import datetime, timezone
+
+import pytest
+
+from server.services import keyword_profile
+
+
+class FakeDB:
+    def __init__(self):
+        self.commits = 0
+
+    def commit(self):
+        self.commits += 1
+
+
+@pytest.fixture
+def profile(monkeypatch):
+    state = {
+        "row": {"counts": {"search": {"python": 2}}, "fingerprints": {}},
+        "fingerprints": {"resume": [0, None, 0], "favorite": [1, "t1", 7], "search": [2, "t2", 9]},
+        "reconciled": [],
+        "saved": None,
+    }
+    monkeypatch.setattr(keyword_profile, "_load_profile", lambda db, user_id, for_update=False: state["row"])
+    monkeypatch.setattr(keyword_profile, "_fingerprints", lambda db, user_id: state["fingerprints"])
+    monkeypatch.setattr(keyword_profile, "_ensure_profile", lambda db, user_id: None)
+    monkeypatch.setattr(
+        keyword_profile, "_reconcile",
+        lambda db, user_id, source, counts: state["reconciled"].append(source)
+    )
+    monkeypatch.setattr(
+        keyword_profile, "_save_profile",
+        lambda db, user_id, counts, fingerprints: state.update(saved=(counts, fingerprints))
+    )
+    return state
+
+
+def test_matching_fingerprints_are_a_single_read(profile):
+    profile["row"]["fingerprints"] = dict(profile["fingerprints"])
+    db = FakeDB()
+    counts = keyword_profile.get_keyword_profile(db, "user")
+    assert counts == {"search": Counter({"python": 2})}
+    assert profile["reconciled"] == [] and db.commits == 0
+
+
+def test_only_changed_sources_are_reconciled(profile):
+    profile["row"]["fingerprints"] = {"resume": [0, None, 0], "favorite": [0, None, 0], "search": [2, "t2", 9]}
+    db = FakeDB()
+    keyword_profile.get_keyword_profile(db, "user")
+    assert profile["reconciled"] == ["favorite"]
+    assert profile["saved"][1] == profile["fingerprints"]
+    assert db.commits == 1
+
+
+def test_delete_plus_older_insert_is_caught_by_the_id_sum(profile):
+    # Same count and latest timestamp, different rows
+    profile["row"]["fingerprints"] = {"resume": [0, None, 0], "favorite": [1, "t1", 7], "search": [2, "t2", 8]}
+    keyword_profile.get_keyword_profile(FakeDB(), "user")
+    assert profile["reconciled"] == ["search"]
+
+
+def test_id_sum_uses_the_leading_60_bits():
+    a = uuid.UUID("00000000-0000-0010-ffff-ffffffffffff")
+    b = "00000000-0000-0020-0000-000000000000"
+    assert keyword_profile._id_sum([a, b]) == 3
+
+
+def test_hooks_keep_the_fingerprint_in_step(profile, monkeypatch):
+    monkeypatch.setattr(keyword_profile, "_remove_items", lambda db, source, ids, counts: len(ids))
+    monkeypatch.setattr(keyword_profile, "_add_items", lambda db, user_id, source, items, counts: None)
+    profile["row"]["fingerprints"] = {"search": [2, "2026-01-01T00:00:00+00:00", 9]}
+    item = uuid.UUID("00000000-0000-0040-0000-000000000000")
+    later = datetime(2026, 2, 1, tzinfo=timezone.utc)
+
+    keyword_profile.record_items(FakeDB(), "user", "search", [(item, ["python"], later)])
+    assert profile["saved"][1]["search"] == [3, later.isoformat(), 13]
+
+    keyword_profile.forget_items(FakeDB(), "user", "search", [item])
+    assert profile["saved"][1]["search"] == [2, later.isoformat(), 9]
+
+
+def test_keyword_views():
+    counts = {
+        "resume": Counter({"python": 1}),
+        "favorite": Counter({"sql": 1}),
+        "search": Counter({"python": 3}),
+    }
+    assert keyword_profile.interest_keywords(counts) == {"sql", "python"}
+    assert keyword_profile.resume_keywords(counts) == {"python"}
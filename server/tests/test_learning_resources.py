@@ -0,0 +1,65 @@
+import asyncio
+import json
+from types import SimpleNamespace
+
+from server.routes import learning_resources
+from server.routes.learning_resources import NO_SUMMARY, condense_descriptions
+
+LONG = "This course teaches practical SQL for analysts working with relational databases."
+
+
+def _response(content: str):
+    return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+
+
+def _fake_model(monkeypatch, batch_reply: dict):
+    calls = []
+
+    async def fake_completion(client, **kwargs):
+        prompt = kwargs["messages"][-1]["content"]
+        calls.append(prompt)
+        if "COURSE ID:" in prompt:
+            return _response(json.dumps({"summaries": batch_reply}))
+        return _response(json.dumps({"summary": "Single summary for a retried course."}))
+
+    monkeypatch.setattr(learning_resources, "create_chat_completion", fake_completion)
+    return calls
+
+
+def test_batch_is_one_call(monkeypatch):
+    calls = _fake_model(monkeypatch, {"a": "Summary of course a.", "b": "Summary of course b."})
+    result = asyncio.run(condense_descriptions({"a": LONG, "b": LONG}))
+    assert result == {"a": ("Summary of course a.", True), "b": ("Summary of course b.", True)}
+    assert len(calls) == 1
+
+
+def test_missing_ids_are_retried_singly_and_short_texts_skipped(monkeypatch):
+    calls = _fake_model(monkeypatch, {"a": "Summary of course a."})
+    result = asyncio.run(condense_descriptions({"a": LONG, "b": LONG, "c": "too short"}))
+    assert result == {
+        "a": ("Summary of course a.", True),
+        "b": ("Single summary for a retried course.", True),
+        "c": (NO_SUMMARY, False),
+    }
+    assert len(calls) == 2
+
+
+def test_batches_split_by_size():
+    items = {str(i): "x" for i in range(5)}
+    assert [list(b) for b in learning_resources._in_batches(items, 2)] == [["0", "1"], ["2", "3"], ["4"]]
+
+
+def test_malformed_summaries_are_served_but_not_cached(monkeypatch):
+    async def fake_completion(client, **kwargs):
+        return _response("Not JSON, just a long enough rambling answer from the model.")
+
+    stored = {}
+    monkeypatch.setattr(learning_resources, "create_chat_completion", fake_completion)
+    monkeypatch.setattr(learning_resources, "get_cached_summaries", lambda keys, db: {})
+    monkeypatch.setattr(learning_resources, "store_summaries", lambda fresh, db: stored.update(fresh))
+
+    courses = [{"id": "a", "description": LONG}, {"id": "b", "description": "short"}]
+    summaries = asyncio.run(learning_resources.summarize_courses(courses, db=None))
+
+    assert summaries == {"a": "Not JSON, just a long enough rambling answer from the model.", "b": NO_SUMMARY}
+    assert stored == {}
@@ -0,0 +1,51 @@
+import threading
+
+import pytest
+import spacy
+
+from server.services import nlp
+
+
+@spacy.Language.component("test_passthrough")
+def _passthrough(doc):
+    return doc
+
+
+@pytest.fixture
+def blank_pipeline(monkeypatch):
+    """A blank English pipeline with stand-in parser and ner components."""
+    loads = []
+
+    def fake_load(name, exclude=()):
+        loads.append((name, tuple(exclude)))
+        pipeline = spacy.blank("en")
+        pipeline.add_pipe("test_passthrough", name="parser")
+        pipeline.add_pipe("test_passthrough", name="ner")
+        return pipeline
+
+    monkeypatch.setattr(nlp.spacy, "load", fake_load)
+    monkeypatch.setattr(nlp, "_nlp", None)
+    return loads
+
+
+def test_pipeline_loads_once_across_threads(blank_pipeline):
+    threads = [threading.Thread(target=nlp.get_nlp) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert blank_pipeline == [(nlp.SPACY_MODEL, ("lemmatizer",))]
+
+
+def test_tasks_disable_only_present_components(blank_pipeline):
+    pipeline = nlp.get_nlp()
+    assert nlp._disabled(pipeline, "pos") == ["parser", "ner"]
+    assert nlp._disabled(pipeline, "skills") == ["parser"]
+    assert nlp._disabled(pipeline, "keywords") == []
+    with pytest.raises(ValueError):
+        nlp._disabled(pipeline, "summaries")
+
+
+def test_parse_many_keeps_order_and_context(blank_pipeline):
+    docs = nlp.parse_many([("first text", 1), ("second", 2)], task="pos", as_tuples=True)
+    assert [(doc.text, context) for doc, context in docs] == [("first text", 1), ("second", 2)]
@@ -0,0 +1,54 @@
+import asyncio
+from types import SimpleNamespace
+
+from server.services import openai_client
+
+
+class FakeCompletions:
+    def __init__(self):
+        self.running = 0
+        self.peak = 0
+
+    async def create(self, stream=False, **kwargs):
+        if stream:
+            return self._stream(kwargs["chunks"])
+        self.running += 1
+        self.peak = max(self.peak, self.running)
+        await asyncio.sleep(0.01)
+        self.running -= 1
+        return "done"
+
+    async def _stream(self, chunks):
+        for content in chunks:
+            yield SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=content))])
+
+
+def _client():
+    return SimpleNamespace(chat=SimpleNamespace(completions=FakeCompletions()))
+
+
+def test_one_client_per_key_on_the_shared_pool():
+    first = openai_client.get_async_client("key-a")
+    assert openai_client.get_async_client("key-a") is first
+    assert openai_client.get_async_client("key-b") is not first
+    assert first._client is openai_client._http_client
+
+
+def test_calls_in_flight_are_capped(monkeypatch):
+    client = _client()
+
+    async def scenario():
+        monkeypatch.setattr(openai_client, "_semaphore", asyncio.Semaphore(2))
+        await asyncio.gather(*(openai_client.create_chat_completion(client, model="m") for _ in range(6)))
+
+    asyncio.run(scenario())
+    assert client.chat.completions.peak == 2
+
+
+def test_stream_yields_non_empty_deltas():
+    client = _client()
+
+    async def scenario():
+        return [d async for d in openai_client.stream_chat_completion(client, chunks=["a", None, "", "b"])]
+
+    assert asyncio.run(scenario()) == ["a", "b"]
@@ -0,0 +1,53 @@
+import uuid
+from datetime import datetime, timezone
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.dialects import postgresql
+
+from server.models.search_term import SearchTerm
+from server.utils.pagination import (
+    after_cursor,
+    decode_cursor,
+    decode_key_cursor,
+    encode_cursor,
+    encode_key_cursor,
+)
+
+
+def _sql(clause) -> str:
+    return str(clause.compile(dialect=postgresql.dialect()))
+
+
+def test_cursor_round_trip():
+    created_at = datetime(2026, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+    row_id = uuid.uuid4()
+    assert decode_cursor(encode_cursor(created_at, row_id)) == (created_at, row_id)
+
+
+def test_cursor_round_trip_with_null_created_at():
+    row_id = uuid.uuid4()
+    assert decode_cursor(encode_cursor(None, row_id)) == (None, row_id)
+
+
+@pytest.mark.parametrize("cursor", ["not base64!", encode_key_cursor(5), encode_cursor(None, "not-a-uuid")])
+def test_invalid_cursor_is_a_400(cursor):
+    with pytest.raises(HTTPException) as exc:
+        decode_cursor(cursor)
+    assert exc.value.status_code == 400
+
+
+def test_after_dated_cursor_includes_undated_rows():
+    sql = _sql(after_cursor(SearchTerm.createdAt, SearchTerm.id, datetime.now(timezone.utc), uuid.uuid4()))
+    assert '("SearchTerms"."createdAt", "SearchTerms".id) <' in sql
+    assert '"SearchTerms"."createdAt" IS NULL' in sql
+
+
+def test_after_undated_cursor_stays_in_undated_rows():
+    sql = _sql(after_cursor(SearchTerm.createdAt, SearchTerm.id, None, uuid.uuid4()))
+    assert sql.startswith('"SearchTerms"."createdAt" IS NULL AND "SearchTerms".id <')
+
+
+@pytest.mark.parametrize("value", [42, uuid.uuid4(), "abc"])
+def test_key_cursor_round_trip(value):
+    assert decode_key_cursor(encode_key_cursor(value)) == value
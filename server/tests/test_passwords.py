@@ -0,0 +1,42 @@
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+
+from server.utils import passwords
+
+
+@pytest.fixture
+def fast_pool(monkeypatch):
+    monkeypatch.setattr(passwords, "BCRYPT_ROUNDS", 4)
+    yield
+    passwords.shutdown_password_pool()
+
+
+def test_hash_and_verify_in_worker_processes(fast_pool):
+    async def scenario():
+        password_hash = await passwords.hash_password("s3cret")
+        return (
+            await passwords.verify_password("s3cret", password_hash),
+            await passwords.verify_password("wrong", password_hash),
+        )
+
+    assert asyncio.run(scenario()) == ((True, False), (False, False))
+    assert passwords._executor._mp_context.get_start_method() == passwords._START_METHOD
+
+
+def test_outdated_cost_needs_rehash(fast_pool, monkeypatch):
+    async def scenario():
+        password_hash = await passwords.hash_password("s3cret")
+        monkeypatch.setattr(passwords, "BCRYPT_ROUNDS", 5)
+        return await passwords.verify_password("s3cret", password_hash)
+
+    assert asyncio.run(scenario()) == (True, True)
+
+
+def test_saturated_pool_is_a_503(monkeypatch):
+    monkeypatch.setattr(passwords, "_pending", passwords.PASSWORD_HASH_QUEUE_LIMIT)
+    with pytest.raises(HTTPException) as exc:
+        asyncio.run(passwords.hash_password("s3cret"))
+    assert exc.value.status_code == 503
+    assert exc.value.headers["Retry-After"] == str(passwords.PASSWORD_HASH_RETRY_AFTER)
@@ -0,0 +1,101 @@
+import sys
+from datetime import datetime, timezone
+
+from scripts import populate_roles_and_skills as populate
+
+T0 = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+class FakeCursor:
+    def __init__(self, rows):
+        self.rows = rows
+        self.executed = []
+        self.closed = False
+
+    def execute(self, sql, params=None):
+        self.executed.append((" ".join(sql.split()), params))
+
+    def __iter__(self):
+        return iter(self.rows)
+
+    def close(self):
+        self.closed = True
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class FakeConn:
+    def __init__(self, rows=()):
+        self.cur = FakeCursor(list(rows))
+        self.names = []
+
+    def cursor(self, name=None):
+        self.names.append(name)
+        return self.cur
+
+    def close(self):
+        pass
+
+
+def test_stream_jobs_resumes_after_watermark_on_native_keys():
+    conn = FakeConn([("Dev", "python sql", T0, "7")])
+    pairs = list(populate.stream_jobs(conn, (T0, "6")))
+
+    assert pairs == [("python sql", ("Dev", T0, "7"))]
+    assert conn.names == ["populate_roles_jobs"] and conn.cur.closed
+    sql, params = conn.cur.executed[0]
+    assert '"createdAt" IS NOT NULL' in sql
+    assert '("createdAt", "id") > (%s, %s)' in sql and sql.endswith('ORDER BY "createdAt", "id"')
+    assert params == (T0, "6")
+
+
+def test_stream_jobs_without_watermark_reads_everything_dated():
+    conn = FakeConn()
+    list(populate.stream_jobs(conn, None))
+    sql, params = conn.cur.executed[0]
+    assert '"createdAt" IS NOT NULL' in sql and ">" not in sql and params is None
+
+
+def _run(monkeypatch, jobs, argv=()):
+    calls = []
+    monkeypatch.setattr(sys, "argv", ["populate_roles_and_skills.py", *argv])
+    monkeypatch.setattr(populate.psycopg2, "connect", lambda url: FakeConn())
+    monkeypatch.setattr(populate, "CHUNK_SIZE", 2)
+    monkeypatch.setattr(populate, "load_watermark", lambda cur: None)
+    monkeypatch.setattr(populate, "stream_jobs", lambda conn, watermark: iter(jobs))
+    monkeypatch.setattr(populate, "parse_many", lambda pairs, **kwargs: pairs)
+    monkeypatch.setattr(populate, "extract_skills", lambda doc: set(doc.split()))
+    monkeypatch.setattr(populate, "reset", lambda conn: calls.append(("reset",)))
+    monkeypatch.setattr(populate, "save_chunk", lambda conn, counts, jobs, last: calls.append(
+        ("save", {t: dict(c) for t, c in counts.items()}, dict(jobs), last)
+    ))
+    monkeypatch.setattr(populate, "drop_unseen_roles", lambda conn: calls.append(("drop",)) or 0)
+    monkeypatch.setattr(populate, "reweight_roles", lambda conn: calls.append(("reweight",)) or 0)
+    populate.main()
+    return calls
+
+
+def test_main_commits_each_chunk_with_its_last_job(monkeypatch):
+    jobs = [
+        ("python sql", ("Dev", T0, "1")),
+        ("python", ("Dev", T0, "2")),
+        ("excel", (None, T0, "3")),
+    ]
+    calls = _run(monkeypatch, jobs)
+
+    assert calls == [
+        ("save", {"Dev": {"python": 2, "sql": 1}}, {"Dev": 2}, (T0, "2")),
+        # Untitled jobs still move the watermark
+        ("save", {}, {}, (T0, "3")),
+        ("drop",),
+        ("reweight",),
+    ]
+
+
+def test_main_full_resets_and_completed_runs_always_drop_stale_roles(monkeypatch):
+    assert _run(monkeypatch, [], ["--full"]) == [("reset",), ("drop",), ("reweight",)]
+    assert _run(monkeypatch, []) == [("drop",), ("reweight",)]
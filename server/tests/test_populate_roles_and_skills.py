@@ -0,0 +1,47 @@
+import math
+
+import numpy as np
+import pytest
+
+from scripts.populate_roles_and_skills import tfidf_profiles
+
+
+def _expected(role_jobs, triples, role):
+    total = sum(role_jobs)
+    df = {}
+    for _, skill, n in triples:
+        df[skill] = df.get(skill, 0) + n
+    raw = {
+        skill: n / role_jobs[r] * (1 + math.log((1 + total) / (1 + df[skill])))
+        for r, skill, n in triples if r == role
+    }
+    norm = math.sqrt(sum(w * w for w in raw.values()))
+    return {skill: w / norm for skill, w in raw.items()}
+
+
+def test_tfidf_weights_and_order():
+    role_jobs = [4, 2]
+    # skills: 0 = git, 1 = python, 2 = sql
+    triples = [(0, 1, 4), (0, 2, 3), (1, 1, 1), (1, 0, 2)]
+    arr = np.array(triples)
+    skills, weights, bounds = tfidf_profiles(np.array(role_jobs, dtype=float), arr[:, 0], arr[:, 1], arr[:, 2])
+
+    for role in (0, 1):
+        got = dict(zip(skills[bounds[role]:bounds[role + 1]].tolist(), weights[bounds[role]:bounds[role + 1]]))
+        assert got == pytest.approx(_expected(role_jobs, triples, role))
+        # Heaviest first, unit length
+        assert list(weights[bounds[role]:bounds[role + 1]]) == sorted(got.values(), reverse=True)
+        assert np.linalg.norm(weights[bounds[role]:bounds[role + 1]]) == pytest.approx(1.0)
+
+
+def test_keeps_top_skills_per_role_and_skips_empty_roles():
+    role_jobs = np.array([10.0, 3.0, 1.0])
+    role_idx = np.array([0, 0, 0, 2])
+    skill_idx = np.array([0, 1, 2, 1])
+    counts = np.array([9, 5, 1, 1])
+    skills, weights, bounds = tfidf_profiles(role_jobs, role_idx, skill_idx, counts, max_skills=2)
+
+    assert skills[bounds[0]:bounds[1]].tolist() == [0, 1]
+    assert bounds[2] - bounds[1] == 0
+    assert skills[bounds[2]:bounds[3]].tolist() == [1]
+    assert weights[bounds[2]] == pytest.approx(1.0)
@@ -0,0 +1,63 @@
+import asyncio
+
+from server.services import question_pools
+from server.services.question_pools import QuestionPools, normalize_title
+
+
+def _counting_generator():
+    calls = []
+
+    async def generate(title):
+        calls.append(title)
+        return [f"{title} question {len(calls)}"]
+
+    return generate, calls
+
+
+async def _settle(pools):
+    while pools._tasks:
+        await asyncio.gather(*pools._tasks)
+
+
+def test_normalize_title():
+    assert normalize_title("  Senior  C++ / C# Dev!! ") == "senior c++ / c# dev"
+
+
+def test_one_off_title_costs_one_generation():
+    generate, calls = _counting_generator()
+
+    async def scenario():
+        pools = QuestionPools(generate)
+        await pools.get("Data Engineer")
+        await _settle(pools)
+
+    asyncio.run(scenario())
+    assert calls == ["Data Engineer"]
+
+
+def test_repeated_title_is_prefilled_and_served_from_pool():
+    generate, calls = _counting_generator()
+
+    async def scenario():
+        pools = QuestionPools(generate)
+        first = await pools.get("Data Engineer")
+        second = await pools.get("data engineer")
+        await _settle(pools)
+        return first, second
+
+    first, second = asyncio.run(scenario())
+    assert second == first
+    assert len(calls) == question_pools.QUESTION_POOL_TARGET
+
+
+def test_sets_retire_after_max_serves(monkeypatch):
+    monkeypatch.setattr(question_pools, "QUESTION_SET_MAX_SERVES", 2)
+    monkeypatch.setattr(question_pools, "QUESTION_POOL_WARM_REQUESTS", 100)
+    generate, _ = _counting_generator()
+
+    async def scenario():
+        pools = QuestionPools(generate)
+        pools.add("QA", ["q"])
+        return pools.take("QA"), pools.take("QA")
+
+    assert asyncio.run(scenario()) == (["q"], None)
@@ -0,0 +1,60 @@
+import uuid
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import pytest
+
+from server.services import resume_skills
+from server.utils.cache import content_hash
+
+UPDATED = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def _resume(content="## Skills\nPython, SQL"):
+    return SimpleNamespace(id=uuid.uuid4(), content=content, updated_at=UPDATED)
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    state = {"rows": {}, "saved": [], "extracted": 0}
+
+    def fake_extract(content):
+        state["extracted"] += 1
+        return ["Python", "SQL"]
+
+    monkeypatch.setattr(resume_skills, "_load_rows", lambda resumes, db: state["rows"])
+    monkeypatch.setattr(resume_skills, "_save", lambda entries: state["saved"].extend(entries))
+    monkeypatch.setattr(resume_skills, "extract_skills_from_resume", fake_extract)
+    return state
+
+
+def _row(resume, **overrides):
+    row = {
+        "resume_updated_at": resume.updated_at,
+        "content_hash": content_hash(resume.content),
+        "skills": ["Cached"],
+        "keywords": None,
+    }
+    row.update(overrides)
+    return row
+
+
+def test_current_row_is_reused(cache):
+    resume = _resume()
+    cache["rows"][resume.id] = _row(resume)
+    assert resume_skills.get_resume_skills(resume, db=None) == ["Cached"]
+    assert cache["extracted"] == 0 and cache["saved"] == []
+
+
+def test_touched_but_unchanged_resume_is_still_current(cache):
+    resume = _resume()
+    cache["rows"][resume.id] = _row(resume, resume_updated_at=datetime(2020, 1, 1, tzinfo=timezone.utc))
+    assert resume_skills.get_resume_skills(resume, db=None) == ["Cached"]
+
+
+def test_edited_resume_is_extracted_and_saved(cache):
+    resume = _resume()
+    cache["rows"][resume.id] = _row(resume, resume_updated_at=None, content_hash="stale")
+    assert resume_skills.get_resume_skills(resume, db=None) == ["Python", "SQL"]
+    assert cache["saved"][0]["contentHash"] == content_hash(resume.content)
+    assert cache["saved"][0]["keywords"] is None
@@ -0,0 +1,162 @@
+import importlib
+import threading
+
+import pytest
+
+from server.services import role_matching
+from server.services.role_matching import RoleIndex
+
+
+class _Result:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def one(self):
+        return self.rows[0]
+
+    def fetchall(self):
+        return self.rows
+
+
+class _Row:
+    def __init__(self, roletitle, requiredskills, skillweights=None):
+        self.roletitle = roletitle
+        self.requiredskills = requiredskills
+        self.skillweights = skillweights
+
+
+class FakeDB:
+    def __init__(self, rows, fingerprint=(1, 1)):
+        self.rows = rows
+        self.fingerprint = fingerprint
+        self.queries = 0
+
+    def execute(self, stmt):
+        self.queries += 1
+        if "count(*)" in str(stmt):
+            return _Result([self.fingerprint])
+        return _Result(self.rows)
+
+
+@pytest.fixture(autouse=True)
+def fresh_index(monkeypatch):
+    monkeypatch.setattr(role_matching, "_index", None)
+    monkeypatch.setattr(role_matching, "_fingerprint", None)
+    monkeypatch.setattr(role_matching, "_checked_at", 0.0)
+    monkeypatch.setattr(role_matching, "_lock", threading.Lock())
+
+
+def test_coverage_pads_in_table_order():
+    index = RoleIndex([("Data", ["sql", "python"]), ("Dev", ["python", "git", "docker"]), ("PM", [])])
+    assert index.top_by_coverage(["python", "sql"], 3) == ["Data", "Dev", "PM"]
+    assert index.top_by_coverage(["rust"], 2) == ["Data", "Dev"]
+
+
+def test_cold_lookup_builds_and_releases_lock():
+    db = FakeDB([_Row("Data", ["sql"])])
+    index = role_matching.get_role_index(db)
+    assert index.titles == ["Data"]
+    assert not role_matching._lock.locked()
+
+
+def test_stale_index_served_while_another_request_checks():
+    db = FakeDB([_Row("Data", ["sql"])])
+    index = role_matching.get_role_index(db)
+    role_matching._checked_at = 0.0
+
+    role_matching._lock.acquire()
+    try:
+        assert role_matching.get_role_index(db) is index
+        # The held lock belongs to the other request and must stay held
+        assert role_matching._lock.locked()
+    finally:
+        role_matching._lock.release()
+
+
+def test_unchanged_fingerprint_keeps_index():
+    db = FakeDB([_Row("Data", ["sql"])])
+    index = role_matching.get_role_index(db)
+    role_matching._checked_at = 0.0
+    assert role_matching.get_role_index(db) is index
+    assert db.queries == 3
+
+
+def test_cosine_uses_weights_and_pads():
+    index = RoleIndex([
+        ("Data", ["sql", "python"], [0.8, 0.6]),
+        ("Dev", ["python", "git"], None),
+        ("PM", [], None),
+    ])
+    ranked = index.top_by_cosine(["python", "git"], 3)
+    assert [title for title, _ in ranked] == ["Dev", "Data", "PM"]
+    assert ranked[0][1] == pytest.approx(1.0)
+    assert ranked[1][1] == pytest.approx(round(0.6 / 2 ** 0.5, 4))
+    assert ranked[2][1] == 0.0
+
+
+def test_cosine_with_unknown_skills_is_table_order():
+    index = RoleIndex([("Data", ["sql"], [1.0]), ("Dev", ["git"], [1.0])])
+    assert index.top_by_cosine(["rust"], 2) == [("Data", 0.0), ("Dev", 0.0)]
+
+
+def test_top_matching_roles_dispatches_on_scoring(monkeypatch):
+    db = FakeDB([_Row("Data", ["sql", "python"], [0.8, 0.6]), _Row("Dev", ["python"], [1.0])])
+    monkeypatch.setattr(role_matching, "ROLE_MATCH_SCORING", "cosine")
+    assert role_matching.top_matching_roles(["python"], db, k=1) == ["Dev"]
+    monkeypatch.setattr(role_matching, "ROLE_MATCH_SCORING", "coverage")
+    monkeypatch.setattr(role_matching, "ROLE_MATCH_MODE", "index")
+    assert role_matching.top_matching_roles(["python"], db, k=2) == ["Dev", "Data"]
+
+
+@pytest.fixture
+def reload_with_env(monkeypatch):
+    def reload(**env):
+        for name, value in env.items():
+            if value is None:
+                monkeypatch.delenv(name, raising=False)
+            else:
+                monkeypatch.setenv(name, value)
+        return importlib.reload(role_matching)
+
+    yield reload
+    monkeypatch.undo()
+    importlib.reload(role_matching)
+
+
+def test_coverage_is_the_default_scoring(reload_with_env):
+    module = reload_with_env(ROLE_MATCH_MODE="db", ROLE_MATCH_SCORING=None)
+    assert (module.ROLE_MATCH_MODE, module.ROLE_MATCH_SCORING) == ("db", "coverage")
+
+
+def test_cosine_scoring_is_rejected_in_db_mode(reload_with_env):
+    with pytest.raises(RuntimeError, match="ROLE_MATCH_MODE=index"):
+        reload_with_env(ROLE_MATCH_MODE="db", ROLE_MATCH_SCORING="cosine")
+    module = reload_with_env(ROLE_MATCH_MODE="index", ROLE_MATCH_SCORING="cosine")
+    assert module.ROLE_MATCH_SCORING == "cosine"
+
+
+class _RecordingDB:
+    def __init__(self, rows):
+        self.rows = rows
+        self.calls = []
+
+    def execute(self, stmt, params):
+        self.calls.append((str(stmt), params))
+        return _Result(self.rows)
+
+
+def test_db_mode_queries_distinct_sorted_skills(monkeypatch):
+    monkeypatch.setattr(role_matching, "ROLE_MATCH_MODE", "db")
+    db = _RecordingDB([type("Row", (), {"roletitle": "Data", "overlap": 2})()])
+    assert role_matching.top_roles_by_overlap(["sql", "python", "sql"], db, k=3) == [("Data", 2)]
+    sql, params = db.calls[0]
+    assert "r.requiredskills && CAST(:skills AS text[])" in sql
+    assert "m.overlap DESC" in sql
+    assert params == {"skills": ["python", "sql"], "limit": 3}
+
+
+def test_db_mode_without_skills_skips_the_query(monkeypatch):
+    monkeypatch.setattr(role_matching, "ROLE_MATCH_MODE", "db")
+    db = _RecordingDB([])
+    assert role_matching.top_roles_by_coverage([], db) == []
+    assert db.calls == []
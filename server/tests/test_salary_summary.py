@@ -0,0 +1,46 @@
+from server.tests.analytics_fakes import FakeAsyncDB, analytics_client
+
+
+def _summary_row(**overrides):
+    row = {
+        "total": 3, "average": 123456.789,
+        "location_names": ["Austin, Tx", "Remote"], "location_counts": [2, 1],
+        "title_names": ["Data Engineer"], "title_counts": [3],
+    }
+    row.update(overrides)
+    return row
+
+
+def test_summary_is_shaped_from_one_aggregate_row():
+    db = FakeAsyncDB([_summary_row()])
+    body = analytics_client(db).get("/salary-summary").json()
+    assert body == {
+        "average_salary": 123456.79,
+        "top_locations": {"Austin, Tx": 2, "Remote": 1},
+        "common_titles": {"Data Engineer": 3},
+        "salary_stats": None,
+    }
+    assert len(db.calls) == 1
+
+
+def test_unpriced_favorites_average_zero():
+    db = FakeAsyncDB([_summary_row(average=None, location_names=None, location_counts=None)])
+    body = analytics_client(db).get("/salary-summary").json()
+    assert body["average_salary"] == 0.0 and body["top_locations"] == {}
+
+
+def test_no_favorites_is_a_404():
+    assert analytics_client(FakeAsyncDB([_summary_row(total=0)])).get("/salary-summary").status_code == 404
+
+
+def test_stats_describe_the_midpoints():
+    db = FakeAsyncDB([_summary_row()], [100.0, 200.0, 300.0])
+    stats = analytics_client(db).get("/salary-summary", params={"include_stats": True}).json()["salary_stats"]
+    assert stats == {"count": 3.0, "mean": 200.0, "std": 100.0, "min": 100.0,
+                     "25%": 150.0, "50%": 200.0, "75%": 250.0, "max": 300.0}
+
+
+def test_single_midpoint_drops_undefined_std():
+    db = FakeAsyncDB([_summary_row()], [100.0])
+    stats = analytics_client(db).get("/salary-summary", params={"include_stats": True}).json()["salary_stats"]
+    assert "std" not in stats and stats["50%"] == 100.0
@@ -0,0 +1,106 @@
+import asyncio
+import threading
+import uuid
+from datetime import datetime, timezone
+
+import pytest
+
+from server.services import search_log as search_log_module
+from server.services.search_log import SearchLogBuffer
+
+
+def _row(query="python"):
+    now = datetime.now(timezone.utc)
+    return {
+        "id": uuid.uuid4(), "userId": uuid.uuid4(), "title": query, "location": None,
+        "query": query, "createdAt": now, "updatedAt": now,
+    }
+
+
+@pytest.fixture
+def writes(monkeypatch):
+    """Captures inserted batches and keyword updates instead of touching Postgres."""
+    calls = {"inserted": [], "recorded": [], "release": threading.Event()}
+    calls["release"].set()
+
+    async def fake_insert(self, batch):
+        await asyncio.sleep(0)
+        calls["inserted"].append(batch)
+        return batch
+
+    def fake_record(rows):
+        calls["release"].wait(timeout=5)
+        calls["recorded"].append(rows)
+
+    monkeypatch.setattr(SearchLogBuffer, "_insert", fake_insert)
+    monkeypatch.setattr(search_log_module, "_record_keywords", fake_record)
+    return calls
+
+
+def test_close_writes_pending_rows_and_waits_for_keywords(writes, monkeypatch):
+    monkeypatch.setattr(search_log_module, "SEARCH_LOG_FLUSH_SECONDS", 60)
+
+    async def scenario():
+        buffer = SearchLogBuffer()
+        rows = [_row(), _row()]
+        for row in rows:
+            buffer.add(row)
+        await buffer.close()
+        return rows
+
+    rows = asyncio.run(scenario())
+    assert writes["inserted"] == [rows]
+    assert writes["recorded"] == [rows]
+
+
+def test_batch_size_triggers_flush(writes, monkeypatch):
+    monkeypatch.setattr(search_log_module, "SEARCH_LOG_BATCH_SIZE", 2)
+    monkeypatch.setattr(search_log_module, "SEARCH_LOG_FLUSH_SECONDS", 60)
+
+    async def scenario():
+        buffer = SearchLogBuffer()
+        buffer.add(_row())
+        buffer.add(_row())
+        for _ in range(5):
+            await asyncio.sleep(0)
+        flushed = len(writes["inserted"])
+        await buffer.close()
+        return flushed
+
+    assert asyncio.run(scenario()) == 1
+
+
+def test_flush_does_not_wait_for_keyword_extraction(writes, monkeypatch):
+    monkeypatch.setattr(search_log_module, "SEARCH_LOG_FLUSH_SECONDS", 60)
+    writes["release"].clear()
+
+    async def scenario():
+        buffer = SearchLogBuffer()
+        buffer.add(_row("first"))
+        await buffer.flush()
+        # Keyword extraction for the first batch is still blocked here
+        buffer.add(_row("second"))
+        await asyncio.wait_for(buffer.flush(), timeout=1)
+        inserted = len(writes["inserted"])
+        writes["release"].set()
+        await buffer.close()
+        return inserted
+
+    assert asyncio.run(scenario()) == 2
+    assert len(writes["recorded"]) == 2
+
+
+def test_timer_flush_survives_close(writes, monkeypatch):
+    monkeypatch.setattr(search_log_module, "SEARCH_LOG_FLUSH_SECONDS", 0)
+
+    async def scenario():
+        buffer = SearchLogBuffer()
+        row = _row()
+        buffer.add(row)
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        await buffer.close()
+        return row
+
+    row = asyncio.run(scenario())
+    assert [r for batch in writes["inserted"] for r in batch] == [row]
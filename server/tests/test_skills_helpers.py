@@ -0,0 +1,47 @@
+import pytest
+import spacy
+
+from server.helpers import skills
+from server.services import nlp
+
+
+@pytest.fixture
+def blank_matchers(monkeypatch):
+    """Matchers compiled over a blank English tokenizer, so no model is needed."""
+    monkeypatch.setattr(nlp, "_nlp", spacy.blank("en"))
+    monkeypatch.setattr(skills, "_matchers", None)
+    return nlp.get_nlp()
+
+
+def test_longest_taxonomy_match_wins(blank_matchers):
+    doc = blank_matchers("Built pipelines in Apache Spark and React Native apps with Python")
+    found = set()
+    skill_matcher, _ = skills._get_matchers()
+    skills._extract_taxonomy_skills(doc, skill_matcher, found)
+    assert found == {"Apache Spark", "React Native", "Python"}
+
+
+def test_stop_matcher_skips_entries_that_tokenize_differently(blank_matchers):
+    _, stop_matcher = skills._get_matchers()
+    doc = blank_matchers("typescript engineer in san francisco")
+    stopped = {doc[start:end].text for _, start, end in stop_matcher(doc)}
+    assert stopped == {"engineer", "san francisco"}
+
+
+@pytest.mark.parametrize("words, expected", [
+    (["Senior", "Data"], True),
+    (["Bay", "San", "Francisco"], True),
+    (["San", "Diego", "Zoo"], True),
+    (["Data", "Pipelines"], False),
+])
+def test_stop_phrases_match_whole_ngrams(words, expected):
+    assert skills._has_stop_phrase(words) is expected
+
+
+def test_dedupe_collapses_case_variants():
+    assert skills._dedupe_and_titlecase({"python", "Python", "PYTHON", "apache spark"}) == {"Python", "Apache Spark"}
+
+
+def test_skills_section_extraction():
+    markdown = "# Jane\n## Skills\nPython, SQL\n## Experience\nAcme"
+    assert skills.extract_skills_section(markdown) == "Python, SQL"
@@ -1,3 +1,4 @@
+from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 import jwt
 import uuid
@@ -5,9 +6,12 @@ import os
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
-from sqlalchemy.orm import Session
-from server.database import get_db
+from sqlalchemy import event, inspect, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import make_transient_to_detached
+from server.database import get_async_db
 from server.models.user import User
+from server.utils.cache import TTLCache
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -19,6 +23,13 @@ if not SECRET_KEY:
 ALGORITHM = "HS256"
 EXPIRATION_MINUTES = 90
 
+# Authenticated users cached per process. Updates made through this process
+# invalidate immediately; the TTL bounds staleness for writes from elsewhere.
+USER_CACHE_TTL = float(os.getenv("USER_CACHE_TTL", "60"))
+USER_CACHE_SIZE = int(os.getenv("USER_CACHE_SIZE", "10000"))
+
+_user_cache = TTLCache(maxsize=USER_CACHE_SIZE, ttl=USER_CACHE_TTL)
+
 def create_jwt_token(user: User) -> str:
     expire = datetime.now(timezone.utc) + timedelta(minutes=EXPIRATION_MINUTES)
     payload = {
@@ -35,31 +46,92 @@ def create_jwt_token(user: User) -> str:
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/login")
 
-def get_current_user(
-    token: str = Depends(oauth2_scheme),
-    db: Session = Depends(get_db)
-):
-    credentials_exception = HTTPException(
+@dataclass(frozen=True)
+class TokenUser:
+    """Identity taken from verified token claims, without a database lookup."""
+    id: uuid.UUID
+    email: str
+    role: str
+
+
+def _credentials_exception() -> HTTPException:
+    return HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Invalid authentication credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
 
+
+def _decode_token(token: str) -> dict:
     try:
         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM], audience="pydatapro_user", issuer="PyDataPro")
 
         user_id = payload.get("sub") or payload.get("id")
         if user_id is None:
-            raise credentials_exception
+            raise _credentials_exception()
 
-        user_uuid = uuid.UUID(user_id)
+        payload["uuid"] = uuid.UUID(user_id)
 
     except (jwt.PyJWTError, ValueError):
-        raise credentials_exception
+        raise _credentials_exception()
+
+    return payload
+
+
+async def get_current_user(
+    token: str = Depends(oauth2_scheme),
+    db: AsyncSession = Depends(get_async_db)
+):
+    user_uuid = _decode_token(token)["uuid"]
+
+    cached = _user_cache.get(user_uuid)
+    if cached is not None:
+        return _detached_user(cached)
 
-    user = db.query(User).filter(User.id == user_uuid).first()
+    result = await db.execute(select(User).where(User.id == user_uuid))
+    user = result.scalars().first()
     if user is None:
-        raise credentials_exception
+        raise _credentials_exception()
 
+    columns = _columns(user)
+    _user_cache.set(user_uuid, columns)
+    return _detached_user(columns)
+
+
+def get_token_user(token: str = Depends(oauth2_scheme)) -> TokenUser:
+    """
+    For read-only routes that only scope queries by user: trusts the signed
+    claims and skips the user lookup entirely. A user deleted after the token
+    was issued keeps read access until it expires.
+    """
+    payload = _decode_token(token)
+    return TokenUser(id=payload["uuid"], email=payload.get("email", ""), role=payload.get("role", "user"))
+
+
+def invalidate_user(user_id) -> None:
+    _user_cache.pop(user_id if isinstance(user_id, uuid.UUID) else uuid.UUID(str(user_id)))
+
+
+# Never copied into the cache or the returned user; login reads the hash itself
+_PRIVATE_COLUMNS = {"passwordHash"}
+
+
+def _columns(user: User) -> dict:
+    return {
+        attr.key: getattr(user, attr.key)
+        for attr in inspect(User).column_attrs
+        if attr.key not in _PRIVATE_COLUMNS
+    }
+
+
+def _detached_user(columns: dict) -> User:
+    # A fresh detached copy per request, so routes never share one instance
+    user = User(**columns)
+    make_transient_to_detached(user)
     return user
 
+
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def _on_user_change(mapper, connection, target: User) -> None:
+    invalidate_user(target.id)
@@ -0,0 +1,74 @@
+import base64
+import json
+import uuid
+from datetime import datetime
+from typing import Optional
+
+from fastapi import HTTPException
+from sqlalchemy import Select, or_, and_, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+def encode_cursor(created_at: Optional[datetime], row_id) -> str:
+    """A NULL created_at is encoded as an empty timestamp."""
+    raw = f"{created_at.isoformat() if created_at is not None else ''}|{row_id}"
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii")
+
+
+def decode_cursor(cursor: str) -> tuple[Optional[datetime], uuid.UUID]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode("ascii")).decode("utf-8")
+        created_at, row_id = raw.split("|", 1)
+        return (datetime.fromisoformat(created_at) if created_at else None), uuid.UUID(row_id)
+    except (ValueError, UnicodeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def encode_key_cursor(value) -> str:
+    """Opaque cursor for a single-column key, keeping int keys as ints."""
+    raw = json.dumps(value if isinstance(value, int) else str(value))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii")
+
+
+def decode_key_cursor(cursor: str):
+    try:
+        value = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")).decode("utf-8"))
+    except (ValueError, UnicodeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    if isinstance(value, str):
+        try:
+            return uuid.UUID(value)
+        except ValueError:
+            return value
+    if isinstance(value, int):
+        return value
+    raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+async def keyset_page(db: AsyncSession, stmt: Select, created_col, id_col, cursor: Optional[str], limit: int):
+    """
+    Newest-first page of `stmt` ordered by (created_col, id_col), with rows whose
+    created_col is NULL last. Returns the rows and the cursor for the next page,
+    or None when there are no more rows.
+    """
+    if cursor:
+        stmt = stmt.where(after_cursor(created_col, id_col, *decode_cursor(cursor)))
+
+    result = await db.execute(
+        stmt.order_by(created_col.desc().nulls_last(), id_col.desc()).limit(limit + 1)
+    )
+    rows = result.all()
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        next_cursor = encode_cursor(getattr(last, created_col.key), getattr(last, id_col.key))
+    return rows, next_cursor
+
+
+def after_cursor(created_col, id_col, created_at: Optional[datetime], row_id):
+    """Rows after (created_at, row_id) in keyset_page order."""
+    if created_at is None:
+        return and_(created_col.is_(None), id_col < row_id)
+    return or_(tuple_(created_col, id_col) < tuple_(created_at, row_id), created_col.is_(None))
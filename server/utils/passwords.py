@@ -0,0 +1,73 @@
+import asyncio
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+
+from fastapi import HTTPException, status
+from passlib.hash import bcrypt
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# bcrypt cost for new hashes; stored hashes with a different cost are rehashed on login
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", "12"))
+# Worker processes dedicated to hashing, so logins never occupy the request threadpool
+PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", "2"))
+# Hash jobs running or queued per process before new ones are rejected with 503
+PASSWORD_HASH_QUEUE_LIMIT = int(os.getenv("PASSWORD_HASH_QUEUE_LIMIT", str(PASSWORD_HASH_WORKERS * 8)))
+PASSWORD_HASH_RETRY_AFTER = int(os.getenv("PASSWORD_HASH_RETRY_AFTER", "2"))
+
+_executor: Optional[ProcessPoolExecutor] = None
+_pending = 0
+
+# Forking a process that already runs threads (threadpool, DB pools, HTTP clients)
+# can leave children holding locks nobody will release, so workers start clean
+_START_METHOD = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+
+
+def _hash(password: str, rounds: int) -> str:
+    return bcrypt.using(rounds=rounds).hash(password)
+
+
+def _verify(password: str, password_hash: str, rounds: int) -> tuple[bool, bool]:
+    if not bcrypt.verify(password, password_hash):
+        return False, False
+    return True, bcrypt.using(rounds=rounds).needs_update(password_hash)
+
+
+async def _submit(fn, *args):
+    global _executor, _pending
+    if _pending >= PASSWORD_HASH_QUEUE_LIMIT:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Too many sign-in attempts right now, please retry shortly",
+            headers={"Retry-After": str(PASSWORD_HASH_RETRY_AFTER)},
+        )
+    if _executor is None:
+        _executor = ProcessPoolExecutor(
+            max_workers=PASSWORD_HASH_WORKERS,
+            mp_context=multiprocessing.get_context(_START_METHOD),
+        )
+
+    _pending += 1
+    try:
+        return await asyncio.get_running_loop().run_in_executor(_executor, fn, *args)
+    finally:
+        _pending -= 1
+
+
+async def hash_password(password: str) -> str:
+    return await _submit(_hash, password, BCRYPT_ROUNDS)
+
+
+async def verify_password(password: str, password_hash: str) -> tuple[bool, bool]:
+    """(matches, needs_rehash); raises 503 when the hashing pool is saturated."""
+    return await _submit(_verify, password, password_hash, BCRYPT_ROUNDS)
+
+
+def shutdown_password_pool() -> None:
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None